@@ -1,170 +1,110 @@
 import logging
 import re
 import json
+from collections import Counter
 from worlds.AutoWorld import World
 from BaseClasses import MultiWorld, ItemClassification
-from typing import Any
+from typing import Any, Optional
 
 
 class ValidationError(Exception):
     pass
 
+def tokenize_requires(requires) -> list[tuple[bool, str]]:
+    """The item names and categories a requires names, in order, as (is_category, name)"""
+    tokens = []
+    if isinstance(requires, str):
+        # parse user written statement into list of each item
+        for item in re.findall(r'\|[^|]+\|', requires):
+            item_name = item.replace("|", "").split(":")[0]
+            # a category, without its @
+            if '@' in item:
+                tokens.append((True, item_name[1:]))
+            else:
+                tokens.append((False, item_name))
+
+    else:  # item access is in dict form
+        for item in requires:
+            # if the require entry is an object with "or" or a list of items, treat it as a standalone require of its own
+            if (isinstance(item, dict) and "or" in item and isinstance(item["or"], list)) or (isinstance(item, list)):
+                or_items = item["or"] if isinstance(item, dict) else item
+                tokens.extend((False, or_item.split(":")[0]) for or_item in or_items)
+            else:
+                tokens.append((False, item.split(":")[0]))
+    return tokens
+
+class ValidationIndex:
+    """The name sets, name counts and tokenized requires the checks use, made in a single pass over the tables.
+    \nThe piped_names_to_* dicts map each part of a requires json between two | to the first location/region that has it,
+    so looking for '|item name|' in every requires is a single lookup."""
+    __slots__ = ("item_names", "item_name_counts", "location_name_counts",
+                 "location_requires_tokens", "region_requires_tokens", "location_requires_json", "region_requires_json",
+                 "piped_names_to_location", "piped_names_to_region")
+
+    def __init__(self, item_table: list[dict[str, Any]], location_table: list[dict[str, Any]], region_table: dict[str, Any]):
+        self.item_name_counts = Counter(item["name"] for item in item_table)
+        self.item_names = self.item_name_counts.keys()
+        self.location_name_counts = Counter(location["name"] for location in location_table)
+
+        self.location_requires_tokens: list[tuple[str, list[tuple[bool, str]]]] = []
+        self.location_requires_json: list[tuple[str, str]] = []
+        self.piped_names_to_location: dict[str, str] = {}
+        for location in location_table:
+            if "requires" in location:
+                self._add_requires(location["name"], location["requires"], self.location_requires_tokens,
+                                   self.location_requires_json, self.piped_names_to_location)
+
+        self.region_requires_tokens: list[tuple[str, list[tuple[bool, str]]]] = []
+        self.region_requires_json: list[tuple[str, str]] = []
+        self.piped_names_to_region: dict[str, str] = {}
+        for region_name, region in region_table.items():
+            if "requires" in region:
+                self._add_requires(region_name, region["requires"], self.region_requires_tokens,
+                                   self.region_requires_json, self.piped_names_to_region)
+
+    @staticmethod
+    def _add_requires(owner_name: str, requires, requires_tokens: list, requires_json: list, piped_names: dict[str, str]):
+        requires_tokens.append((owner_name, tokenize_requires(requires)))
+        dumped = json.dumps(requires)
+        requires_json.append((owner_name, dumped))
+        for part in dumped.split("|")[1:-1]:
+            piped_names.setdefault(part, owner_name)
+
 class DataValidation():
     game_table: dict[str, Any] = {}
     item_table: list[dict[str, Any]] = []
     location_table: list[dict[str, Any]] = []
     region_table: dict[str, Any] = {}
-
+    # set while runGenerationDataValidation runs so every check shares it
+    index: Optional[ValidationIndex] = None
 
     @staticmethod
-    def checkItemNamesInLocationRequires():
-        for location in DataValidation.location_table:
-            if "requires" not in location:
-                continue
-
-            if isinstance(location["requires"], str):
-                # parse user written statement into list of each item
-                for item in re.findall(r'\|[^|]+\|', location["requires"]):
-                    if item.lower() == "or" or item.lower() == "and" or item == ")" or item == "(":
-                        continue
-                    else:
-                        # if it's a category, validate that the category exists
-                        if '@' in item:
-                            item = item.replace("|", "")
-                            item_parts = item.split(":")
-                            item_name = item
-
-                            if len(item_parts) > 1:
-                                item_name = item_parts[0]
-
-                            item_name = item_name[1:]
-                            item_category_exists = len([item for item in DataValidation.item_table if item_name in item.get('category', [])]) > 0
-
-                            if not item_category_exists:
-                                raise ValidationError("Item category %s is required by location %s but is misspelled or does not exist." % (item_name, location["name"]))
-
-                            continue
-
-                        item = item.replace("|", "")
-
-                        item_parts = item.split(":")
-                        item_name = item
-
-                        if len(item_parts) > 1:
-                            item_name = item_parts[0]
-
-                        item_exists = len([item["name"] for item in DataValidation.item_table if item["name"] == item_name]) > 0
-
-                        if not item_exists:
-                            raise ValidationError("Item %s is required by location %s but is misspelled or does not exist." % (item_name, location["name"]))
-
-            else:  # item access is in dict form
-                for item in location["requires"]:
-                    # if the require entry is an object with "or" or a list of items, treat it as a standalone require of its own
-                    if (isinstance(item, dict) and "or" in item and isinstance(item["or"], list)) or (isinstance(item, list)):
-                        or_items = item
-
-                        if isinstance(item, dict):
-                            or_items = item["or"]
+    def getIndex() -> ValidationIndex:
+        if DataValidation.index is not None:
+            return DataValidation.index
+        return ValidationIndex(DataValidation.item_table, DataValidation.location_table, DataValidation.region_table)
 
-                        for or_item in or_items:
-                            or_item_parts = or_item.split(":")
-                            or_item_name = or_item
 
-                            if len(or_item_parts) > 1:
-                                or_item_name = or_item_parts[0]
-
-                            item_exists = len([item["name"] for item in DataValidation.item_table if item["name"] == or_item_name]) > 0
-
-                            if not item_exists:
-                                raise ValidationError("Item %s is required by location %s but is misspelled or does not exist." % (or_item_name, location["name"]))
-                    else:
-                        item_parts = item.split(":")
-                        item_name = item
-
-                        if len(item_parts) > 1:
-                            item_name = item_parts[0]
-
-                        item_exists = len([item["name"] for item in DataValidation.item_table if item["name"] == item_name]) > 0
+    @staticmethod
+    def _checkRequiresTokens(index: "ValidationIndex", requires_tokens: list[tuple[str, list[tuple[bool, str]]]], kind: str):
+        from .Items import category_name_to_item_names
+        for owner_name, tokens in requires_tokens:
+            for is_category, item_name in tokens:
+                if is_category:
+                    if item_name not in category_name_to_item_names:
+                        raise ValidationError("Item category %s is required by %s %s but is misspelled or does not exist." % (item_name, kind, owner_name))
+                elif item_name not in index.item_names:
+                    raise ValidationError("Item %s is required by %s %s but is misspelled or does not exist." % (item_name, kind, owner_name))
 
-                        if not item_exists:
-                            raise ValidationError("Item %s is required by location %s but is misspelled or does not exist." % (item_name, location["name"]))
+    @staticmethod
+    def checkItemNamesInLocationRequires():
+        index = DataValidation.getIndex()
+        DataValidation._checkRequiresTokens(index, index.location_requires_tokens, "location")
 
     @staticmethod
     def checkItemNamesInRegionRequires():
-        for region_name in DataValidation.region_table:
-            region = DataValidation.region_table[region_name]
-
-            if "requires" not in region:
-                continue
-
-            if isinstance(region["requires"], str):
-                # parse user written statement into list of each item
-                for item in re.findall(r'\|[^|]+\|', region["requires"]):
-                    if item.lower() == "or" or item.lower() == "and" or item == ")" or item == "(":
-                        continue
-                    else:
-                        # if it's a category, validate that the category exists
-                        if '@' in item:
-                            item = item.replace("|", "")
-                            item_parts = item.split(":")
-                            item_name = item
-
-                            if len(item_parts) > 1:
-                                item_name = item_parts[0]
-
-                            item_name = item_name[1:]
-                            item_category_exists = len([item for item in DataValidation.item_table if item_name in item.get('category', [])]) > 0
-
-                            if not item_category_exists:
-                                raise ValidationError("Item category %s is required by region %s but is misspelled or does not exist." % (item_name, region_name))
-
-                            continue
-
-                        item = item.replace("|", "")
-
-                        item_parts = item.split(":")
-                        item_name = item
-
-                        if len(item_parts) > 1:
-                            item_name = item_parts[0]
-
-                        item_exists = len([item["name"] for item in DataValidation.item_table if item["name"] == item_name]) > 0
-
-                        if not item_exists:
-                            raise ValidationError("Item %s is required by region %s but is misspelled or does not exist." % (item_name, region_name))
-
-            else:  # item access is in dict form
-                for item in region["requires"]:
-                    # if the require entry is an object with "or" or a list of items, treat it as a standalone require of its own
-                    if (isinstance(item, dict) and "or" in item and isinstance(item["or"], list)) or (isinstance(item, list)):
-                        or_items = item
-
-                        if isinstance(item, dict):
-                            or_items = item["or"]
-
-                        for or_item in or_items:
-                            or_item_parts = or_item.split(":")
-                            or_item_name = or_item
-
-                            if len(or_item_parts) > 1:
-                                or_item_name = or_item_parts[0]
-
-                            item_exists = len([item["name"] for item in DataValidation.item_table if item["name"] == or_item_name]) > 0
-
-                            if not item_exists:
-                                raise ValidationError("Item %s is required by region %s but is misspelled or does not exist." % (or_item_name, region_name))
-                    else:
-                        item_parts = item.split(":")
-                        item_name = item
-
-                        if len(item_parts) > 1:
-                            item_name = item_parts[0]
-
-                        item_exists = len([item["name"] for item in DataValidation.item_table if item["name"] == item_name]) > 0
-
-                        if not item_exists:
-                            raise ValidationError("Item %s is required by region %s but is misspelled or does not exist." % (item_name, region_name))
+        index = DataValidation.getIndex()
+        DataValidation._checkRequiresTokens(index, index.region_requires_tokens, "region")
 
     @staticmethod
     def checkRegionNamesInLocations():
@@ -172,9 +112,7 @@ class DataValidation():
             if "region" not in location or location["region"] in ["Menu", "Manual"]:
                 continue
 
-            region_exists = len([name for name in DataValidation.region_table if name == location["region"]]) > 0
-
-            if not region_exists:
+            if location["region"] not in DataValidation.region_table:
                 raise ValidationError("Region %s is set for location %s, but the region is misspelled or does not exist." % (location["region"], location["name"]))
 
     @staticmethod
@@ -209,6 +147,7 @@ class DataValidation():
 
     @staticmethod
     def checkItemsThatShouldBeRequired():
+        index = DataValidation.getIndex()
         for item in DataValidation.item_table:
             # if the item is already progression, no need to check
             if item.get("progression"):
@@ -250,39 +189,20 @@ class DataValidation():
 
                 if has_progression:
                     continue
-            # check location requires for the presence of item name
-            for location in DataValidation.location_table:
-                if "requires" not in location:
-                    continue
-
-                # convert to json so we don't have to guess the data type
-                location_requires = json.dumps(location["requires"])
-
-                # if boolean, else legacy
-                if isinstance(location_requires, str):
-                    if '|{}|'.format(item["name"]) in location_requires:
-                        raise ValidationError("Item %s is required by location %s, but the item is not marked as progression." % (item["name"], location["name"]))
-                else:
-                    if item["name"] in location_requires:
-                        raise ValidationError("Item %s is required by location %s, but the item is not marked as progression." % (item["name"], location["name"]))
-
-            # check region requires for the presence of item name
-            for region_name in DataValidation.region_table:
-                region = DataValidation.region_table[region_name]
-
-                if "requires" not in region:
-                    continue
-
-                # convert to json so we don't have to guess the data type
-                region_requires = json.dumps(region["requires"])
-
-                # if boolean, else legacy
-                if isinstance(region_requires, str):
-                    if '|{}|'.format(item["name"]) in region_requires:
-                        raise ValidationError("Item %s is required by region %s, but the item is not marked as progression." % (item["name"], region_name))
-                else:
-                    if item["name"] in region_requires:
-                        raise ValidationError("Item %s is required by region %s, but the item is not marked as progression." % (item["name"], region_name))
+            # check location requires, then region requires, for the presence of item name
+            # the requires are searched as json so we don't have to guess the data type
+            name = item["name"]
+            if "|" not in name:
+                location_name = index.piped_names_to_location.get(name)
+                region_name = index.piped_names_to_region.get(name)
+            else: # a name with a | in it can't be found in the split requires, search them directly
+                location_name = next((owner for owner, requires in index.location_requires_json if f"|{name}|" in requires), None)
+                region_name = next((owner for owner, requires in index.region_requires_json if f"|{name}|" in requires), None)
+
+            if location_name is not None:
+                raise ValidationError("Item %s is required by location %s, but the item is not marked as progression." % (item["name"], location_name))
+            if region_name is not None:
+                raise ValidationError("Item %s is required by region %s, but the item is not marked as progression." % (item["name"], region_name))
 
     @staticmethod
     def _checkLocationRequiresForItemValueWithRegex(values_requested: dict[str, int], requires) -> dict[str, int]:
@@ -360,25 +280,21 @@ class DataValidation():
                 continue
 
             for connecting_region in region["connects_to"]:
-                region_exists = len([name for name in DataValidation.region_table if name == connecting_region]) > 0
-
-                if not region_exists:
+                if connecting_region not in DataValidation.region_table:
                     raise ValidationError("Region %s connects to a region %s, which is misspelled or does not exist." % (region_name, connecting_region))
 
     @staticmethod
     def checkForDuplicateItemNames():
+        item_name_counts = DataValidation.getIndex().item_name_counts
         for item in DataValidation.item_table:
-            name_count = len([i for i in DataValidation.item_table if i["name"] == item["name"]])
-
-            if name_count > 1:
+            if item_name_counts[item["name"]] > 1:
                 raise ValidationError("Item %s is defined more than once." % (item["name"]))
 
     @staticmethod
     def checkForDuplicateLocationNames():
+        location_name_counts = DataValidation.getIndex().location_name_counts
         for location in DataValidation.location_table:
-            name_count = len([l for l in DataValidation.location_table if l["name"] == location["name"]])
-
-            if name_count > 1:
+            if location_name_counts[location["name"]] > 1:
                 raise ValidationError("Location %s is defined more than once." % (location["name"]))
 
     @staticmethod
@@ -390,10 +306,12 @@ class DataValidation():
 
     @staticmethod
     def checkStartingItemsForValidItemsAndCategories():
+        from .Items import category_name_to_item_names
         if "starting_items" not in DataValidation.game_table:
             return
 
         starting_items = DataValidation.game_table["starting_items"]
+        item_names = DataValidation.getIndex().item_names
 
         for starting_block in starting_items:
             if "items" in starting_block and "item_categories" in starting_block:
@@ -401,12 +319,12 @@ class DataValidation():
 
             if "items" in starting_block:
                 for item_name in starting_block["items"]:
-                    if not item_name in [item["name"] for item in DataValidation.item_table]:
+                    if not item_name in item_names:
                         raise ValidationError("Item %s is set as a starting item, but is misspelled or is not defined." % (item_name))
 
             if "item_categories" in starting_block:
                 for category_name in starting_block["item_categories"]:
-                    if len([item for item in DataValidation.item_table if "category" in item and category_name in item["category"]]) == 0:
+                    if category_name not in category_name_to_item_names:
                         raise ValidationError("Item category %s is set as a starting item category, but is misspelled or is not defined on any items." % (category_name))
 
     @staticmethod
@@ -441,6 +359,7 @@ class DataValidation():
 
     @staticmethod
     def checkPlacedItemsForValidItems():
+        item_names = DataValidation.getIndex().item_names
         for location in DataValidation.location_table:
             if not (place_item := location.get("place_item", False)):
                 continue
@@ -450,11 +369,12 @@ class DataValidation():
                 continue
 
             for item_name in place_item:
-                if not item_name in [item["name"] for item in DataValidation.item_table]:
+                if not item_name in item_names:
                     raise ValidationError("Item %s is placed (using place_item) on a location, but is misspelled or is not defined." % (item_name))
 
     @staticmethod
     def checkPlacedItemCategoriesForValidItemCategories():
+        from .Items import category_name_to_item_names
         for location in DataValidation.location_table:
             if not (place_item_category := location.get("place_item_category", False)):
                 continue
@@ -464,7 +384,7 @@ class DataValidation():
                 continue
 
             for category_name in place_item_category:
-                if len([item for item in DataValidation.item_table if "category" in item and category_name in item["category"]]) == 0:
+                if category_name not in category_name_to_item_names:
                     raise ValidationError("Item category %s is placed (using place_item_category) on a location, but is misspelled or is not defined." % (category_name))
 
     @staticmethod
@@ -490,11 +410,10 @@ class DataValidation():
             return
 
         nonstarting_regions = [region for region in DataValidation.region_table if not DataValidation.region_table[region].get("starting")]
+        connected_regions = {connecting_region for region in DataValidation.region_table.values() for connecting_region in region.get("connects_to", [])}
 
         for nonstarter in nonstarting_regions:
-            regions_that_connect_to = [region for region in DataValidation.region_table if "connects_to" in DataValidation.region_table[region] and nonstarter in DataValidation.region_table[region]["connects_to"]]
-
-            if len(regions_that_connect_to) == 0:
+            if nonstarter not in connected_regions:
                 raise ValidationError("The region '%s' is set as a non-starting region, but has no regions that connect to it. It will be inaccessible." % nonstarter)
 
 
@@ -513,6 +432,18 @@ def runPreFillDataValidation(world: World, multiworld: MultiWorld):
 # Called during stage_assert_generate
 def runGenerationDataValidation(cls) -> None:
     validation_errors = []
+    DataValidation.index = ValidationIndex(DataValidation.item_table, DataValidation.location_table, DataValidation.region_table)
+    try:
+        _runGenerationChecks(validation_errors)
+    finally:
+        DataValidation.index = None
+
+    if len(validation_errors) > 0:
+        heading = f"ValidationError(s) in {cls.game}:";
+
+        raise Exception("\n\n%s \n\n%s\n\n" % (heading, "\n".join([' - ' + str(validation_error) for validation_error in validation_errors])))
+
+def _runGenerationChecks(validation_errors: list[ValidationError]):
 
     # check that requires have correct item names in locations and regions
     try: DataValidation.checkItemNamesInLocationRequires()
@@ -570,8 +501,3 @@ def runGenerationDataValidation(cls) -> None:
     # check for regions that are set as non-starting regions and have no connectors to them (so are unreachable)
     try: DataValidation.checkForNonStartingRegionsThatAreUnreachable()
     except ValidationError as e: validation_errors.append(e)
-
-    if len(validation_errors) > 0:
-        heading = f"ValidationError(s) in {cls.game}:";
-
-        raise Exception("\n\n%s \n\n%s\n\n" % (heading, "\n".join([' - ' + str(validation_error) for validation_error in validation_errors])))
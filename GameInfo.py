@@ -1,52 +1,67 @@
-all_survivors_names = [
-    "Acrobat",
-    "Aeroplanist",
-    "Antiquarian",
-    "Archer",
-    "Barmaid",
-    "Batter",
-    "Cheerleader",
-    "Composer",
-    "Coordinator",
-    "Cowboy",
-    "Doctor",
-    "Embalmer",
-    "Enchantress",
-    "Entomologist",
-    "Escapologist",
-    "Explorer",
-    "Faro Lady",
-    "Female Dancer",
-    "Fire Investigator",
-    "First Officer",
-    "Forward",
-    "Gardener",
-    "Grave Keeper",
-    "Journalist",
-    "Knight",
-    "Lanternist",
-    "Lawyer",
-    "Little Girl",
-    "Lucky Guy",
-    "Magician",
-    "Mechanic",
-    "Mercenary",
-    "Meteorologist",
-    "Novelist",
-    "Painter",
-    "Patient",
-    "Perfumer",
-    "Postman",
-    "Priestess",
-    "Prisoner",
-    "Professor",
-    "Prospector",
-    "Psychologist",
-    "Puppeteer",
-    "Seer",
-    "The Minds Eye",
-    "Thief",
-    "Toy Merchant",
-    "Weeping Clown",
-    "Wildling"
-]
\ No newline at end of file
+# The class of every survivor, in the order their items and locations are made (see hooks/Data.py).
+# Adding a survivor only takes a line here, at the end: their ids come from their position in this list.
+survivor_classes = {
+    "Acrobat": "Containment",
+    "Aeroplanist": "Containment",
+    "Antiquarian": "Containment",
+    "Archer": "Containment",
+    "Barmaid": "Assist",
+    "Batter": "Assist",
+    "Cheerleader": "Assist",
+    "Composer": "Decoding",
+    "Coordinator": "Rescue",
+    "Cowboy": "Assist",
+    "Doctor": "Containment",
+    "Embalmer": "Assist",
+    "Enchantress": "Containment",
+    "Entomologist": "Containment",
+    "Escapologist": "Assist",
+    "Explorer": "Decoding",
+    "Faro Lady": "Decoding",
+    "Female Dancer": "Containment",
+    "Fire Investigator": "Containment",
+    "First Officer": "Rescue",
+    "Forward": "Assist",
+    "Gardener": "Containment",
+    "Grave Keeper": "Rescue",
+    "Journalist": "Rescue",
+    "Knight": "Rescue",
+    "Lanternist": "Assist",
+    "Lawyer": "Decoding",
+    "Little Girl": "Assist",
+    "Lucky Guy": "Containment",
+    "Magician": "Containment",
+    "Mechanic": "Decoding",
+    "Mercenary": "Rescue",
+    "Meteorologist": "Containment",
+    "Novelist": "Containment",
+    "Painter": "Containment",
+    "Patient": "Containment",
+    "Perfumer": "Containment",
+    "Postman": "Assist",
+    "Priestess": "Assist",
+    "Prisoner": "Decoding",
+    "Professor": "Containment",
+    "Prospector": "Containment",
+    "Psychologist": "Assist",
+    "Puppeteer": "Containment",
+    "Seer": "Assist",
+    "The Minds Eye": "Decoding",
+    "Thief": "Containment",
+    "Toy Merchant": "Containment",
+    "Weeping Clown": "Rescue",
+    "Wildling": "Assist",
+}
+
+all_survivors_names = list(survivor_classes)
+
+# The class challenge location of each class
+class_challenges = {
+    "Containment": "Contain hunter for 90s",
+    "Assist": "Assist 1 teammate",
+    "Decoding": "Get 150% decoding",
+    "Rescue": "Rescue 1 teammate",
+}
+
+# Every persona that can be unlocked, Borrowed Time is only shuffled with the shuffle_borrowed_time option
+all_persona_names = ["Borrowed Time", "Tide Turner", "Flywheel Effect", "Knee Jerk Reflex"]
@@ -2,14 +2,17 @@ import ast
 import csv
 import os
 import pkgutil
+import sys
 import json
 
-from BaseClasses import MultiWorld, Item
+from BaseClasses import MultiWorld, Item, ItemClassification
+from collections.abc import Iterable, Hashable
 from enum import IntEnum
-from typing import Optional, List, Union, get_args, get_origin, Any
+from typing import Callable, Optional, List, Union, get_args, get_origin, Any
 from types import GenericAlias
+from weakref import WeakValueDictionary
 from worlds.AutoWorld import World
-from .hooks.Helpers import before_is_category_enabled, before_is_item_enabled, before_is_location_enabled
+from .hooks.Helpers import before_is_category_enabled, before_is_item_enabled, before_is_location_enabled, hook_get_enablement_cache_key
 
 # blatantly copied from the minecraft ap world because why not
 def load_data_file(*args) -> dict:
@@ -69,6 +72,10 @@ def check_disabled_character_category(multiworld: MultiWorld, player: int, categ
 def is_category_enabled(multiworld: MultiWorld, player: int, category_name: str) -> bool:
     from .Data import category_table
     """Check if a category has been disabled by a yaml option."""
+    table = getattr(multiworld.worlds[player], "enablement_table", None)
+    if table is not None and category_name in table.checked_categories:
+        return category_name in table.categories
+
     hook_result = before_is_category_enabled(multiworld, player, category_name)
     ret = check_yaml_category(multiworld, player, category_name)
     if ret is not None: hook_result = ret
@@ -101,6 +108,10 @@ def is_item_name_enabled(multiworld: MultiWorld, player: int, item_name: str) ->
 
 def is_item_enabled(multiworld: MultiWorld, player: int, item: dict[str, Any]) -> bool:
     """Check if an item has been disabled by a yaml option."""
+    table = getattr(multiworld.worlds[player], "enablement_table", None)
+    if table is not None and table.item_definitions.get(item.get("name")) is item:
+        return item["name"] in table.items
+
     hook_result = before_is_item_enabled(multiworld, player, item)
     if hook_result is not None:
         return hook_result
@@ -117,6 +128,10 @@ def is_location_name_enabled(multiworld: MultiWorld, player: int, location_name:
 
 def is_location_enabled(multiworld: MultiWorld, player: int, location: dict[str, Any]) -> bool:
     """Check if a location has been disabled by a yaml option."""
+    table = getattr(multiworld.worlds[player], "enablement_table", None)
+    if table is not None and table.location_definitions.get(location.get("name")) is location:
+        return location["name"] in table.locations
+
     hook_result = before_is_location_enabled(multiworld, player, location)
     if hook_result is not None:
         return hook_result
@@ -135,6 +150,97 @@ def _is_manualobject_enabled(multiworld: MultiWorld, player: int, object: dict[s
 
     return enabled
 
+class EnablementTable:
+    """What is enabled for a player, computed once with the is_*_enabled functions so later checks are set lookups.
+    \nThe item/location definitions are kept to make sure a lookup is about the same dict that was checked.
+    \nPlayers with the same cache key (see get_enablement_cache_key) share the same table, so don't modify it.
+    item_config is the item counts create_items starts from, set by it the first time."""
+    __slots__ = ("options_fingerprint", "cache_key", "checked_categories", "categories", "item_definitions", "items",
+                 "location_definitions", "locations", "item_config", "__weakref__")
+
+    def __init__(self, world: World, cache_key: Optional[tuple] = None):
+        from .Data import category_table
+        multiworld, player = world.multiworld, world.player
+        self.options_fingerprint = get_options_fingerprint(world)
+        self.cache_key = cache_key
+        self.item_config: Optional[dict[str, int|dict]] = None
+
+        self.item_definitions: dict[str, dict] = {item["name"]: item for item in world.item_table}
+        self.location_definitions: dict[str, dict] = {location["name"]: location for location in world.location_table}
+
+        category_names = set(category_table)
+        for definition in [*self.item_definitions.values(), *self.location_definitions.values()]:
+            category_names.update(definition.get("category", []))
+        self.checked_categories = frozenset(category_names)
+        self.categories = frozenset(c for c in category_names if is_category_enabled(multiworld, player, c))
+
+        self.items = frozenset(name for name, item in self.item_definitions.items() if is_item_enabled(multiworld, player, item))
+        self.locations = frozenset(name for name, location in self.location_definitions.items() if is_location_enabled(multiworld, player, location))
+
+# Enablement tables by cache key, a table is dropped once no world uses it anymore
+shared_enablement_tables: "WeakValueDictionary[tuple, EnablementTable]" = WeakValueDictionary()
+
+def _make_hashable(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return frozenset((key, _make_hashable(v)) for key, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_make_hashable(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+# Options the world itself changes in place while generating, they don't change what's enabled
+fingerprint_ignored_options = frozenset({"local_items", "non_local_items", "start_hints", "start_location_hints"})
+
+def get_options_fingerprint(world: World) -> tuple:
+    """The values of every option of a world, to know if a hook changed one of them or if two players have the same options"""
+    return tuple((name, _make_hashable(getattr(option, "value", None))) for name, option in vars(world.options).items()
+                 if name not in fingerprint_ignored_options)
+
+def get_enablement_cache_key(world: World) -> Optional[tuple]:
+    """What makes the enablement table of a world, or None if it can't be shared with other players"""
+    hook_key = hook_get_enablement_cache_key(world)
+    if hook_key is None:
+        return None
+    from .Data import item_table, location_table
+    # A world with its own item/location table (like with a counted goal) only shares with worlds that have the same definitions
+    item_key = None if world.item_table is item_table else tuple(map(id, world.item_table))
+    location_key = None if world.location_table is location_table else tuple(map(id, world.location_table))
+    return (get_options_fingerprint(world), hook_key, item_key, location_key)
+
+def refresh_enablement_table(world: World):
+    """Build the enablement table of a world, or rebuild it if an option changed since it was built.
+    \nA table already built for another player with the same cache key is reused instead.
+    \nManualWorld calls this after generate_early and before its later steps."""
+    table = getattr(world, "enablement_table", None)
+    if table is not None:
+        if table.options_fingerprint == get_options_fingerprint(world):
+            return
+        # the is_*_enabled functions answer from the table of the world, the new one must not be built from the old one
+        del world.enablement_table
+
+    cache_key = get_enablement_cache_key(world)
+    table = shared_enablement_tables.get(cache_key) if cache_key is not None else None
+    if table is None:
+        table = EnablementTable(world, cache_key)
+        if cache_key is not None:
+            shared_enablement_tables[cache_key] = table
+    world.enablement_table = table
+
+def invalidate_enablement_table(world: World):
+    """Drop the enablement table, use this in hooks that change what's enabled without changing an option"""
+    table = getattr(world, "enablement_table", None)
+    if table is None:
+        return
+    del world.enablement_table
+    # a hook changed something the key doesn't know about, so the next refresh shouldn't find the same table
+    if table.cache_key is not None and shared_enablement_tables.get(table.cache_key) is table:
+        del shared_enablement_tables[table.cache_key]
+
 def get_items_for_player(multiworld: MultiWorld, player: int, includePrecollected: bool = False) -> List[Item]:
     """Return list of items of a player including placed items"""
     items = [i for i in multiworld.get_items() if i.player == player]
@@ -220,6 +326,17 @@ def convert_to_long_string(input: str | list[str]) -> str:
         return str.join("\n    ", input)
     return input
 
+def state_independent(func):
+    """Decorator for requires functions whose result only depends on the options and never on the CollectionState.\n
+    Their result is computed once per player when the rules are set and folded into the requires,
+    instead of the function being called on every access check.\n
+    If the function asks for a CollectionState it will receive None."""
+    func.state_independent = True
+    return func
+
+def is_state_independent(func) -> bool:
+    return getattr(func, "state_independent", False)
+
 def format_to_valid_identifier(input: str) -> str:
     """Make sure the input is a valid python identifier"""
     input = input.strip()
@@ -227,10 +344,196 @@ def format_to_valid_identifier(input: str) -> str:
         input = "_" + input
     return input.replace(" ", "_")
 
+class ItemPool(list):
+    """A list of items with a name index, so finding the items with some names doesn't scan the pool for each name.
+    \nIt is a real list, hooks can use it like any other list (indexing, shuffle, copy, slices, +).
+    The index is rebuilt the first time it's needed after the pool changes, classifications are read from the items when asked for.
+    \nremove_specific keeps the index up to date, so finding and removing items one at a time doesn't rebuild it.
+    To remove many specific items, use remove_items once instead of remove_specific for each of them."""
+
+    def __init__(self, items: Iterable[Item] = ()):
+        super().__init__(items)
+        self._by_name: Optional[dict[str, dict[int, Item]]] = None # item name: {order: item}, in pool order
+        self._order: dict[int, int] = {} # id(item): the position of the item when the index was built, its order
+        self._removed: list[int] = [] # Fenwick tree of the orders removed by remove_specific since the index was built
+
+    def _get_name_index(self) -> dict[str, dict[int, Item]]:
+        if self._by_name is None:
+            self._by_name = {}
+            self._order = {}
+            for order, item in enumerate(self):
+                self._by_name.setdefault(item.name, {})[order] = item
+                self._order.setdefault(id(item), order)
+            self._removed = [0] * (len(self) + 1)
+        return self._by_name
+
+    def _get_position(self, order: int) -> int:
+        """The current position of the item with this order, its order minus the items removed before it"""
+        position = order
+        i = order
+        while i > 0:
+            position -= self._removed[i]
+            i &= i - 1
+        return position
+
+    def remove_specific(self, item: Item) -> Item:
+        """Remove and return this exact item, raise ValueError if it's not in the pool"""
+        index = self._get_name_index()
+        order = self._order.get(id(item))
+        position = self._get_position(order) if order is not None else None
+        if position is None or position >= len(self) or super().__getitem__(position) is not item:
+            # the same item is in the pool more than once, look for it instead
+            for position, pool_item in enumerate(self):
+                if pool_item is item:
+                    del self[position]
+                    return item
+            raise ValueError(f"Item '{item.name}' could not be found in source list")
+
+        super().__delitem__(position)
+        del self._order[id(item)]
+        bucket = index[item.name]
+        del bucket[order]
+        if not bucket:
+            del index[item.name]
+        i = order + 1
+        while i < len(self._removed):
+            self._removed[i] += 1
+            i += i & -i
+        return item
+
+    def remove_items(self, items: Iterable[Item]) -> list[Item]:
+        """Remove these exact items in a single pass, raise ValueError if one of them is not in the pool or is given twice"""
+        items = list(items)
+        to_remove: set[int] = set()
+        for item in items:
+            if id(item) in to_remove:
+                raise ValueError(f"Item '{item.name}' was given more than once to be removed")
+            to_remove.add(id(item))
+        remaining = [item for item in self if id(item) not in to_remove]
+        if len(remaining) != len(self) - len(to_remove):
+            pool_ids = {id(item) for item in self}
+            missing = next(item for item in items if id(item) not in pool_ids)
+            raise ValueError(f"Item '{missing.name}' could not be found in source list")
+        self[:] = remaining
+        return items
+
+    def get_items_with_names(self, names: Iterable[str]) -> list[Item]:
+        """Returns the items with any of these names, in pool order"""
+        index = self._get_name_index()
+        buckets = [index[name] for name in set(names) if name in index]
+        if len(buckets) == 1:
+            return list(buckets[0].values())
+        return [item for _, item in sorted(entry for bucket in buckets for entry in bucket.items())]
+
+    def get_items_by_name(self, name: str) -> list[Item]:
+        return list(self._get_name_index().get(name, {}).values())
+
+    def get_first_by_name(self, name: str) -> Optional[Item]:
+        return next(iter(self._get_name_index().get(name, {}).values()), None)
+
+    def count_name(self, name: str) -> int:
+        return len(self._get_name_index().get(name, ()))
+
+    def get_items_with_classification(self, classification: ItemClassification) -> list[Item]:
+        """Returns the items of exactly this classification"""
+        return [item for item in self if item.classification == classification]
+
+    def copy(self) -> "ItemPool":
+        return ItemPool(self)
+
+    # every change to the list goes through one of these, so the index is rebuilt when it's needed next
+    def append(self, item: Item):
+        super().append(item)
+        self._by_name = None
+
+    def extend(self, items: Iterable[Item]):
+        super().extend(items)
+        self._by_name = None
+
+    def insert(self, index: int, item: Item):
+        super().insert(index, item)
+        self._by_name = None
+
+    def remove(self, item: Item):
+        super().remove(item)
+        self._by_name = None
+
+    def pop(self, index: int = -1) -> Item:
+        item = super().pop(index)
+        self._by_name = None
+        return item
+
+    def clear(self):
+        super().clear()
+        self._by_name = None
+
+    def sort(self, *, key=None, reverse: bool = False):
+        super().sort(key=key, reverse=reverse)
+        self._by_name = None
+
+    def reverse(self):
+        super().reverse()
+        self._by_name = None
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._by_name = None
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._by_name = None
+
+    def __iadd__(self, items: Iterable[Item]) -> "ItemPool":
+        super().__iadd__(items)
+        self._by_name = None
+        return self
+
+    def __imul__(self, count: int) -> "ItemPool":
+        super().__imul__(count)
+        self._by_name = None
+        return self
+
+    def __repr__(self) -> str:
+        return f"ItemPool({super().__repr__()})"
+
+class LazyLookups:
+    """Lookups of a module that are only built the first time they're used, so importing the module doesn't pay for them.
+    \nIn the module, use get(name). Set the module's __getattr__ to getattr so 'from module import name' still works."""
+
+    def __init__(self, module_name: str, builders: dict[str, Callable[[], Any]]):
+        self.module_name = module_name
+        self.builders = builders
+        self.values: dict[str, Any] = {}
+
+    def get(self, name: str) -> Any:
+        if name not in self.values:
+            self.values[name] = self.builders[name]()
+        return self.values[name]
+
+    def getattr(self, name: str) -> Any:
+        if name in self.builders:
+            return self.get(name)
+        raise AttributeError(f"module {self.module_name!r} has no attribute {name!r}")
+
+def intern_definition(definition: dict[str, Any]) -> dict[str, Any]:
+    """Intern the name and categories of an item or location definition (in place), so the definitions and lookups share the strings.
+    \nA single category given as a string is turned into a list."""
+    if isinstance(definition.get("name"), str):
+        definition["name"] = sys.intern(definition["name"])
+    category = definition.get("category")
+    if isinstance(category, str):
+        category = [category]
+    if isinstance(category, list):
+        definition["category"] = [sys.intern(c) if isinstance(c, str) else c for c in category]
+    return definition
+
 def remove_specific_item(source: list[Item], item: Item) -> Item:
     """Remove and return an item from a list in a more precise way, base AP only check for name and player id before removing.
     \nThis checks that the item IS the exact same in the list.
     \nRaise ValueError if the item is not in the list."""
+    if isinstance(source, ItemPool):
+        return source.remove_specific(item)
+
     # Inspired by https://stackoverflow.com/a/58761459
     for i in range(len(source)): # check all elements of the list like a normal remove does
         if item is source[i]:
@@ -1,67 +1,183 @@
-from BaseClasses import Item
+from typing import Any
+
+from BaseClasses import Item, ItemClassification
 from .Data import item_table
 from .Game import filler_item_name, starting_index
+from .Helpers import format_state_prog_items_key, ProgItemsCat, LazyLookups, intern_definition
+from .Snapshot import load_snapshot_part, store_snapshot_part
 
 
 ######################
 # Generate item lookups
 ######################
 
-item_id_to_name: dict[int, str] = {}
-item_name_to_item: dict[str, dict] = {}
-item_name_groups: dict[str, str] = {}
+def build_item_lookups(item_table: list[dict]) -> dict[str, Any]:
+    """Add the filler item and the ids to the item definitions and intern their names (in place), then build every item lookup"""
+    item_id_to_name: dict[int, str] = {}
+    item_name_to_item: dict[str, dict] = {}
+    item_name_groups: dict[str, str] = {}
+    lastItemId = -1
+
+    count = starting_index
+
+    # add the filler item to the list of items for lookup
+    if filler_item_name:
+        item_table.append({
+            "name": filler_item_name
+        })
+
+    # add sequential generated ids to the lists
+    for key, val in enumerate(item_table):
+        intern_definition(val)
+        if "id" in item_table[key]:
+            item_id = item_table[key]["id"]
+            if item_id >= count:
+                count = item_id
+            else:
+                raise ValueError(f"{item_table[key]['name']} has an invalid ID. ID must be at least {count + 1}")
+
+        item_table[key]["id"] = count
+        item_table[key]["progression"] = val["progression"] if "progression" in val else False
+
+        count += 1
+
+    for item in item_table:
+        item_name = item["name"]
+        item_id_to_name[item["id"]] = item_name
+        item_name_to_item[item_name] = item
+
+        if item["id"] is not None:
+            lastItemId = max(lastItemId, item["id"])
+
+        for c in item.get("category", []):
+            if c not in item_name_groups:
+                item_name_groups[c] = []
+            item_name_groups[c].append(item_name)
+
+        #Just lowercase the values here to remove all the .lower.strip down the line
+        item['value'] = {k.lower().strip(): v
+                         for k, v in item.get('value', {}).items()}
+
+        for v in item.get("value", {}).keys():
+            group_name = f"has_{v}_value"
+            if group_name not in item_name_groups:
+                item_name_groups[group_name] = []
+            item_name_groups[group_name].append(item_name)
+
+    item_id_to_name[None] = "__Victory__"
+
+    return {
+        "item_id_to_name": item_id_to_name,
+        "item_name_to_item": item_name_to_item,
+        "item_name_groups": item_name_groups,
+        "item_name_to_id": {name: id for id, name in item_id_to_name.items()},
+        "lastItemId": lastItemId,
+    }
+
+def get_item_names_in_categories(categories: list[str] | set[str]) -> frozenset[str]:
+    """Returns the names of every item that has at least one of the categories"""
+    category_name_to_item_names = lazy_item_lookups.get("category_name_to_item_names")
+    return frozenset().union(*[category_name_to_item_names.get(c, frozenset()) for c in categories])
+
+
+######################
+# Item classifications
+######################
+
+def get_item_classification(item: dict) -> ItemClassification:
+    """Returns the classification of an item definition from its trap/useful/progression flags"""
+    classification = ItemClassification.filler
+
+    if "trap" in item and item["trap"]:
+        classification |= ItemClassification.trap
+
+    if "useful" in item and item["useful"]:
+        classification |= ItemClassification.useful
+
+    if "progression_skip_balancing" in item and item["progression_skip_balancing"]:
+        classification |= ItemClassification.progression_skip_balancing
+    elif "progression" in item and item["progression"]:
+        classification |= ItemClassification.progression
+
+    return classification
+
+_parsed_classifications: dict[ItemClassification | str | int, ItemClassification] = {}
+
+def parse_item_classification(classification: ItemClassification | str | int) -> ItemClassification:
+    """Convert a classification from a classification_count or before_create_items_all config to an ItemClassification.
+    \nAccepts an ItemClassification, its int value, its name, a '0b' binary string or names joined with '+' like 'progression+useful'.
+    Each distinct value is only parsed once."""
+    if isinstance(classification, ItemClassification):
+        return classification
+    if classification in _parsed_classifications:
+        return _parsed_classifications[classification]
+
+    def stringCheck(string: str) -> ItemClassification:
+        if string.isdigit():
+            return ItemClassification(int(string))
+        elif string.startswith('0b'):
+            return ItemClassification(int(string, base=0))
+        return ItemClassification[string]
+
+    if isinstance(classification, int):
+        result = ItemClassification(classification)
+    elif "+" in classification:
+        result = ItemClassification.filler
+        for substring in classification.split("+"):
+            result |= stringCheck(substring.strip())
+    else:
+        result = stringCheck(classification)
+
+    _parsed_classifications[classification] = result
+    return result
+
+
+######################
+# Item lookups
+######################
+
+# from the data snapshot when there's one for this data (see Snapshot.py)
+_item_lookups = load_snapshot_part("items")
+if _item_lookups is None:
+    _item_lookups = build_item_lookups(item_table)
+    store_snapshot_part("items", _item_lookups)
+
+item_id_to_name: dict[int, str] = _item_lookups["item_id_to_name"]
+item_name_to_item: dict[str, dict] = _item_lookups["item_name_to_item"]
+item_name_groups: dict[str, str] = _item_lookups["item_name_groups"]
+item_name_to_id: dict[str, int] = _item_lookups["item_name_to_id"]
+lastItemId: int = _item_lookups["lastItemId"]
 advancement_item_names: set[str] = set()
-lastItemId = -1
-
-count = starting_index
-
-# add the filler item to the list of items for lookup
-if filler_item_name:
-    item_table.append({
-        "name": filler_item_name
-    })
-
-# add sequential generated ids to the lists
-for key, val in enumerate(item_table):
-    if "id" in item_table[key]:
-        item_id = item_table[key]["id"]
-        if item_id >= count:
-            count = item_id
-        else:
-            raise ValueError(f"{item_table[key]['name']} has an invalid ID. ID must be at least {count + 1}")
-
-    item_table[key]["id"] = count
-    item_table[key]["progression"] = val["progression"] if "progression" in val else False
-    if isinstance(val.get("category", []), str):
-        item_table[key]["category"] = [val["category"]]
-        
-    count += 1
-
-for item in item_table:
-    item_name = item["name"]
-    item_id_to_name[item["id"]] = item_name
-    item_name_to_item[item_name] = item
-
-    if item["id"] is not None:
-        lastItemId = max(lastItemId, item["id"])
-
-    for c in item.get("category", []):
-        if c not in item_name_groups:
-            item_name_groups[c] = []
-        item_name_groups[c].append(item_name)
-
-    #Just lowercase the values here to remove all the .lower.strip down the line
-    item['value'] = {k.lower().strip(): v
-                     for k, v in item.get('value', {}).items()}
-
-    for v in item.get("value", {}).keys():
-        group_name = f"has_{v}_value"
-        if group_name not in item_name_groups:
-            item_name_groups[group_name] = []
-        item_name_groups[group_name].append(item_name)
-
-item_id_to_name[None] = "__Victory__"
-item_name_to_id = {name: id for id, name in item_id_to_name.items()}
+
+def build_item_name_to_categories() -> dict[str, tuple[str, ...]]:
+    return {item["name"]: tuple(dict.fromkeys(item.get("category", []))) for item in item_table}
+
+def build_category_name_to_item_names() -> dict[str, frozenset[str]]:
+    category_items: dict[str, list[str]] = {}
+    for item_name, categories in lazy_item_lookups.get("item_name_to_categories").items():
+        for c in categories:
+            category_items.setdefault(c, []).append(item_name)
+    return {c: frozenset(names) for c, names in category_items.items()}
+
+def build_item_name_to_category_keys() -> dict[str, tuple[str, ...]]:
+    """The state.prog_items keys of each category an item is counted in"""
+    return {item_name: tuple(dict.fromkeys(format_state_prog_items_key(ProgItemsCat.CATEGORY, c) for c in categories))
+            for item_name, categories in lazy_item_lookups.get("item_name_to_categories").items()}
+
+def build_item_name_to_value_keys() -> dict[str, tuple[tuple[str, int], ...]]:
+    """The state.prog_items keys of each value an item has, with how much it adds to them"""
+    return {item["name"]: tuple((format_state_prog_items_key(ProgItemsCat.VALUE, key), int(value)) for key, value in item["value"].items())
+            for item in item_table if item.get("value")}
+
+# These are only needed to generate, they're built the first time they're used
+lazy_item_lookups = LazyLookups(__name__, {
+    "item_name_to_categories": build_item_name_to_categories,
+    "category_name_to_item_names": build_category_name_to_item_names,
+    "item_name_to_category_keys": build_item_name_to_category_keys,
+    "item_name_to_classification": lambda: {item["name"]: get_item_classification(item) for item in item_table},
+    "item_name_to_value_keys": build_item_name_to_value_keys,
+})
+__getattr__ = lazy_item_lookups.getattr
 
 
 ######################
@@ -1,64 +1,260 @@
+import re
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Any, Optional, Union
+
 from BaseClasses import Location
 from .Data import location_table
 from .Game import starting_index
+from .Helpers import LazyLookups, intern_definition
+from .Items import item_name_to_item, get_item_names_in_categories
+from .Snapshot import load_snapshot_part, store_snapshot_part
 
 
 ######################
-# Generate location lookups
+# Counted goals
 ######################
 
-count = starting_index
-victory_names: list[str] = []
+class CountedGoalFamily:
+    """Victory locations that only differ by how many of an item they require, like 'Gather N Deduction Points'.
+    \nIt's defined by a single location with a "counted_goal" key, eg:
+    {"name": "Gather {count} Deduction Points", "victory": true, "counted_goal": {"item": "Deduction Point", "min": 1, "max": 500}}
+    \nOnly the location of the goal that was picked gets made, using create_location."""
+    __slots__ = ("template", "name", "singular_name", "item", "minimum", "maximum", "name_pattern")
+
+    def __init__(self, template: dict):
+        counted_goal = template["counted_goal"]
+        self.template = template
+        self.name: str = template["name"]
+        self.singular_name: Optional[str] = counted_goal.get("singular_name")
+        self.item: str = counted_goal["item"]
+        self.minimum: int = counted_goal.get("min", 1)
+        self.maximum: int = counted_goal["max"]
+        self.name_pattern = re.compile(re.escape(self.name).replace(re.escape("{count}"), r"(\d+)"), re.IGNORECASE)
+
+    def __len__(self) -> int:
+        return self.maximum - self.minimum + 1
+
+    def get_name(self, count: int) -> str:
+        if count == 1 and self.singular_name:
+            return self.singular_name
+        return self.name.replace("{count}", str(count))
+
+    def get_count(self, name: str) -> Optional[int]:
+        """Returns the count of a location name of this family, or None if the name isn't part of it"""
+        if self.singular_name and name.lower() == self.singular_name.lower():
+            count = 1
+        else:
+            match = self.name_pattern.fullmatch(name)
+            if not match:
+                return None
+            count = int(match.group(1))
+        if self.minimum <= count <= self.maximum and name.lower() == self.get_name(count).lower():
+            return count
+        return None
+
+    def create_location(self, count: int) -> dict:
+        location = {key: value for key, value in self.template.items() if key != "counted_goal"}
+        location["name"] = self.get_name(count)
+        location["requires"] = f"|{self.item}:{count}|"
+        return location
 
-# add sequential generated ids to the lists
-for key, _ in enumerate(location_table):
-    if "victory" in location_table[key] and location_table[key]["victory"]:
-        victory_names.append(location_table[key]["name"])
+class VictoryNames(Sequence):
+    """The names of the victory locations, in the order used by the goal option.
+    \nThe names of counted goal families are made when they're requested instead of being stored."""
 
-    if "id" in location_table[key]:
-        item_id = location_table[key]["id"]
-        if item_id >= count:
-            count = item_id
+    def __init__(self):
+        self.static_names: list[str] = []
+        self.static_indexes: dict[str, int] = {}
+        self.entries: list[Union[str, CountedGoalFamily]] = []
+        self.starts: list[int] = []
+        self.length = 0
+
+    def append(self, entry: Union[str, CountedGoalFamily]):
+        self.entries.append(entry)
+        self.starts.append(self.length)
+        if isinstance(entry, CountedGoalFamily):
+            self.length += len(entry)
         else:
-            raise ValueError(f"{location_table[key]['name']} has an invalid ID. ID must be at least {count + 1}")
+            self.static_names.append(entry)
+            self.static_indexes[entry] = self.length
+            self.length += 1
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("victory name index out of range")
+        position = bisect_right(self.starts, index) - 1
+        entry = self.entries[position]
+        if isinstance(entry, CountedGoalFamily):
+            return entry.get_name(entry.minimum + index - self.starts[position])
+        return entry
+
+    def index(self, name: str, start: int = 0, stop: Optional[int] = None) -> int:
+        if name in self.static_indexes:
+            return self.static_indexes[name]
+        for position, entry in enumerate(self.entries):
+            if isinstance(entry, CountedGoalFamily):
+                count = entry.get_count(name)
+                if count is not None:
+                    return self.starts[position] + count - entry.minimum
+        raise ValueError(f"'{name}' is not a victory location")
+
+    def __contains__(self, name) -> bool:
+        try:
+            self.index(name)
+        except ValueError:
+            return False
+        return True
+
+    def get_counted_goal_location(self, name: str) -> Optional[dict]:
+        """Returns the location of a counted goal by its name, or None if it's not one"""
+        for entry in self.entries:
+            if isinstance(entry, CountedGoalFamily):
+                count = entry.get_count(name)
+                if count is not None:
+                    return entry.create_location(count)
+        return None
+
+
+######################
+# Generate location lookups
+######################
+
+def group_locations_by_region(locations: list[dict]) -> dict[str, list[dict]]:
+    """Returns the locations in buckets by region name, keeping their order"""
+    buckets: dict[str, list[dict]] = {}
+    for location in locations:
+        buckets.setdefault(location.get("region", "Manual"), []).append(location)
+    return buckets
+
+def build_location_lookups(location_table: list[dict]) -> dict[str, Any]:
+    """Add the ids and default regions to the location definitions and intern their names (in place), then build every location lookup"""
+    count = starting_index
+    # the name of each victory location, or the location of a counted goal family (see get_victory_names)
+    victory_entries: list[Union[str, dict]] = []
+
+    # counted goals are not locations by themselves, only the chosen one gets made (see get_location_data)
+    for location in location_table:
+        if location.get("victory"):
+            victory_entries.append(location if "counted_goal" in location else location["name"])
+    location_table[:] = [location for location in location_table if "counted_goal" not in location]
+
+    # add sequential generated ids to the lists
+    for key, location in enumerate(location_table):
+        intern_definition(location)
+
+        if "id" in location_table[key]:
+            item_id = location_table[key]["id"]
+            if item_id >= count:
+                count = item_id
+            else:
+                raise ValueError(f"{location_table[key]['name']} has an invalid ID. ID must be at least {count + 1}")
+
+        location_table[key]["id"] = count
+
+        if "region" not in location_table[key]:
+            location_table[key]["region"] = "Manual" # all locations are in the same region for Manual
+
+        count += 1
+
+    if not victory_entries:
+        # Add the game completion location, which will have the Victory item assigned to it automatically
+        location_table.append({
+            "id": count + 1,
+            "name": "__Manual Game Complete__",
+            "region": "Manual",
+            "requires": []
+            # "category": custom_victory_location["category"] if "category" in custom_victory_location else []
+        })
+        victory_entries.append("__Manual Game Complete__")
+
+    location_id_to_name: dict[int, str] = {}
+    location_name_to_location: dict[str, dict] = {}
+    location_name_groups: dict[str, list[str]] = {}
+
+    for item in location_table:
+        location_id_to_name[item["id"]] = item["name"]
+        location_name_to_location[item["name"]] = item
+
+        for c in item.get("category", []):
+            if c not in location_name_groups:
+                location_name_groups[c] = []
+            location_name_groups[c].append(item["name"])
+
+    return {
+        "victory_entries": victory_entries,
+        "location_id_to_name": location_id_to_name,
+        "location_name_to_location": location_name_to_location,
+        "location_name_groups": location_name_groups,
+        # location_id_to_name[None] = "__Manual Game Complete__"
+        "location_name_to_id": {name: id for id, name in location_id_to_name.items()},
+    }
 
-    location_table[key]["id"] = count
+# from the data snapshot when there's one for this data (see Snapshot.py)
+_location_lookups = load_snapshot_part("locations")
+if _location_lookups is None:
+    _location_lookups = build_location_lookups(location_table)
+    store_snapshot_part("locations", _location_lookups)
 
-    if "region" not in location_table[key]:
-        location_table[key]["region"] = "Manual" # all locations are in the same region for Manual
+def get_victory_names(victory_entries: list[Union[str, dict]]) -> VictoryNames:
+    victory_names = VictoryNames()
+    for entry in victory_entries:
+        victory_names.append(CountedGoalFamily(entry) if isinstance(entry, dict) else entry)
+    return victory_names
 
-    if isinstance(location_table[key].get("category", []), str):
-        location_table[key]["category"] = [location_table[key]["category"]]
+victory_names: VictoryNames = get_victory_names(_location_lookups["victory_entries"])
+location_id_to_name: dict[int, str] = _location_lookups["location_id_to_name"]
+location_name_to_location: dict[str, dict] = _location_lookups["location_name_to_location"]
+location_name_groups: dict[str, list[str]] = _location_lookups["location_name_groups"]
+location_name_to_id: dict[str, int] = _location_lookups["location_name_to_id"]
 
-    count += 1
+def build_item_placements(locations: list[dict]) -> tuple[dict[str, frozenset[str]], dict[str, frozenset[str]]]:
+    """place_item/dont_place_item and their category variants, resolved to the forbidden and eligible item names of each location"""
+    location_name_to_forbidden_item_names: dict[str, frozenset[str]] = {}
+    location_name_to_eligible_item_names: dict[str, frozenset[str]] = {}
 
-if not victory_names:
-    # Add the game completion location, which will have the Victory item assigned to it automatically
-    location_table.append({
-        "id": count + 1,
-        "name": "__Manual Game Complete__",
-        "region": "Manual",
-        "requires": []
-        # "category": custom_victory_location["category"] if "category" in custom_victory_location else []
-    })
-    victory_names.append("__Manual Game Complete__")
+    for location in locations:
+        forbidden_item_names = frozenset(name for name in location.get("dont_place_item") or [] if name in item_name_to_item) \
+            | get_item_names_in_categories(location.get("dont_place_item_category") or [])
+        if forbidden_item_names:
+            location_name_to_forbidden_item_names[location["name"]] = forbidden_item_names
 
-location_id_to_name: dict[int, str] = {}
-location_name_to_location: dict[str, dict] = {}
-location_name_groups: dict[str, list[str]] = {}
+        if "place_item" in location or "place_item_category" in location:
+            eligible_item_names = frozenset(location.get("place_item") or []) | get_item_names_in_categories(location.get("place_item_category") or [])
+            # dont_place_item names are removed even if they aren't items
+            location_name_to_eligible_item_names[location["name"]] = eligible_item_names - forbidden_item_names - frozenset(location.get("dont_place_item") or [])
 
-for item in location_table:
-    location_id_to_name[item["id"]] = item["name"]
-    location_name_to_location[item["name"]] = item
+    return location_name_to_forbidden_item_names, location_name_to_eligible_item_names
 
-    for c in item.get("category", []):
-        if c not in location_name_groups:
-            location_name_groups[c] = []
-        location_name_groups[c].append(item["name"])
+# These are only needed to generate, they're built the first time they're used
+lazy_location_lookups = LazyLookups(__name__, {
+    "location_name_to_categories": lambda: {location["name"]: tuple(dict.fromkeys(location.get("category", []))) for location in location_table},
+    "category_name_to_location_names": lambda: {c: frozenset(names) for c, names in location_name_groups.items()},
+    "region_name_to_locations": lambda: group_locations_by_region(location_table),
+    "location_name_to_forbidden_item_names": lambda: lazy_location_lookups.get("item_placements")[0],
+    "location_name_to_eligible_item_names": lambda: lazy_location_lookups.get("item_placements")[1],
+    "item_placements": lambda: build_item_placements(location_table),
+})
+__getattr__ = lazy_location_lookups.getattr
 
+def get_location_data(name: str) -> Optional[dict]:
+    """Returns the location dict of a location name, counted goals included.
+    \nThe location of a counted goal is made each time and isn't added to location_name_to_location,
+    keep it (like ManualWorld does in its location_table) if you need it more than once."""
+    if name in location_name_to_location:
+        return location_name_to_location[name]
 
-# location_id_to_name[None] = "__Manual Game Complete__"
-location_name_to_id = {name: id for id, name in location_id_to_name.items()}
+    location = victory_names.get_counted_goal_location(name)
+    if location is None:
+        return None
+    location = intern_definition(dict(location))
+    location["region"] = location.get("region", "Manual")
+    return location
 
 ######################
 # Location classes
@@ -187,7 +187,7 @@ class ManualContext(SuperContext):
         location = self.location_table.get(name)
         if not location:
             # It is absolutely possible to pull categories from the data_package via self.update_game. I have not done this yet.
-            location = AutoWorldRegister.world_types[self.game].location_name_to_location.get(name, {"name": name})
+            location = AutoWorldRegister.world_types[self.game].get_location_data(name) or {"name": name}
         return location
 
     def get_location_by_id(self, id) -> dict[str, Any]:
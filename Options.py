@@ -48,6 +48,31 @@ def getOriginalOptionArguments(option: Type[Option[Any]]) -> dict:
     args['visibility'] = option.visibility
     return args
 
+class GoalNameLookup(dict):
+    """The name_lookup of the goal option, counted goal names are made from victory_names when they're requested"""
+    def __missing__(self, value: int) -> str:
+        if isinstance(value, int) and 0 <= value < len(victory_names):
+            return victory_names[value].lower()
+        raise KeyError(value)
+
+class GoalChoice(Choice):
+    """Base of the generated goal option, the counted goals of victory_names don't get an option_ each"""
+    @classmethod
+    def from_text(cls, text: str) -> Choice:
+        if text.lower() not in cls.options and text.lower() != "random":
+            if text in victory_names:
+                return cls(victory_names.index(text))
+            if text.isdigit() and int(text) < len(victory_names): # a goal by its value, like goal: '37'
+                return cls(int(text))
+        return super().from_text(text)
+
+    @classmethod
+    def from_any(cls, data: Any) -> Choice:
+        # Choice.from_any only takes the values of the option_ entries, the counted goals are after them
+        if type(data) == int and 0 <= data < len(victory_names):
+            return cls(data)
+        return super().from_any(data)
+
 manual_option_groups: dict[str, List[Type[Option[Any]]]] = {}
 def addOptionToGroup(option_name: str, group: str):
     if group not in manual_option_groups.keys():
@@ -66,11 +91,13 @@ if len(victory_names) > 1:
     if manual_options.get('goal'):
         logging.warning("Existing Goal option found created via Hooks, it will be overwritten by Manual's generated Goal option.\nIf you want to support old yaml you will need to add alias in after_options_defined")
 
-    goal: dict[str, Any] = {'option_' + v: i for i, v in enumerate(victory_names)}
+    # Counted goals don't get an option_ each, their names are made by VictoryNames when needed
+    goal: dict[str, Any] = {'option_' + v: victory_names.index(v) for v in victory_names.static_names}
     goal['__module__'] = __name__
 
-    manual_options['goal'] = type('goal', (Choice,), dict(goal))
+    manual_options['goal'] = type('goal', (GoalChoice,), dict(goal))
     manual_options['goal'].__doc__ = "Choose your victory condition."
+    manual_options['goal'].name_lookup = GoalNameLookup(manual_options['goal'].name_lookup)
 
 
 if any(item.get('trap') for item in item_table):
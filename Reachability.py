@@ -0,0 +1,129 @@
+from typing import TYPE_CHECKING
+
+from BaseClasses import CollectionState, Entrance, Item, Region
+
+from .Items import lazy_item_lookups
+from .Rules import get_requirement_dependencies
+
+if TYPE_CHECKING:
+    from . import ManualWorld
+
+class RequirementDependencyIndex:
+    """Which locations and entrances of a player look at each state.prog_items key (item names and category keys).
+    \nBuilt from the requirements compiled by set_rules. Rules with unknown dependencies,
+    like ones calling requires functions or ones replaced or added to by a hook, are in always_locations/always_entrances."""
+
+    def __init__(self, world: "ManualWorld"):
+        self.locations_by_key: dict[str, set[str]] = {}
+        self.entrances_by_key: dict[str, set[str]] = {}
+        self.always_locations: set[str] = set()
+        self.always_entrances: set[str] = set()
+
+        for location in world.multiworld.get_locations(world.player):
+            requirement = world.location_requirements.get(location.name)
+            dependencies = get_requirement_dependencies(requirement) if requirement is location.access_rule else None
+            self._add(self.locations_by_key, self.always_locations, location.name, dependencies)
+
+        for entrance in world.multiworld.get_entrances(world.player):
+            if entrance.access_rule is Entrance.access_rule: # the default rule, always true
+                continue
+            if entrance.access_rule is not world.entrance_access_rules.get(entrance.name): # set or changed by a hook
+                self.always_entrances.add(entrance.name)
+                continue
+            for requirement in world.entrance_requirements[entrance.name]:
+                self._add(self.entrances_by_key, self.always_entrances, entrance.name, get_requirement_dependencies(requirement))
+
+    @staticmethod
+    def _add(index: dict[str, set[str]], always: set[str], name: str, dependencies):
+        if dependencies is None:
+            always.add(name)
+            return
+        for key in dependencies:
+            index.setdefault(key, set()).add(name)
+
+    def get_affected_locations(self, keys) -> set[str]:
+        affected = set(self.always_locations)
+        for key in keys:
+            affected.update(self.locations_by_key.get(key, ()))
+        return affected
+
+    def has_affected_entrances(self, keys) -> bool:
+        return bool(self.always_entrances) or any(key in self.entrances_by_key for key in keys)
+
+def get_requirement_dependency_index(world: "ManualWorld") -> RequirementDependencyIndex:
+    """Returns the dependency index of this world, building it the first time. Only works after set_rules."""
+    if not hasattr(world, 'requirement_dependency_index'):
+        world.requirement_dependency_index = RequirementDependencyIndex(world)
+    return world.requirement_dependency_index
+
+def get_item_state_keys(item: Item) -> tuple[str, ...]:
+    """Returns the state.prog_items keys that change when this item is collected or removed"""
+    return (item.name,) + lazy_item_lookups.get("item_name_to_category_keys").get(item.name, ())
+
+class ReachabilityTracker:
+    """Keep the reachable locations of a player up to date for one CollectionState.
+    \nManualWorld.collect/remove tell the tracker which items changed, and the next time the reachable locations are requested
+    only the rules depending on those items (and the locations of regions whose reachability changed) are checked again.
+    \nCreate it using ManualWorld.track_reachability(state) and close() it when you're done with it."""
+
+    def __init__(self, world: "ManualWorld", state: CollectionState):
+        self.world = world
+        self.state = state
+        self.index = get_requirement_dependency_index(world)
+        self.pending_keys: set[str] = set()
+        self.locations = {location.name: location for location in world.multiworld.get_locations(world.player)}
+        self.locations_by_region: dict[Region, list[str]] = {}
+        for location in self.locations.values():
+            self.locations_by_region.setdefault(location.parent_region, []).append(location.name)
+
+        self.region_reachable = {region: region.can_reach(state) for region in self.locations_by_region}
+        self.location_access = {name: bool(location.access_rule(state)) for name, location in self.locations.items()}
+        self.reachable_locations = {name for name, location in self.locations.items()
+                                    if self.location_access[name] and self.region_reachable[location.parent_region]}
+
+    def item_changed(self, item: Item):
+        """Called by ManualWorld.collect/remove, the work is postponed until the reachable locations are requested"""
+        self.pending_keys.update(get_item_state_keys(item))
+
+    def refresh(self) -> set[str]:
+        """Apply the pending item changes and return the names of the locations whose reachability changed"""
+        if not self.pending_keys:
+            return set()
+        keys = self.pending_keys
+        self.pending_keys = set()
+
+        to_update = set()
+        for name in self.index.get_affected_locations(keys):
+            self.location_access[name] = bool(self.locations[name].access_rule(self.state))
+            to_update.add(name)
+
+        if self.index.has_affected_entrances(keys):
+            for region, names in self.locations_by_region.items():
+                reachable = region.can_reach(self.state)
+                if reachable != self.region_reachable[region]:
+                    self.region_reachable[region] = reachable
+                    to_update.update(names)
+
+        changed = set()
+        for name in to_update:
+            reachable = self.location_access[name] and self.region_reachable[self.locations[name].parent_region]
+            if reachable != (name in self.reachable_locations):
+                changed.add(name)
+                if reachable:
+                    self.reachable_locations.add(name)
+                else:
+                    self.reachable_locations.discard(name)
+        return changed
+
+    def get_reachable_locations(self) -> set[str]:
+        self.refresh()
+        return self.reachable_locations
+
+    def can_reach_location(self, location_name: str) -> bool:
+        self.refresh()
+        return location_name in self.reachable_locations
+
+    def close(self):
+        """Stop receiving item changes from the world"""
+        if self in self.world.reachability_trackers:
+            self.world.reachability_trackers.remove(self)
@@ -1,7 +1,7 @@
 from BaseClasses import Entrance, MultiWorld, Region
 from .Helpers import is_category_enabled, is_location_enabled
 from .Data import region_table
-from .Locations import ManualLocation, location_name_to_location
+from .Locations import ManualLocation, get_location_data, location_table, lazy_location_lookups, group_locations_by_region
 from worlds.AutoWorld import World
 
 
@@ -21,6 +21,19 @@ regionMap["Manual"] = {
 
 
 def create_regions(world: World, multiworld: MultiWorld, player: int):
+    # The locations are grouped by region once, unless a hook gave this world its own location table
+    if world.location_table is location_table:
+        locations_by_region = lazy_location_lookups.get("region_name_to_locations")
+    else:
+        locations_by_region = group_locations_by_region(world.location_table)
+
+    # The chosen counted goal isn't in the location table, it's added to its region on top of the shared buckets
+    counted_goals = getattr(world, "counted_goal_locations", [])
+    if counted_goals:
+        locations_by_region = {**locations_by_region}
+        for region, locations in group_locations_by_region(counted_goals).items():
+            locations_by_region[region] = [*locations_by_region.get(region, []), *locations]
+
     # Create regions and assign locations to each region
     for region in regionMap:
         if "connects_to" not in regionMap[region]:
@@ -32,11 +45,7 @@ def create_regions(world: World, multiworld: MultiWorld, player: int):
         if not exit_array:
             exit_array = None
 
-        locations = []
-        for location in world.location_table:
-            if "region" in location and location["region"] == region:
-                if is_location_enabled(multiworld, player, location):
-                    locations.append(location["name"])
+        locations = [location["name"] for location in locations_by_region.get(region, []) if is_location_enabled(multiworld, player, location)]
 
         new_region = create_region(world, multiworld, player, region, locations, exit_array)
         multiworld.regions += [new_region]
@@ -60,7 +69,7 @@ def create_region(world: World, multiworld: MultiWorld, player: int, name: str,
         for location in locations:
             loc_id = world.location_name_to_id.get(location, 0)
             locationObj = ManualLocation(player, location, loc_id, ret)
-            if location_name_to_location[location].get('prehint'):
+            if get_location_data(location).get('prehint'):
                 world.options.start_location_hints.value.add(location)
             ret.locations.append(locationObj)
     if exits:
@@ -1,11 +1,13 @@
+from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional
 from enum import IntEnum
 from operator import eq, ge, le
 
 from .Regions import regionMap
+from .Items import lazy_item_lookups
 from .hooks import Rules
 from .Helpers import clamp, is_item_enabled, is_option_enabled, get_option_value, convert_string_to_type,\
-    format_to_valid_identifier, format_state_prog_items_key, ProgItemsCat
+    format_to_valid_identifier, format_state_prog_items_key, ProgItemsCat, state_independent, is_state_independent
 
 from BaseClasses import MultiWorld, CollectionState
 from worlds.AutoWorld import World
@@ -14,6 +16,7 @@ from Options import Choice, Toggle, Range, NamedRange
 
 import re
 import math
+from weakref import WeakKeyDictionary
 import inspect
 import logging
 
@@ -101,207 +104,614 @@ def evaluate_postfix(expr: str, location: str) -> bool:
 
     return stack.pop()
 
-def set_rules(world: "ManualWorld", multiworld: MultiWorld, player: int):
-    # this is only called when the area (think, location or region) has a "requires" field that is a string
-    def checkRequireStringForArea(state: CollectionState, area: dict):
-        requires_list = area["requires"]
-
-        # Get the "real" item counts of item in the pool/placed/starting_items
-        items_counts = world.get_item_counts(player, only_progression=True)
-
-        # Preparing some variables for exception messages
-        area_type = "region" if area.get("is_region",False) else "location"
-        area_name = area.get("name", f"unknown with these parameters: {area}")
-
-        if requires_list == "":
-            return True
-
-        def findAndRecursivelyExecuteFunctions(requires_list: str, recursionDepth: int = 0) -> str:
-            found_functions = re.findall(r'\{(\w+)\((.*?)\)\}', requires_list)
-            if found_functions:
-                if recursionDepth > world.rules_functions_maximum_recursion:
-                    raise RecursionError(f'One or more functions in {area_type} "{area_name}"\'s requires looped too many time (maximum recursion is {world.rules_functions_maximum_recursion}) \
-                                         \n    As of this Exception the following function(s) are waiting to run: {[f[0] for f in found_functions]} \
-                                         \n    And the currently processed requires look like this: "{requires_list}"')
-                else:
-                    for item in found_functions:
-                        func_name = item[0]
-                        func_args = item[1].split(",")
-                        if func_args == ['']:
-                            func_args.pop()
-
-                        func = globals().get(func_name)
-
-                        if func is None:
-                            func = getattr(Rules, func_name, None)
-
-                        if not callable(func):
-                            raise ValueError(f'Invalid function "{func_name}" in {area_type} "{area_name}".')
-
-                        convert_req_function_args(state, func, func_args, area_name)
-                        try:
-                            result = func(*func_args)
-                        except Exception as ex:
-                            raise RuntimeError(f'A call to the function "{func_name}" in {area_type} "{area_name}"\'s requires raised an Exception. \
-                                                \nUnless it was called by another function, it should look something like "{{{func_name}({item[1]})}}" in {area_type}s.json. \
-                                                \nFull error message: \
-                                                \n\n{type(ex).__name__}: {ex}')
-                        if isinstance(result, bool):
-                            requires_list = requires_list.replace("{" + func_name + "(" + item[1] + ")}", "1" if result else "0")
-                        else:
-                            requires_list = requires_list.replace("{" + func_name + "(" + item[1] + ")}", str(result))
-
-                requires_list = findAndRecursivelyExecuteFunctions(requires_list, recursionDepth + 1)
-            return requires_list
-
-        requires_list = findAndRecursivelyExecuteFunctions(requires_list)
-
-        # parse user written statement into list of each item
-        for item in re.findall(r'\|[^|]+\|', requires_list):
-            require_type = 'item'
-
-            if '|@' in item:
-                require_type = 'category'
-
-            item_base = item
-            item = item.lstrip('|@$').rstrip('|')
-
-            item_parts = item.split(":")  # type: list[str]
-            item_name = item
-            item_count = "1"
-
-
-            if len(item_parts) > 1:
-                item_name = item_parts[0].strip()
-                item_count = item_parts[1].strip()
-
-            total = 0
-
-            if require_type == 'category':
-                category_items = [item for item in world.item_name_to_item.values() if "category" in item and item_name in item["category"]]
-                category_items_counts = sum([items_counts.get(category_item["name"], 0) for category_item in category_items])
-                if item_count.lower() == 'all':
-                    item_count = category_items_counts
-                elif item_count.lower() == 'half':
-                    item_count = int(category_items_counts / 2)
-                elif item_count.endswith('%') and len(item_count) > 1:
-                    percent = clamp(float(item_count[:-1]) / 100, 0, 1)
-                    item_count = math.ceil(category_items_counts * percent)
-                else:
-                    try:
-                        item_count = int(item_count)
-                    except ValueError as e:
-                        raise ValueError(f"Invalid item count `{item_name}` in {area}.") from e
-
-                for category_item in category_items:
-                    total += state.count(category_item["name"], player)
-
-                    if total >= item_count:
-                        requires_list = requires_list.replace(item_base, "1")
-            elif require_type == 'item':
-                item_current_count = items_counts.get(item_name, 0)
-                if item_count.lower() == 'all':
-                    item_count = item_current_count
-                elif item_count.lower() == 'half':
-                    item_count = int(item_current_count / 2)
-                elif item_count.endswith('%') and len(item_count) > 1:
-                    percent = clamp(float(item_count[:-1]) / 100, 0, 1)
-                    item_count = math.ceil(item_current_count * percent)
-                else:
-                    item_count = int(item_count)
+######################
+# Compiled requires
+######################
+
+# Operands of a requires are swapped with a single character from this range while it gets compiled
+# They are word characters (like the 1/0 the old interpreter used) so the AND/OR replacements behave the same
+OPERAND_PLACEHOLDER_START = 0xAC00
+OPERAND_PLACEHOLDER_END = 0xD7A3
+
+def get_area_type_and_name(area: dict) -> tuple[str, str]:
+    """Returns the type (location or region) and name of an area for exception messages"""
+    area_type = "region" if area.get("is_region", False) else "location"
+    area_name = area.get("name", f"unknown with these parameters: {area}")
+    return area_type, area_name
+
+def resolve_relative_count(item_count: str, total: int) -> Optional[int]:
+    """Convert the 'all', 'half' and 'x%' counts of a requires to a number using the total in the pool.
+    \nReturns None if item_count is not one of those."""
+    if item_count.lower() == 'all':
+        return total
+    elif item_count.lower() == 'half':
+        return int(total / 2)
+    elif item_count.endswith('%') and len(item_count) > 1:
+        percent = clamp(float(item_count[:-1]) / 100, 0, 1)
+        return math.ceil(total * percent)
+    return None
+
+def is_relative_count(item_count: str) -> bool:
+    return item_count.lower() in ['all', 'half'] or (item_count.endswith('%') and len(item_count) > 1)
+
+class Requirement(ABC):
+    """A compiled 'requires', call it with a CollectionState to check if it's fulfilled.
+    \nThey are built once by compile_requires when the rules are set, so no parsing happens during fill."""
+    __slots__ = ()
+
+    @abstractmethod
+    def __call__(self, state: CollectionState) -> bool:
+        ...
+
+class ConstantRequirement(Requirement):
+    __slots__ = ("value",)
+
+    def __init__(self, value: bool):
+        self.value = value
+
+    def __call__(self, state: CollectionState) -> bool:
+        return self.value
+
+class ItemRequirement(Requirement):
+    """|Item Name:count|"""
+    __slots__ = ("world", "player", "item_name", "count", "relative_count")
+
+    def __init__(self, world: "ManualWorld", item_name: str, count: int, relative_count: Optional[str] = None):
+        self.world = world
+        self.player = world.player
+        self.item_name = item_name
+        self.count = count
+        self.relative_count = relative_count
+
+    def required_count(self) -> int:
+        if self.relative_count is None:
+            return self.count
+        items_counts = self.world.get_item_counts(self.player, only_progression=True)
+        return resolve_relative_count(self.relative_count, items_counts.get(self.item_name, 0))
+
+    def __call__(self, state: CollectionState) -> bool:
+        return state.has(self.item_name, self.player, self.required_count())
+
+class CategoryRequirement(Requirement):
+    """|@Category Name:count|
+    \nThe number of items collected in the category is kept up to date in the state by ManualWorld.collect/remove"""
+    __slots__ = ("world", "player", "category_name", "category_key", "item_names", "count", "relative_count")
+
+    def __init__(self, world: "ManualWorld", category_name: str, item_names: frozenset[str], count: int, relative_count: Optional[str] = None):
+        self.world = world
+        self.player = world.player
+        self.category_name = category_name
+        self.category_key = format_state_prog_items_key(ProgItemsCat.CATEGORY, category_name)
+        self.item_names = item_names
+        self.count = count
+        self.relative_count = relative_count
+
+    def required_count(self) -> int:
+        if self.relative_count is None:
+            return self.count
+        items_counts = self.world.get_item_counts(self.player, only_progression=True)
+        return resolve_relative_count(self.relative_count, sum([items_counts.get(name, 0) for name in self.item_names]))
+
+    def __call__(self, state: CollectionState) -> bool:
+        if not self.item_names: # an empty category is never fulfilled, even with a count of 0
+            return False
+        return state.prog_items[self.player][self.category_key] >= self.required_count()
+
+class AndRequirement(Requirement):
+    __slots__ = ("requirements",)
+
+    def __init__(self, requirements: list[Requirement]):
+        self.requirements = tuple(requirements)
+
+    def __call__(self, state: CollectionState) -> bool:
+        for requirement in self.requirements:
+            if not requirement(state):
+                return False
+        return True
 
-                total = state.count(item_name, player)
+class OrRequirement(Requirement):
+    __slots__ = ("requirements",)
 
-                if total >= item_count:
-                    requires_list = requires_list.replace(item_base, "1")
+    def __init__(self, requirements: list[Requirement]):
+        self.requirements = tuple(requirements)
 
-            if total <= item_count:
-                requires_list = requires_list.replace(item_base, "0")
+    def __call__(self, state: CollectionState) -> bool:
+        for requirement in self.requirements:
+            if requirement(state):
+                return True
+        return False
+
+def make_and_requirement(requirements: list[Requirement]) -> Requirement:
+    """An AndRequirement of the requirements, nested Ands are flattened into it and the ones that are always true are left out.
+    \nReturns the requirement itself if there's only one, or a ConstantRequirement(True) if there's none left."""
+    children: list[Requirement] = []
+    for requirement in requirements:
+        if type(requirement) is AndRequirement:
+            children.extend(requirement.requirements)
+        elif not (isinstance(requirement, ConstantRequirement) and requirement.value):
+            children.append(requirement)
+    if not children:
+        return ConstantRequirement(True)
+    if len(children) == 1:
+        return children[0]
+    return AndRequirement(children)
+
+def make_or_requirement(requirements: list[Requirement]) -> Requirement:
+    """Same as make_and_requirement for an OrRequirement, the ones that are always false are left out"""
+    children: list[Requirement] = []
+    for requirement in requirements:
+        if type(requirement) is OrRequirement:
+            children.extend(requirement.requirements)
+        elif not (isinstance(requirement, ConstantRequirement) and not requirement.value):
+            children.append(requirement)
+    if not children:
+        return ConstantRequirement(False)
+    if len(children) == 1:
+        return children[0]
+    return OrRequirement(children)
+
+class NotRequirement(Requirement):
+    __slots__ = ("requirement",)
+
+    def __init__(self, requirement: Requirement):
+        self.requirement = requirement
+
+    def __call__(self, state: CollectionState) -> bool:
+        return not self.requirement(state)
+
+class SharedRequirement(Requirement):
+    """A Requirement checked by many rules, like a region's requires for all the locations in it.
+    \nIts result is kept per state until that state collects or removes an item (see ManualWorld.collect/remove)."""
+    __slots__ = ("world", "requirement", "results")
+
+    def __init__(self, world: "ManualWorld", requirement: Requirement):
+        self.world = world
+        self.requirement = requirement
+        self.results: WeakKeyDictionary[CollectionState, tuple[int, bool]] = WeakKeyDictionary()
+
+    def __call__(self, state: CollectionState) -> bool:
+        version = get_state_version(self.world, state)
+        result = self.results.get(state)
+        if result is None or result[0] != version:
+            result = (version, self.requirement(state))
+            self.results[state] = result
+        return result[1]
+
+def get_state_version(world: "ManualWorld", state: CollectionState) -> int:
+    if not hasattr(world, 'state_versions'):
+        world.state_versions = WeakKeyDictionary()
+    return world.state_versions.get(state, 0)
+
+def bump_state_version(world: "ManualWorld", state: CollectionState):
+    """Called when the items of a player change in a state, invalidating the SharedRequirement results for it"""
+    if not hasattr(world, 'state_versions'):
+        world.state_versions = WeakKeyDictionary()
+    world.state_versions[state] = world.state_versions.get(state, 0) + 1
+
+class FunctionRequirement(Requirement):
+    """A requires that contains {functions()}.
+    \nThe functions are called on every check and their results are put back in the requires like they've always been,
+    but each distinct resulting requires is only compiled the first time it is seen."""
+    __slots__ = ("world", "area", "segments", "calls", "recursion_depth", "compiled_results")
+
+    def __init__(self, world: "ManualWorld", area: dict, segments: list[str], calls: list["RequiresFunctionCall"], recursion_depth: int):
+        self.world = world
+        self.area = area
+        self.segments = tuple(segments)
+        self.calls = tuple(calls)
+        self.recursion_depth = recursion_depth
+        self.compiled_results: dict[str, Requirement] = {}
+
+    def __call__(self, state: CollectionState) -> bool:
+        pieces = [self.segments[0]]
+        for call, segment in zip(self.calls, self.segments[1:]):
+            pieces.append(format_requires_function_result(call_requires_function(call, state, self.area)))
+            pieces.append(segment)
+
+        requires = "".join(pieces)
+        requirement = self.compiled_results.get(requires)
+        if requirement is None:
+            requirement = compile_requires_string(self.world, requires, self.area, self.recursion_depth + 1)
+            self.compiled_results[requires] = requirement
+        return requirement(state)
+
+def get_requirement_dependencies(requirement: Requirement) -> Optional[frozenset[str]]:
+    """Returns the state.prog_items keys (item names and category keys) a Requirement looks at.
+    \nReturns None if it can't be known ahead of time, like when it calls requires functions."""
+    if isinstance(requirement, ConstantRequirement):
+        return frozenset()
+    if isinstance(requirement, ItemRequirement):
+        return frozenset((requirement.item_name,))
+    if isinstance(requirement, CategoryRequirement):
+        return frozenset((requirement.category_key,))
+    if isinstance(requirement, (NotRequirement, SharedRequirement)):
+        return get_requirement_dependencies(requirement.requirement)
+    if isinstance(requirement, (AndRequirement, OrRequirement)):
+        dependencies = set()
+        for child in requirement.requirements:
+            child_dependencies = get_requirement_dependencies(child)
+            if child_dependencies is None:
+                return None
+            dependencies.update(child_dependencies)
+        return frozenset(dependencies)
+    return None
+
+def compile_requires(world: "ManualWorld", area: dict) -> Requirement:
+    """Compile the requires of an area (think, location or region) into a Requirement"""
+    # if it's not a usable object of some sort, default to true
+    if not area:
+        return ConstantRequirement(True)
+
+    # don't require the "requires" key for locations and regions if they don't need to use it
+    if "requires" not in area.keys():
+        return ConstantRequirement(True)
+
+    if isinstance(area["requires"], str):
+        if area["requires"] == "":
+            return ConstantRequirement(True)
+        return compile_requires_string(world, area["requires"], area)
+    else:  # item access is in dict form
+        return compile_requires_dict(world, area)
+
+def compile_requires_string(world: "ManualWorld", requires: str, area: dict, recursion_depth: int = 0) -> Requirement:
+    found_functions = list(re.finditer(r'\{(\w+)\((.*?)\)\}', requires))
+    if found_functions:
+        if recursion_depth > world.rules_functions_maximum_recursion:
+            area_type, area_name = get_area_type_and_name(area)
+            raise RecursionError(f'One or more functions in {area_type} "{area_name}"\'s requires looped too many time (maximum recursion is {world.rules_functions_maximum_recursion}) \
+                                 \n    As of this Exception the following function(s) are waiting to run: {[f.group(1) for f in found_functions]} \
+                                 \n    And the currently processed requires look like this: "{requires}"')
+
+        segments = []
+        calls = []
+        literal = []
+        last_end = 0
+        for found in found_functions:
+            literal.append(requires[last_end:found.start()])
+            call = get_requires_function_call(world, found.group(1), found.group(2), area)
+            if is_state_independent(call.func):
+                # the result will never change for this player, so put it in the requires right now
+                literal.append(get_state_independent_function_result(world, call, area))
+            else:
+                segments.append("".join(literal))
+                literal = []
+                calls.append(call)
+            last_end = found.end()
+        literal.append(requires[last_end:])
+        segments.append("".join(literal))
 
-        requires_list = re.sub(r'\s?\bAND\b\s?', '&', requires_list, count=0, flags=re.IGNORECASE)
-        requires_list = re.sub(r'\s?\bOR\b\s?', '|', requires_list, count=0, flags=re.IGNORECASE)
+        if not calls:
+            return compile_requires_string(world, segments[0], area, recursion_depth + 1)
 
-        requires_string = infix_to_postfix("".join(requires_list), area)
-        return (evaluate_postfix(requires_string, area))
+        return FunctionRequirement(world, area, segments, calls, recursion_depth)
 
-    # this is only called when the area (think, location or region) has a "requires" field that is a dict
-    def checkRequireDictForArea(state: CollectionState, area: dict):
-        canAccess = True
+    return compile_requires_expression(world, requires, area)
 
-        for item in area["requires"]:
-            # if the require entry is an object with "or" or a list of items, treat it as a standalone require of its own
-            if (isinstance(item, dict) and "or" in item and isinstance(item["or"], list)) or (isinstance(item, list)):
-                canAccessOr = True
-                or_items = item
+# The parsed form of each requires string, it only depends on the string so every player shares it
+parsed_requires_expressions: dict[str, tuple[dict[str, str], tuple]] = {}
 
-                if isinstance(item, dict):
-                    or_items = item["or"]
+def parse_requires_expression(requires: str, area: dict) -> tuple[dict[str, str], tuple]:
+    """Returns the |item| operands of a requires string by their placeholder, and the postfix form of the string using those placeholders"""
+    if requires in parsed_requires_expressions:
+        return parsed_requires_expressions[requires]
 
-                for or_item in or_items:
-                    or_item_parts = or_item.split(":")
-                    or_item_name = or_item
-                    or_item_count = 1
+    expression = requires
+    placeholders: dict[str, str] = {}
 
-                    if len(or_item_parts) > 1:
-                        or_item_name = or_item_parts[0]
-                        or_item_count = int(or_item_parts[1])
+    # parse user written statement into list of each item
+    for item in re.findall(r'\|[^|]+\|', expression):
+        if item in placeholders:
+            continue
+        placeholder = chr(OPERAND_PLACEHOLDER_START + len(placeholders))
+        if ord(placeholder) > OPERAND_PLACEHOLDER_END:
+            raise ValueError(f"Too many items in the requires of {get_area_type_and_name(area)[1]}.")
+        placeholders[item] = placeholder
+        expression = expression.replace(item, placeholder)
 
-                    if not state.has(or_item_name, player, or_item_count):
-                        canAccessOr = False
+    expression = re.sub(r'\s?\bAND\b\s?', '&', expression, count=0, flags=re.IGNORECASE)
+    expression = re.sub(r'\s?\bOR\b\s?', '|', expression, count=0, flags=re.IGNORECASE)
 
-                if canAccessOr:
-                    canAccess = True
-                    break
-            else:
-                item_parts = item.split(":")
-                item_name = item
-                item_count = 1
+    operands = {placeholder: item for item, placeholder in placeholders.items()}
+    postfix = tuple(requires_to_postfix(expression, {placeholder: placeholder for placeholder in operands}, area))
+    parsed_requires_expressions[requires] = (operands, postfix)
+    return operands, postfix
+
+def compile_requires_expression(world: "ManualWorld", requires: str, area: dict) -> Requirement:
+    operand_items, postfix = parse_requires_expression(requires, area)
+    operands = {placeholder: compile_requires_item(world, item, area) for placeholder, item in operand_items.items()}
+
+    return build_requirement_tree([operands.get(c, c) if isinstance(c, str) else c for c in postfix], area)
+
+def compile_requires_item(world: "ManualWorld", item: str, area: dict) -> Requirement:
+    require_type = 'item'
+
+    if '|@' in item:
+        require_type = 'category'
+
+    item = item.lstrip('|@$').rstrip('|')
+
+    item_parts = item.split(":")  # type: list[str]
+    item_name = item
+    item_count = "1"
+
+    if len(item_parts) > 1:
+        item_name = item_parts[0].strip()
+        item_count = item_parts[1].strip()
+
+    relative_count = item_count if is_relative_count(item_count) else None
+    count = 0
+
+    if require_type == 'category':
+        category_items = lazy_item_lookups.get("category_name_to_item_names").get(item_name, frozenset())
+        if relative_count is None:
+            try:
+                count = int(item_count)
+            except ValueError as e:
+                raise ValueError(f"Invalid item count `{item_name}` in {area}.") from e
+        return CategoryRequirement(world, item_name, category_items, count, relative_count)
+
+    if relative_count is None:
+        count = int(item_count)
+    return ItemRequirement(world, item_name, count, relative_count)
+
+def requires_to_postfix(expr: str, operands: dict[str, Requirement], area: dict) -> list:
+    """Same as infix_to_postfix but it keeps the compiled operands instead of 1 and 0"""
+    prec = {"&": 2, "|": 2, "!": 3}
+    stack = []
+    postfix = []
+
+    try:
+        for c in expr:
+            if c in operands:
+                postfix.append(operands[c])
+            elif c == "1" or c == "0":
+                postfix.append(ConstantRequirement(c == "1"))
+            elif c in prec:
+                while stack and stack[-1] != "(" and prec[c] <= prec[stack[-1]]:
+                    postfix.append(stack.pop())
+                stack.append(c)
+            elif c == "(":
+                stack.append(c)
+            elif c == ")":
+                while stack and stack[-1] != "(":
+                    postfix.append(stack.pop())
+                stack.pop()
+
+        while stack:
+            postfix.append(stack.pop())
+    except Exception:
+        raise construct_logic_error(area, LogicErrorSource.INFIX_TO_POSTFIX)
+
+    return postfix
+
+def build_requirement_tree(postfix: list, area: dict) -> Requirement:
+    """Same as evaluate_postfix but it builds the Requirement instead of a result"""
+    stack: list[Requirement] = []
+
+    try:
+        for c in postfix:
+            if isinstance(c, Requirement):
+                stack.append(c)
+            elif c == "&" or c == "|":
+                op2 = stack.pop()
+                op1 = stack.pop()
+                # flatten chains of the same operator so "a and b and c" is a single step
+                make_requirement = make_and_requirement if c == "&" else make_or_requirement
+                stack.append(make_requirement([op1, op2]))
+            elif c == "!":
+                op = stack.pop()
+                stack.append(NotRequirement(op))
+    except Exception:
+        raise construct_logic_error(area, LogicErrorSource.EVALUATE_POSTFIX)
+
+    if len(stack) != 1:
+        raise construct_logic_error(area, LogicErrorSource.EVALUATE_STACK_SIZE)
+
+    return stack.pop()
 
-                if len(item_parts) > 1:
-                    item_name = item_parts[0]
-                    item_count = int(item_parts[1])
+# this is only used when the area (think, location or region) has a "requires" field that is a dict
+def compile_requires_dict(world: "ManualWorld", area: dict) -> Requirement:
+    player = world.player
+    groups: list[Requirement] = []
+    required: list[Requirement] = []
 
-                if not state.has(item_name, player, item_count):
-                    canAccess = False
+    def split_item(item: str) -> Requirement:
+        item_parts = item.split(":")
+        item_name = item
+        item_count = 1
 
-        return canAccess
+        if len(item_parts) > 1:
+            item_name = item_parts[0]
+            item_count = int(item_parts[1])
 
-    # handle any type of checking needed, then ferry the check off to a dedicated method for that check
-    def fullLocationOrRegionCheck(state: CollectionState, area: dict):
-        # if it's not a usable object of some sort, default to true
-        if not area:
-            return True
+        return ItemRequirement(world, item_name, item_count)
 
-        # don't require the "requires" key for locations and regions if they don't need to use it
-        if "requires" not in area.keys():
-            return True
+    for item in area["requires"]:
+        # if the require entry is an object with "or" or a list of items, treat it as a standalone require of its own
+        if (isinstance(item, dict) and "or" in item and isinstance(item["or"], list)) or (isinstance(item, list)):
+            or_items = item
 
-        if isinstance(area["requires"], str):
-            return checkRequireStringForArea(state, area)
-        else:  # item access is in dict form
-            return checkRequireDictForArea(state, area)
+            if isinstance(item, dict):
+                or_items = item["or"]
+
+            # any one of those standalone requires being fulfilled grants access
+            groups.append(make_and_requirement([split_item(or_item) for or_item in or_items]))
+        else:
+            required.append(split_item(item))
+
+    # an empty requires, like the Manual region's [], is always true
+    if not groups:
+        return make_and_requirement(required)
+    return make_or_requirement(groups + [make_and_requirement(required)])
+
+def get_requires_function(func_name: str, area: dict):
+    func = globals().get(func_name)
+
+    if func is None:
+        func = getattr(Rules, func_name, None)
+
+    if not callable(func):
+        area_type, area_name = get_area_type_and_name(area)
+        raise ValueError(f'Invalid function "{func_name}" in {area_type} "{area_name}".')
+
+    return func
+
+def format_requires_function_result(result) -> str:
+    if isinstance(result, bool):
+        return "1" if result else "0"
+    return str(result)
+
+def get_state_independent_function_result(world: "ManualWorld", call: "RequiresFunctionCall", area: dict) -> str:
+    """Call a function marked with @state_independent once per player and arguments, then reuse its result"""
+    if not hasattr(world, 'state_independent_function_cache'):
+        world.state_independent_function_cache = dict[tuple[str, str], str]()
+
+    cacheindex = (call.func_name, call.raw_args)
+    if cacheindex not in world.state_independent_function_cache:
+        result = call_requires_function(call, None, area)
+        world.state_independent_function_cache[cacheindex] = format_requires_function_result(result)
+
+    return world.state_independent_function_cache[cacheindex]
+
+# Stands in for the CollectionState while the arguments of a function call get converted
+REQUIRES_FUNCTION_STATE_SLOT = object()
+
+class RequiresFunctionCall:
+    """A {function(args)} from a requires with its arguments already converted.
+    \nThe world, multiworld and player are bound once, only the state is inserted when it's called."""
+    __slots__ = ("func", "func_name", "raw_args", "args", "state_indexes")
+
+    def __init__(self, world: "ManualWorld", func, func_name: str, raw_args: str, area: dict):
+        self.func = func
+        self.func_name = func_name
+        self.raw_args = raw_args
+
+        func_args = raw_args.split(",")
+        if func_args == ['']:
+            func_args.pop()
+
+        convert_req_function_args(world, REQUIRES_FUNCTION_STATE_SLOT, func, func_args, get_area_type_and_name(area)[1])
+        self.state_indexes = tuple(i for i, arg in enumerate(func_args) if arg is REQUIRES_FUNCTION_STATE_SLOT)
+        self.args = tuple(func_args)
+
+    def __call__(self, state: Optional[CollectionState]):
+        if not self.state_indexes:
+            return self.func(*self.args)
+
+        args = list(self.args)
+        for index in self.state_indexes:
+            args[index] = state
+        return self.func(*args)
+
+def get_requires_function_call(world: "ManualWorld", func_name: str, raw_args: str, area: dict) -> RequiresFunctionCall:
+    """Returns the call of a function with those raw arguments for this player, it is only resolved the first time"""
+    if not hasattr(world, 'requires_function_calls'):
+        world.requires_function_calls = dict[tuple[str, str], RequiresFunctionCall]()
+
+    cacheindex = (func_name, raw_args)
+    if cacheindex not in world.requires_function_calls:
+        func = get_requires_function(func_name, area)
+        world.requires_function_calls[cacheindex] = RequiresFunctionCall(world, func, func_name, raw_args, area)
+
+    return world.requires_function_calls[cacheindex]
+
+def call_requires_function(call: RequiresFunctionCall, state: Optional[CollectionState], area: dict):
+    try:
+        return call(state)
+    except Exception as ex:
+        area_type, area_name = get_area_type_and_name(area)
+        raise RuntimeError(f'A call to the function "{call.func_name}" in {area_type} "{area_name}"\'s requires raised an Exception. \
+                            \nUnless it was called by another function, it should look something like "{{{call.func_name}({call.raw_args})}}" in {area_type}s.json. \
+                            \nFull error message: \
+                            \n\n{type(ex).__name__}: {ex}')
+
+def convert_req_function_args(world: "ManualWorld", state: CollectionState, func, args: list[str], areaName: str):
+    multiworld = world.multiworld
+    player = world.player
+    parameters = inspect.signature(func).parameters
+    knownParameters = [World, 'ManualWorld', MultiWorld, CollectionState]
+    index = -1
+    for parameter in parameters.values():
+        target_type = parameter.annotation
+        index += 1
+        if target_type in knownParameters:
+            if target_type in [World, 'ManualWorld']:
+                args.insert(index, world)
+            elif target_type == MultiWorld:
+                args.insert(index, multiworld)
+            elif target_type == CollectionState:
+                args.insert(index, state)
+            continue
+        if parameter.name.lower() == "player":
+            args.insert(index, player)
+            continue
+
+        if index < len(args) and args[index] != "":
+            value = args[index].strip()
+        else:
+            if parameter.default is not inspect.Parameter.empty:
+                if index < len(args):
+                    args[index] = parameter.default
+                else:
+                    args.insert(index, parameter.default)
+                continue
+            else:
+                if parameter.annotation is inspect.Parameter.empty:
+                    raise Exception(f"A call of the \"{func.__name__}\" function in \"{areaName}\"'s requirement, asks for a value for its argument \"{parameter.name}\" but it's missing.")
+                else:
+                    raise Exception(f"A call of the \"{func.__name__}\" function in \"{areaName}\"'s requirement, asks for a value of type {target_type} for its argument \"{parameter.name}\" but it's missing.")
+
+        if target_type == str or parameter.annotation is inspect.Parameter.empty: #Don't convert since its already a string or if we don't know the type to convert to
+            args[index] = value
+            continue
+
+        try:
+            value = convert_string_to_type(value, target_type)
+
+        except Exception as e:
+            raise Exception(f"A call of the \"{func.__name__}\" function in \"{areaName}\"'s requirement, asks for a value of type {target_type}\nfor its argument \"{parameter.name}\" but its value \"{value}\" cannot be converted to {target_type} \nOriginal Error:'{e}'")
+
+        args[index] = value
+
+def set_rules(world: "ManualWorld", multiworld: MultiWorld, player: int):
+    used_location_names = set()
+    # The compiled requirements are kept so the rules can be inspected later, see Reachability.py
+    world.location_requirements = {}
+    world.entrance_requirements = {}
+    world.entrance_access_rules = {} # the access_rule each entrance had once its requirements were added
+
+    def add_entrance_requirement(entrance, requirement: Requirement):
+        add_rule(entrance, requirement)
+        world.entrance_requirements.setdefault(entrance.name, []).append(requirement)
+        world.entrance_access_rules[entrance.name] = entrance.access_rule
+
+    # Each region's requires is compiled once and its result shared by all the locations of that region
+    # The areas given to compile_requires are copies so regionMap is never modified here
+    region_requirements: dict[str, Requirement] = {}
+
+    def get_region_requirement(region_name: str) -> Requirement:
+        if region_name not in region_requirements:
+            requirement = compile_requires(world, {**regionMap[region_name], "name": region_name, "is_region": True})
+            if not isinstance(requirement, ConstantRequirement):
+                requirement = SharedRequirement(world, requirement)
+            region_requirements[region_name] = requirement
+        return region_requirements[region_name]
 
-    used_location_names = []
     # Region access rules
     for region in regionMap.keys():
-        used_location_names.extend([l.name for l in multiworld.get_region(region, player).locations])
+        used_location_names.update(l.name for l in multiworld.get_region(region, player).locations)
         if region != "Menu":
             for exitRegion in multiworld.get_region(region, player).entrances:
-                def fullRegionCheck(state: CollectionState, region=regionMap[region], region_name=exitRegion.name):
-                    region['name'] = region_name
-                    region['is_region'] = True
-
-                    return fullLocationOrRegionCheck(state, region)
-
-                add_rule(world.get_entrance(exitRegion.name), fullRegionCheck)
+                area = {**regionMap[region], "name": exitRegion.name, "is_region": True}
+                add_entrance_requirement(world.get_entrance(exitRegion.name), compile_requires(world, area))
             entrance_rules = regionMap[region].get("entrance_requires", {})
             for e in entrance_rules:
                 entrance = world.get_entrance(f'{e}To{region}')
-                add_rule(entrance, lambda state, rule={"requires": entrance_rules[e]}: fullLocationOrRegionCheck(state, rule))
+                add_entrance_requirement(entrance, compile_requires(world, {"requires": entrance_rules[e]}))
             exit_rules = regionMap[region].get("exit_requires", {})
             for e in exit_rules:
                 exit = world.get_entrance(f'{region}To{e}')
-                add_rule(exit, lambda state, rule={"requires": exit_rules[e]}: fullLocationOrRegionCheck(state, rule))
+                add_entrance_requirement(exit, compile_requires(world, {"requires": exit_rules[e]}))
 
     # Location access rules
     for location in world.location_table:
@@ -310,83 +720,23 @@ def set_rules(world: "ManualWorld", multiworld: MultiWorld, player: int):
 
         locFromWorld = multiworld.get_location(location["name"], player)
 
-        locationRegion = regionMap[location["region"]] if "region" in location else None
-
-        if locationRegion:
-            locationRegion['name'] = location['region']
-            locationRegion['is_region'] = True
+        # the region requirement defaults to true unless there's a region with requires
+        regionRequirement = get_region_requirement(location["region"]) if "region" in location else ConstantRequirement(True)
 
         if "requires" in location: # Location has requires, check them alongside the region requires
-            def checkBothLocationAndRegion(state: CollectionState, location=location, region=locationRegion):
-                locationCheck = fullLocationOrRegionCheck(state, location)
-                regionCheck = True # default to true unless there's a region with requires
-
-                if region:
-                    regionCheck = fullLocationOrRegionCheck(state, region)
-
-                return locationCheck and regionCheck
-
-            set_rule(locFromWorld, checkBothLocationAndRegion)
+            # a region that's always accessible adds nothing to the location's rule
+            requirement = make_and_requirement([compile_requires(world, location), regionRequirement])
         elif "region" in location: # Only region access required, check the location's region's requires
-            def fullRegionCheck(state, region=locationRegion):
-                return fullLocationOrRegionCheck(state, region)
-
-            set_rule(locFromWorld, fullRegionCheck)
+            requirement = regionRequirement
         else: # No location region and no location requires? It's accessible.
-            def allRegionsAccessible(state):
-                return True
+            requirement = ConstantRequirement(True)
 
-            set_rule(locFromWorld, allRegionsAccessible)
+        set_rule(locFromWorld, requirement)
+        world.location_requirements[locFromWorld.name] = requirement
 
     # Victory requirement
     multiworld.completion_condition[player] = lambda state: state.has("__Victory__", player)
 
-    def convert_req_function_args(state: CollectionState, func, args: list[str], areaName: str):
-        parameters = inspect.signature(func).parameters
-        knownParameters = [World, 'ManualWorld', MultiWorld, CollectionState]
-        index = -1
-        for parameter in parameters.values():
-            target_type = parameter.annotation
-            index += 1
-            if target_type in knownParameters:
-                if target_type in [World, 'ManualWorld']:
-                    args.insert(index, world)
-                elif target_type == MultiWorld:
-                    args.insert(index, multiworld)
-                elif target_type == CollectionState:
-                    args.insert(index, state)
-                continue
-            if parameter.name.lower() == "player":
-                args.insert(index, player)
-                continue
-
-            if index < len(args) and args[index] != "":
-                value = args[index].strip()
-            else:
-                if parameter.default is not inspect.Parameter.empty:
-                    if index < len(args):
-                        args[index] = parameter.default
-                    else:
-                        args.insert(index, parameter.default)
-                    continue
-                else:
-                    if parameter.annotation is inspect.Parameter.empty:
-                        raise Exception(f"A call of the \"{func.__name__}\" function in \"{areaName}\"'s requirement, asks for a value for its argument \"{parameter.name}\" but it's missing.")
-                    else:
-                        raise Exception(f"A call of the \"{func.__name__}\" function in \"{areaName}\"'s requirement, asks for a value of type {target_type} for its argument \"{parameter.name}\" but it's missing.")
-
-            if target_type == str or parameter.annotation is inspect.Parameter.empty: #Don't convert since its already a string or if we don't know the type to convert to
-                args[index] = value
-                continue
-
-            try:
-                value = convert_string_to_type(value, target_type)
-
-            except Exception as e:
-                raise Exception(f"A call of the \"{func.__name__}\" function in \"{areaName}\"'s requirement, asks for a value of type {target_type}\nfor its argument \"{parameter.name}\" but its value \"{value}\" cannot be converted to {target_type} \nOriginal Error:'{e}'")
-
-            args[index] = value
-
 
 def ItemValue(state: CollectionState, player: int, valueCount: str):
     """When passed a string with this format: 'valueName:int',
@@ -431,8 +781,7 @@ def OptOne(world: "ManualWorld", item: str, items_counts: Optional[dict] = None)
     if require_type == 'category':
         if item_count.isnumeric():
             #Only loop if we can use the result to clamp
-            category_items = [item for item in world.item_name_to_item.values() if "category" in item and item_name in item["category"]]
-            category_items_counts = sum([items_counts.get(category_item["name"], 0) for category_item in category_items])
+            category_items_counts = sum([items_counts.get(category_item, 0) for category_item in lazy_item_lookups.get("category_name_to_item_names").get(item_name, [])])
             item_count = clamp(int(item_count), 0, category_items_counts)
         return f"|@{item_name}:{item_count}|"
     elif require_type == 'item':
@@ -475,15 +824,18 @@ def canReachLocation(state: CollectionState, player: int, location: str):
         return True
     return False
 
+@state_independent
 def YamlEnabled(multiworld: MultiWorld, player: int, param: str) -> bool:
     """Is a yaml option enabled?"""
     return is_option_enabled(multiworld, player, param)
 
+@state_independent
 def YamlDisabled(multiworld: MultiWorld, player: int, param: str) -> bool:
     """Is a yaml option disabled?"""
     return not is_option_enabled(multiworld, player, param)
 
-def YamlCompare(world: "ManualWorld", multiworld: MultiWorld, state: CollectionState, player: int, args: str, skipCache: bool = False) -> bool:
+@state_independent
+def YamlCompare(world: "ManualWorld", multiworld: MultiWorld, player: int, args: str, skipCache: bool = False) -> bool:
     """Is a yaml option's value compared using {comparator} to the requested value
     \nFormat it like {YamlCompare(OptionName==value)}
     \nWhere == can be any of the following: ==, !=, >=, <=, <, >
@@ -0,0 +1,111 @@
+import hashlib
+import logging
+import os
+import pickle
+import pkgutil
+import sys
+from typing import Any, Optional
+
+########################################################################################
+## The data snapshot: the tables of Data.py after the after_load hooks, and the lookups
+## Items.py and Locations.py build from them, pickled together in the user's cache folder.
+##
+## The snapshot is keyed on a hash of everything that goes into those tables (the data
+## files, the hooks and the modules processing them), so any change makes a new one.
+## Set use_data_snapshot to False in hooks/Data.py if your after_load hooks do more than
+## change the tables they're given, since they are not called when a snapshot is used.
+########################################################################################
+
+snapshot_version = 1
+
+# The files the snapshot is made from, relative to this apworld
+snapshot_sources = [
+    "data/game.json", "data/items.json", "data/locations.json", "data/regions.json",
+    "data/categories.json", "data/options.json", "data/meta.json",
+    "Data.py", "Items.py", "Locations.py", "Game.py", "GameInfo.py", "Helpers.py", "Snapshot.py",
+    "hooks/__init__.py",
+]
+
+# Parts are stored in this order during the import, the snapshot is written once they are all there.
+# They must only contain builtin types and types from modules loaded before Data.py (like BaseClasses),
+# since the snapshot is unpickled while Data.py is being imported.
+snapshot_parts = ("tables", "items", "locations")
+
+_loaded_snapshot: Optional[dict[str, Any]] = None
+_stored_parts: dict[str, Any] = {}
+_snapshot_key: Optional[str] = None
+
+def is_snapshot_enabled() -> bool:
+    from .hooks.Data import use_data_snapshot
+    return use_data_snapshot
+
+def get_snapshot_sources() -> list[str]:
+    """The snapshot sources and every module of the hooks folder, since the after_load hooks can use any of them"""
+    from . import hooks
+    hook_modules = sorted(module.name for module in pkgutil.iter_modules(hooks.__path__) if not module.ispkg)
+    return [*snapshot_sources, *(f"hooks/{name}.py" for name in hook_modules)]
+
+def get_snapshot_key() -> str:
+    """A hash of the snapshot version, the python version and every snapshot source"""
+    global _snapshot_key
+    if _snapshot_key is None:
+        digest = hashlib.sha256(f"{snapshot_version}|{sys.version}".encode())
+        for source in get_snapshot_sources():
+            try:
+                data = pkgutil.get_data(__name__, source) or b""
+            except Exception:
+                data = b""
+            digest.update(source.encode() + b"\0" + hashlib.sha256(data).digest())
+        _snapshot_key = digest.hexdigest()
+    return _snapshot_key
+
+def get_snapshot_path() -> Optional[str]:
+    try:
+        from Utils import cache_path
+        return cache_path("manual_snapshots", f"{__name__.split('.')[-2]}_{get_snapshot_key()[:32]}.pickle")
+    except Exception: # no cache folder, the snapshot isn't used
+        return None
+
+def load_snapshot_part(name: str) -> Optional[Any]:
+    """Returns a part of the snapshot, or None if there's no snapshot for the current data"""
+    global _loaded_snapshot
+    if not is_snapshot_enabled():
+        return None
+    if _loaded_snapshot is None:
+        _loaded_snapshot = {}
+        path = None
+        try:
+            path = get_snapshot_path()
+            if path and os.path.isfile(path):
+                with open(path, "rb") as file:
+                    snapshot = pickle.load(file)
+                if isinstance(snapshot, dict) and snapshot.get("key") == get_snapshot_key() and all(part in snapshot for part in snapshot_parts):
+                    _loaded_snapshot = snapshot
+        except Exception as ex: # anything wrong with the snapshot only means the data is processed again
+            logging.debug(f"Could not load the data snapshot '{path}': {type(ex).__name__}: {ex}")
+    return _loaded_snapshot.get(name)
+
+def store_snapshot_part(name: str, value: Any):
+    """Keep a part for the snapshot, once every part is there the snapshot is written.
+    \nThe parts are pickled together so objects shared between them (like the item definitions) stay shared."""
+    if not is_snapshot_enabled():
+        return
+    _stored_parts[name] = value
+    if any(part not in _stored_parts for part in snapshot_parts):
+        return
+
+    path = get_snapshot_path()
+    if path:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(temp_path, "wb") as file:
+                    pickle.dump({"key": get_snapshot_key(), **_stored_parts}, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        except Exception as ex: # a hook put something that can't be pickled in a table, or the cache folder can't be written
+            logging.debug(f"Could not write the data snapshot '{path}': {type(ex).__name__}: {ex}")
+    _stored_parts.clear()
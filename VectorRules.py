@@ -0,0 +1,198 @@
+from typing import TYPE_CHECKING, Optional
+
+from BaseClasses import CollectionState, Location
+
+from .Rules import Requirement, ConstantRequirement, ItemRequirement, CategoryRequirement, AndRequirement, OrRequirement, NotRequirement, \
+    SharedRequirement
+
+try:
+    import numpy as np
+except ImportError: # numpy is optional, without it every location is checked with its own rule
+    np = None
+
+if TYPE_CHECKING:
+    from . import ManualWorld
+
+def is_vectorized_evaluation_available() -> bool:
+    return np is not None
+
+class LocationRulesEvaluator:
+    """Check the access rules of many locations against a CollectionState in one batched pass.
+    \nThe compiled requires of the locations are lowered to a vector of the item/category counts the rules look at,
+    a threshold per leaf and AND/OR/NOT reduction layers, so a state check is a handful of NumPy operations.
+    \nRules that can't be lowered (requires functions, or access rules replaced by a hook) are called one by one.
+    Relative counts like 'all' or '50%' are resolved when the evaluator is built, so build it after create_items."""
+
+    def __init__(self, world: "ManualWorld", locations: list[Location]):
+        self.world = world
+        self.player = world.player
+        self.locations = locations
+        self.fallback_positions: list[int] = []
+
+        self.keys: list[str] = []
+        self.leaf_key_indexes: list[int] = []
+        self.leaf_thresholds: list[int] = []
+        self.constants: list[bool] = []
+        self.nodes: list[tuple] = []  # (operator, children) with children referencing leaves, constants and earlier nodes
+        self.lowered_positions: list[int] = []
+        self.lowered_roots: list[tuple[str, int]] = []
+
+        if np is None:
+            self.fallback_positions = list(range(len(locations)))
+            return
+
+        self._key_indexes: dict[str, int] = {}
+        self._leaf_indexes: dict[tuple[int, int], int] = {}
+        self._lowered: dict[int, Optional[tuple[str, int]]] = {}
+
+        for position, location in enumerate(locations):
+            root = self._lower(location.access_rule) if isinstance(location.access_rule, Requirement) else None
+            if root is None:
+                self.fallback_positions.append(position)
+            else:
+                self.lowered_positions.append(position)
+                self.lowered_roots.append(root)
+
+        self._build_arrays()
+        del self._key_indexes, self._leaf_indexes, self._lowered
+
+    def _lower(self, requirement: Requirement) -> Optional[tuple[str, int]]:
+        """Returns a reference to the lowered requirement as ('leaf'|'constant'|'node', index), or None if it can't be lowered"""
+        # Region requirements are shared between their locations, lower them once
+        if id(requirement) in self._lowered:
+            return self._lowered[id(requirement)]
+
+        if isinstance(requirement, ConstantRequirement):
+            ref = self._constant(bool(requirement.value))
+        elif isinstance(requirement, CategoryRequirement) and not requirement.item_names:
+            ref = self._constant(False)
+        elif isinstance(requirement, (ItemRequirement, CategoryRequirement)):
+            key = requirement.item_name if isinstance(requirement, ItemRequirement) else requirement.category_key
+            ref = self._leaf(key, requirement.required_count())
+        elif isinstance(requirement, (AndRequirement, OrRequirement)):
+            ref = self._combine("and" if isinstance(requirement, AndRequirement) else "or", requirement.requirements)
+        elif isinstance(requirement, SharedRequirement):
+            ref = self._lower(requirement.requirement)
+        elif isinstance(requirement, NotRequirement):
+            child = self._lower(requirement.requirement)
+            ref = None if child is None else self._node("not", (child,))
+        else:
+            ref = None
+
+        self._lowered[id(requirement)] = ref
+        return ref
+
+    def _combine(self, operator: str, requirements: tuple) -> Optional[tuple[str, int]]:
+        if not requirements:
+            return self._constant(operator == "and")
+        children = []
+        for requirement in requirements:
+            child = self._lower(requirement)
+            if child is None:
+                return None
+            children.append(child)
+        if len(children) == 1:
+            return children[0]
+        return self._node(operator, tuple(children))
+
+    def _constant(self, value: bool) -> tuple[str, int]:
+        self.constants.append(value)
+        return ("constant", len(self.constants) - 1)
+
+    def _leaf(self, key: str, threshold: int) -> tuple[str, int]:
+        if key not in self._key_indexes:
+            self._key_indexes[key] = len(self.keys)
+            self.keys.append(key)
+        leaf = (self._key_indexes[key], threshold)
+        if leaf not in self._leaf_indexes:
+            self._leaf_indexes[leaf] = len(self.leaf_key_indexes)
+            self.leaf_key_indexes.append(leaf[0])
+            self.leaf_thresholds.append(threshold)
+        return ("leaf", self._leaf_indexes[leaf])
+
+    def _node(self, operator: str, children: tuple) -> tuple[str, int]:
+        self.nodes.append((operator, children))
+        return ("node", len(self.nodes) - 1)
+
+    def _build_arrays(self):
+        """Lay the values out as [leaves, constants, nodes] and group the nodes in layers that only depend on earlier layers"""
+        leaf_count = len(self.leaf_key_indexes)
+        node_start = leaf_count + len(self.constants)
+
+        def value_index(ref: tuple[str, int]) -> int:
+            kind, index = ref
+            if kind == "leaf":
+                return index
+            if kind == "constant":
+                return leaf_count + index
+            return node_start + index
+
+        # Nodes are always created after their children, so their depth is known in creation order
+        depths = []
+        for operator, children in self.nodes:
+            depths.append(1 + max((depths[child[1]] if child[0] == "node" else 0) for child in children))
+
+        self.layers = []
+        for depth in range(1, max(depths, default=0) + 1):
+            layer = {}
+            for operator in ("and", "or", "not"):
+                node_indexes = [i for i, (op, _) in enumerate(self.nodes) if op == operator and depths[i] == depth]
+                if not node_indexes:
+                    continue
+                children = []
+                offsets = []
+                for i in node_indexes:
+                    offsets.append(len(children))
+                    children.extend(value_index(child) for child in self.nodes[i][1])
+                layer[operator] = (np.array([node_start + i for i in node_indexes], dtype=np.intp),
+                                   np.array(children, dtype=np.intp),
+                                   np.array(offsets, dtype=np.intp))
+            self.layers.append(layer)
+
+        self.value_count = node_start + len(self.nodes)
+        self.leaf_key_array = np.array(self.leaf_key_indexes, dtype=np.intp)
+        self.leaf_threshold_array = np.array(self.leaf_thresholds, dtype=np.int64)
+        self.constant_array = np.array(self.constants, dtype=bool)
+        self.constant_slice = slice(leaf_count, node_start)
+        self.lowered_position_array = np.array(self.lowered_positions, dtype=np.intp)
+        self.root_array = np.array([value_index(root) for root in self.lowered_roots], dtype=np.intp)
+
+    def access_rules(self, state: CollectionState) -> list[bool]:
+        """Returns the result of every location's access rule for this state, in the order of the locations given to the evaluator"""
+        if np is None:
+            return [bool(location.access_rule(state)) for location in self.locations]
+
+        prog_items = state.prog_items[self.player]
+        counts = np.fromiter((prog_items[key] for key in self.keys), dtype=np.int64, count=len(self.keys))
+
+        values = np.empty(self.value_count, dtype=bool)
+        values[:len(self.leaf_key_array)] = counts[self.leaf_key_array] >= self.leaf_threshold_array
+        values[self.constant_slice] = self.constant_array
+        for layer in self.layers:
+            if "and" in layer:
+                nodes, children, offsets = layer["and"]
+                values[nodes] = np.logical_and.reduceat(values[children], offsets)
+            if "or" in layer:
+                nodes, children, offsets = layer["or"]
+                values[nodes] = np.logical_or.reduceat(values[children], offsets)
+            if "not" in layer:
+                nodes, children, _ = layer["not"]
+                values[nodes] = ~values[children]
+
+        results = np.zeros(len(self.locations), dtype=bool)
+        results[self.lowered_position_array] = values[self.root_array]
+        for position in self.fallback_positions:
+            results[position] = self.locations[position].access_rule(state)
+        return results.tolist()
+
+    def reachable(self, state: CollectionState) -> list[bool]:
+        """Like access_rules but also requires the location's parent region to be reachable, like Location.can_reach"""
+        region_reachable = {}
+        results = self.access_rules(state)
+        for position, location in enumerate(self.locations):
+            if results[position]:
+                region = location.parent_region
+                if region not in region_reachable:
+                    region_reachable[region] = region.can_reach(state)
+                results[position] = region_reachable[region]
+        return results
@@ -10,15 +10,18 @@ from worlds.LauncherComponents import Component, SuffixIdentifier, components, T
 from .Data import item_table, location_table, category_table
 from .Game import game_name, filler_item_name, starting_items
 from .Meta import world_description, world_webworld, enable_region_diagram
-from .Locations import location_id_to_name, location_name_to_id, location_name_to_location, location_name_groups, victory_names
-from .Items import item_id_to_name, item_name_to_id, item_name_to_item, item_name_groups
+from .Locations import location_id_to_name, location_name_to_id, location_name_to_location, location_name_groups, victory_names, get_location_data, \
+    lazy_location_lookups
+from .Items import item_id_to_name, item_name_to_id, item_name_to_item, item_name_groups, lazy_item_lookups, get_item_names_in_categories
 from .DataValidation import runGenerationDataValidation, runPreFillDataValidation
 
 from .Regions import create_regions
-from .Items import ManualItem
-from .Rules import set_rules
+from .Items import ManualItem, get_item_classification, parse_item_classification
+from .Rules import set_rules, bump_state_version
+from .VectorRules import LocationRulesEvaluator
+from .Reachability import ReachabilityTracker
 from .Options import manual_options_data
-from .Helpers import is_item_enabled, get_option_value, remove_specific_item, resolve_yaml_option, format_state_prog_items_key, ProgItemsCat
+from .Helpers import is_item_enabled, refresh_enablement_table, get_option_value, remove_specific_item, ItemPool, resolve_yaml_option, format_state_prog_items_key, ProgItemsCat
 from .container import APManualFile
 
 from BaseClasses import CollectionState, ItemClassification, Item
@@ -33,7 +36,7 @@ from .hooks.World import \
     before_generate_basic, after_generate_basic, \
     before_fill_slot_data, after_fill_slot_data, before_write_spoiler, \
     before_extend_hint_information, after_extend_hint_information, \
-    after_collect_item, after_remove_item, before_generate_early
+    after_collect_item, after_remove_item, before_generate_early, create_item_hooks_for_each_copy
 from .hooks.Data import hook_interpret_slot_data
 
 class ManualWorld(World):
@@ -64,8 +67,10 @@ class ManualWorld(World):
     location_id_to_name = location_id_to_name
     location_name_to_id = location_name_to_id
     location_name_to_location = location_name_to_location
+    get_location_data = staticmethod(get_location_data)
     location_name_groups = location_name_groups
     victory_names = victory_names
+    counted_goal_locations: list[dict] = [] # the location of the chosen counted goal, set in create_regions
 
     # UT (the universal-est of trackers) can now generate without a YAML
     ut_can_gen_without_yaml = False  # Temporary disable until we fix the bugs with it
@@ -94,15 +99,24 @@ class ManualWorld(World):
     def generate_early(self) -> None:
         before_generate_early(self, self.multiworld, self.player)
 
+        refresh_enablement_table(self)
+
     def create_regions(self):
         before_create_regions(self, self.multiworld, self.player)
+        refresh_enablement_table(self)
+
+        goal_name = victory_names[get_option_value(self.multiworld, self.player, 'goal')]
+        if goal_name not in location_name_to_id: # A counted goal, only its chosen location is added
+            self.counted_goal_locations = [get_location_data(goal_name)]
 
         create_regions(self, self.multiworld, self.player)
+        if self.counted_goal_locations: # so the later steps see it with the other locations
+            self.location_table = [*self.location_table, *self.counted_goal_locations]
 
-        location_game_complete = self.multiworld.get_location(victory_names[get_option_value(self.multiworld, self.player, 'goal')], self.player)
+        location_game_complete = self.multiworld.get_location(goal_name, self.player)
         location_game_complete.address = None
 
-        for unused_goal in [self.multiworld.get_location(name, self.player) for name in victory_names if name != location_game_complete.name]:
+        for unused_goal in [self.multiworld.get_location(name, self.player) for name in victory_names.static_names if name != goal_name]:
             unused_goal.parent_region.locations.remove(unused_goal)
 
         location_game_complete.place_locked_item(
@@ -111,31 +125,19 @@ class ManualWorld(World):
         after_create_regions(self, self.multiworld, self.player)
 
     def create_items(self):
-        # Generate item pool
-        pool: list[Item] = []
-        traps = []
-        configured_item_names = self.item_id_to_name.copy()
+        refresh_enablement_table(self)
 
-        items_config: dict[str, int|dict[ItemClassification | str | int, int]] = {}
-        for name in configured_item_names.values():
-            if name == "__Victory__": continue
-            if name == filler_item_name: continue # intentionally using the Game.py filler_item_name here because it's a non-Items item
-
-            item = self.item_name_to_item[name]
-            item_count = int(item.get("count", 1))
-
-            if item.get("trap"):
-                traps.append(name)
-
-            if not is_item_enabled(self.multiworld, self.player, item):
-                items_config[name] = 0
-
-            else:
-                if item.get("classification_count"):
-                    items_config[name] = item["classification_count"]
+        # Generate item pool
+        pool = ItemPool()
 
-                else:
-                    items_config[name] = item_count
+        # players that share the same enablement table start from the same item counts, only computed once
+        table = self.enablement_table
+        if table.item_config is None:
+            table.item_config = self.get_base_item_config()
+        # the classification counts are copied too, so before_create_items_all can change them without touching the shared ones
+        items_config: dict[str, int|dict[ItemClassification | str | int, int]] = \
+            {name: dict(configs) if isinstance(configs, dict) else configs for name, configs in table.item_config.items()}
+        traps = [name for name in items_config if self.item_name_to_item[name].get("trap")]
 
         items_config = before_create_items_all(items_config, self, self.multiworld, self.player)
 
@@ -143,41 +145,16 @@ class ManualWorld(World):
             total_created = 0
             if type(configs) is int:
                 total_created = configs
-                for _ in range(configs):
-                    new_item = self.create_item(name)
-                    pool.append(new_item)
+                pool.extend(self.create_items_bulk(name, configs))
             elif type(configs) is dict:
                 for cat, count in configs.items():
                     total_created += count
-                    if isinstance(cat, ItemClassification):
-                        true_class = cat
-                    else:
-                        try:
-                            if isinstance(cat, int):
-                                true_class = ItemClassification(cat)
-                            else:
-                                def stringCheck(string: str) ->  ItemClassification:
-                                    if string.isdigit():
-                                        true_class = ItemClassification(int(string))
-                                    elif string.startswith('0b'):
-                                        true_class = ItemClassification(int(string, base=0))
-                                    else:
-                                        true_class = ItemClassification[string]
-                                    return true_class
-
-                                if "+" in cat:
-                                    true_class = ItemClassification.filler
-                                    for substring in cat.split("+"):
-                                        true_class |= stringCheck(substring.strip())
-
-                                else:
-                                    true_class = stringCheck(cat)
-                        except Exception as ex:
-                            raise Exception(f"Item override '{cat}' for {name} improperly defined\n\n{type(ex).__name__}:{ex}")
-
-                    for _ in range(count):
-                        new_item = self.create_item(name, true_class)
-                        pool.append(new_item)
+                    try:
+                        true_class = parse_item_classification(cat)
+                    except Exception as ex:
+                        raise Exception(f"Item override '{cat}' for {name} improperly defined\n\n{type(ex).__name__}:{ex}")
+
+                    pool.extend(self.create_items_bulk(name, count, true_class))
             else:
                 raise Exception(f"Item override for {name} improperly defined")
 
@@ -209,9 +186,10 @@ class ManualWorld(World):
                     raise Exception(f"Item {name}'s 'local_early' has an invalid value of '{item['local_early']}'. \nA boolean or an integer was expected.")
 
 
-        pool = before_create_items_starting(pool, self, self.multiworld, self.player)
+        pool = self.as_item_pool(before_create_items_starting(pool, self, self.multiworld, self.player))
 
         items_started: list[Item] = []
+        names_started: set[str] = set()
 
         if starting_items:
             for starting_item_block in starting_items:
@@ -220,22 +198,16 @@ class ManualWorld(World):
                 # if there's a condition on having a previous item, check for any of them
                 # if not found in items started, this starting item rule shouldn't execute, and check the next one
                 if "if_previous_item" in starting_item_block:
-                    matching_items = [item for item in items_started if item.name in starting_item_block["if_previous_item"]]
-
-                    if len(matching_items) == 0:
+                    if names_started.isdisjoint(starting_item_block["if_previous_item"]):
                         continue
 
-                # start with the full pool of items
-                items = pool
-
-                # if the setting lists specific item names, limit the items to just those
-                if "items" in starting_item_block:
-                    items = [item for item in pool if item.name in starting_item_block["items"]]
-
-                # if the setting lists specific item categories, limit the items to ones that have any of those categories
+                # the candidates are found through the pool's name index, in pool order, so only they get shuffled
                 if "item_categories" in starting_item_block:
-                    items_in_categories = [item["name"] for item in self.item_name_to_item.values() if "category" in item and len(set(starting_item_block["item_categories"]).intersection(item["category"])) > 0]
-                    items = [item for item in pool if item.name in items_in_categories]
+                    items = pool.get_items_with_names(get_item_names_in_categories(starting_item_block["item_categories"]))
+                elif "items" in starting_item_block:
+                    items = pool.get_items_with_names(starting_item_block["items"])
+                else:
+                    items = list(pool)
 
                 self.random.shuffle(items)
 
@@ -243,16 +215,19 @@ class ManualWorld(World):
                 if "random" in starting_item_block:
                     items = items[0:starting_item_block["random"]]
 
+                pool.remove_items(items)
                 for starting_item in items:
-                    items_started.append(starting_item)
                     self.multiworld.push_precollected(starting_item)
-                    remove_specific_item(pool, starting_item)
+                items_started.extend(items)
+                names_started.update(item.name for item in items)
 
-        self.start_inventory = {i.name: items_started.count(i) for i in items_started}
+        self.start_inventory = {}
+        for item in items_started:
+            self.start_inventory[item.name] = self.start_inventory.get(item.name, 0) + 1
 
-        pool = before_create_items_filler(pool, self, self.multiworld, self.player)
+        pool = self.as_item_pool(before_create_items_filler(pool, self, self.multiworld, self.player))
         pool = self.adjust_filler_items(pool, traps)
-        pool = after_create_items(pool, self, self.multiworld, self.player)
+        pool = self.as_item_pool(after_create_items(pool, self, self.multiworld, self.player))
 
         # need to put all of the items in the pool so we can have a full state for placement
         # then will remove specific item placements below from the overall pool
@@ -273,25 +248,34 @@ class ManualWorld(World):
         self.item_counts[self.player] = self.get_item_counts(pool=real_pool)
         self.item_counts_progression[self.player] = self.get_item_counts(pool=real_pool, only_progression=True)
 
+    def get_base_item_config(self) -> dict[str, int|dict]:
+        """The count (or classification counts) of each item before before_create_items_all, disabled items have 0"""
+        items_config: dict[str, int|dict] = {}
+        for name in self.item_id_to_name.values():
+            if name == "__Victory__": continue
+            if name == filler_item_name: continue # intentionally using the Game.py filler_item_name here because it's a non-Items item
+
+            item = self.item_name_to_item[name]
+
+            if not is_item_enabled(self.multiworld, self.player, item):
+                items_config[name] = 0
+
+            elif item.get("classification_count"):
+                items_config[name] = dict(item["classification_count"])
+
+            else:
+                items_config[name] = int(item.get("count", 1))
+        return items_config
+
     def create_item(self, name: str, class_override: Optional['ItemClassification']=None) -> Item:
         name = before_create_item(name, self, self.multiworld, self.player)
 
-        item = self.item_name_to_item[name]
         if class_override is not None:
             classification = class_override
+        elif name in lazy_item_lookups.get("item_name_to_classification"):
+            classification = lazy_item_lookups.get("item_name_to_classification")[name]
         else:
-            classification = ItemClassification.filler
-
-            if "trap" in item and item["trap"]:
-                classification |= ItemClassification.trap
-
-            if "useful" in item and item["useful"]:
-                classification |= ItemClassification.useful
-
-            if "progression_skip_balancing" in item and item["progression_skip_balancing"]:
-                classification |= ItemClassification.progression_skip_balancing
-            elif "progression" in item and item["progression"]:
-                classification |= ItemClassification.progression
+            classification = get_item_classification(self.item_name_to_item[name])
 
         item_object = ManualItem(name, classification,
                         self.item_name_to_id[name], player=self.player)
@@ -300,90 +284,119 @@ class ManualWorld(World):
 
         return item_object
 
-    # Item Value need a tweaked collect and remove:
+    def create_items_bulk(self, name: str, count: int, classification: Optional['ItemClassification']=None) -> list[Item]:
+        """Create count copies of an item, like calling create_item count times.\n
+        before_create_item is only called once for all the copies and after_create_item is still called on each of them.
+        Set create_item_hooks_for_each_copy to True in hooks/World.py to have both hooks called for each copy instead."""
+        if count <= 0:
+            return []
+        if create_item_hooks_for_each_copy:
+            return [self.create_item(name, classification) for _ in range(count)]
+
+        name = before_create_item(name, self, self.multiworld, self.player)
+
+        if classification is None:
+            classification = lazy_item_lookups.get("item_name_to_classification").get(name)
+            if classification is None:
+                classification = get_item_classification(self.item_name_to_item[name])
+        item_id = self.item_name_to_id[name]
+
+        return [after_create_item(ManualItem(name, classification, item_id, player=self.player), self, self.multiworld, self.player)
+                for _ in range(count)]
+
+    # Item Value and Category counts need a tweaked collect and remove:
     def collect(self, state: CollectionState, item: Item) -> bool:
         change = super().collect(state, item)
-        manual_item = self.item_name_to_item.get(item.name, {})
-        if change and manual_item.get("value"):
-            for key, value in manual_item["value"].items():
-                state.prog_items[item.player][format_state_prog_items_key(ProgItemsCat.VALUE, key)] += int(value)
+        if change:
+            for value_key, value in lazy_item_lookups.get("item_name_to_value_keys").get(item.name, ()):
+                state.prog_items[item.player][value_key] += value
+            for category_key in lazy_item_lookups.get("item_name_to_category_keys").get(item.name, ()):
+                state.prog_items[item.player][category_key] += 1
+            bump_state_version(self, state)
+            self.notify_reachability_trackers(state, item)
         after_collect_item(self, state, change, item)
         return change
 
     def remove(self, state: CollectionState, item: Item) -> bool:
         change = super().remove(state, item)
-        manual_item = self.item_name_to_item.get(item.name, {})
-        if change and manual_item.get("value"):
-            for key, value in manual_item["value"].items():
-                state.prog_items[item.player][format_state_prog_items_key(ProgItemsCat.VALUE, key)] -= int(value)
+        if change:
+            for value_key, value in lazy_item_lookups.get("item_name_to_value_keys").get(item.name, ()):
+                state.prog_items[item.player][value_key] -= value
+            for category_key in lazy_item_lookups.get("item_name_to_category_keys").get(item.name, ()):
+                state.prog_items[item.player][category_key] -= 1
+            bump_state_version(self, state)
+            self.notify_reachability_trackers(state, item)
         after_remove_item(self, state, change, item)
         return change
 
+    def track_reachability(self, state: CollectionState) -> ReachabilityTracker:
+        """Returns a tracker of this player's reachable locations for the state, updated as items are collected or removed.\n
+        Only call this after set_rules, and close() the tracker when you no longer need it."""
+        if not hasattr(self, "reachability_trackers"):
+            self.reachability_trackers = []
+        tracker = ReachabilityTracker(self, state)
+        self.reachability_trackers.append(tracker)
+        return tracker
+
+    def notify_reachability_trackers(self, state: CollectionState, item: Item):
+        for tracker in getattr(self, "reachability_trackers", ()):
+            if tracker.state is state:
+                tracker.item_changed(item)
+
     def set_rules(self):
         before_set_rules(self, self.multiworld, self.player)
+        refresh_enablement_table(self)
 
         set_rules(self, self.multiworld, self.player)
 
         after_set_rules(self, self.multiworld, self.player)
 
+    def get_location_rules_evaluator(self) -> LocationRulesEvaluator:
+        """Returns an evaluator that checks the access rules of all of this player's locations for a state at once.\n
+        It's built the first time it's requested, so only call this after set_rules and create_items."""
+        if not hasattr(self, "location_rules_evaluator"):
+            self.location_rules_evaluator = LocationRulesEvaluator(self, list(self.multiworld.get_locations(self.player)))
+        return self.location_rules_evaluator
+
     def generate_basic(self):
         before_generate_basic(self, self.multiworld, self.player)
+        refresh_enablement_table(self)
 
-        # Handle item forbidding
-        manual_locations_with_forbid = {location['name']: location for location in location_name_to_location.values() if "dont_place_item" in location or "dont_place_item_category" in location}
-        locations_with_forbid = [l for l in self.multiworld.get_unfilled_locations(player=self.player) if l.name in manual_locations_with_forbid.keys()]
-        for location in locations_with_forbid:
-            manual_location = manual_locations_with_forbid[location.name]
-            forbidden_item_names = []
-
-            if manual_location.get("dont_place_item"):
-                forbidden_item_names.extend([i["name"] for i in item_name_to_item.values() if i["name"] in manual_location["dont_place_item"]])
-
-            if manual_location.get("dont_place_item_category"):
-                forbidden_item_names.extend([i["name"] for i in item_name_to_item.values() if "category" in i and set(i["category"]).intersection(manual_location["dont_place_item_category"])])
+        unfilled_locations = self.multiworld.get_unfilled_locations(player=self.player)
+        location_name_to_forbidden_item_names = lazy_location_lookups.get("location_name_to_forbidden_item_names")
+        location_name_to_eligible_item_names = lazy_location_lookups.get("location_name_to_eligible_item_names")
 
+        # Handle item forbidding
+        for location in unfilled_locations:
+            forbidden_item_names = location_name_to_forbidden_item_names.get(location.name)
             if forbidden_item_names:
-                forbid_items_for_player(location, set(forbidden_item_names), self.player)
+                forbid_items_for_player(location, forbidden_item_names, self.player)
 
         # Handle specific item placements using fill_restrictive
-        manual_locations_with_placements = {location['name']: location for location in location_name_to_location.values() if "place_item" in location or "place_item_category" in location}
-        locations_with_placements = [l for l in self.multiworld.get_unfilled_locations(player=self.player) if l.name in manual_locations_with_placements.keys()]
-        for location in locations_with_placements:
-            manual_location = manual_locations_with_placements[location.name]
-            eligible_items = []
-            eligible_item_names = []
-            forbidden_item_names = []
-            place_messages = []
-            forbid_messages = []
-
-            #First we get possible items names
-            if manual_location.get("place_item"):
-                eligible_item_names += manual_location["place_item"]
-                place_messages.append('", "'.join(manual_location["place_item"]))
-
-            if manual_location.get("place_item_category"):
-                eligible_item_names += [i["name"] for i in item_name_to_item.values() if "category" in i and set(i["category"]).intersection(manual_location["place_item_category"])]
-                place_messages.append('", "'.join(manual_location["place_item_category"]) + " category(ies)")
-
-            # Second we check for forbidden items names
-            if manual_location.get("dont_place_item"):
-                forbidden_item_names += manual_location["dont_place_item"]
-                forbid_messages.append('", "'.join(manual_location["dont_place_item"]) + ' items')
-
-            if manual_location.get("dont_place_item_category"):
-                forbidden_item_names += [i["name"] for i in item_name_to_item.values() if "category" in i and set(i["category"]).intersection(manual_location["dont_place_item_category"])]
-                forbid_messages.append('", "'.join(manual_location["dont_place_item_category"]) + ' category(ies)')
-
-            # If we forbid some names, check for those in the possible names and remove them
-            if forbidden_item_names:
-                eligible_item_names = [name for name in eligible_item_names if name not in forbidden_item_names]
+        locations_with_placements = [l for l in unfilled_locations if l.name in location_name_to_eligible_item_names]
+        if locations_with_placements:
+            # index this player's items once, in itempool order, instead of scanning the whole itempool for each location
+            player_pool = ItemPool(item for item in self.multiworld.itempool if item.player == self.player)
+            placed_items: set[int] = set()
 
-            if eligible_item_names:
-                eligible_items = [item for item in self.multiworld.itempool if item.player == self.player and item.name in eligible_item_names]
+        for location in locations_with_placements:
+            manual_location = location_name_to_location[location.name]
+            eligible_items = player_pool.get_items_with_names(location_name_to_eligible_item_names[location.name])
 
             if len(eligible_items) == 0:
+                place_messages = []
+                forbid_messages = []
+                if manual_location.get("place_item"):
+                    place_messages.append('", "'.join(manual_location["place_item"]))
+                if manual_location.get("place_item_category"):
+                    place_messages.append('", "'.join(manual_location["place_item_category"]) + " category(ies)")
+                if manual_location.get("dont_place_item"):
+                    forbid_messages.append('", "'.join(manual_location["dont_place_item"]) + ' items')
+                if manual_location.get("dont_place_item_category"):
+                    forbid_messages.append('", "'.join(manual_location["dont_place_item_category"]) + ' category(ies)')
+
                 nl = "\n"
-                if forbidden_item_names:
+                if manual_location.get("dont_place_item") or location.name in location_name_to_forbidden_item_names:
                     raise Exception(f'Could not find a suitable item to place at "{manual_location["name"]}".\n    No items that match "{f"{nl}     or ".join(place_messages)}"\n    Maybe because of forbidden "{f"{nl}     or ".join(forbid_messages)}"')
                 raise Exception(f'Could not find a suitable item to place at "{manual_location["name"]}". \n    No items that match "{f"{nl}     or ".join(place_messages)}"')
 
@@ -391,7 +404,11 @@ class ManualWorld(World):
             location.place_locked_item(item_to_place)
 
             # remove the item we're about to place from the pool so it isn't placed twice
-            remove_specific_item(self.multiworld.itempool, item_to_place)
+            player_pool.remove_specific(item_to_place)
+            placed_items.add(id(item_to_place))
+
+        if locations_with_placements:
+            self.multiworld.itempool[:] = [item for item in self.multiworld.itempool if id(item) not in placed_items]
 
 
         after_generate_basic(self, self.multiworld, self.player)
@@ -423,7 +440,8 @@ class ManualWorld(World):
         filename = f"{self.multiworld.get_out_file_name_base(self.player)}.apmanual"
         zf_path = os.path.join(output_directory, filename)
 
-        apmanual = APManualFile(zf_path, player=self.player, player_name=self.player_name)
+        location_definitions = {**self.location_name_to_location, **{location["name"]: location for location in self.counted_goal_locations}}
+        apmanual = APManualFile(zf_path, player=self.player, player_name=self.player_name, location_definitions=location_definitions)
         apmanual.write()
 
 
@@ -452,6 +470,11 @@ class ManualWorld(World):
     The maximum time a location/region's requirement can loop to check for functions\n
     One thing to remember is the more you loop the longer generation will take. So probably leave it as is unless you really needs it."""
 
+    @staticmethod
+    def as_item_pool(item_pool: list[Item]) -> ItemPool:
+        """Hooks can return any list of items, put it back in an ItemPool if needed"""
+        return item_pool if isinstance(item_pool, ItemPool) else ItemPool(item_pool)
+
     def add_filler_items(self, item_pool, traps):
         Utils.deprecate("You're calling the deprecated add_filler_items() function. Use the adjust_filler_items() function instead.")
         return self.adjust_filler_items(item_pool, traps)
@@ -479,9 +502,10 @@ class ManualWorld(World):
             # Filler is only assigned if the item doesn't have any other tags, so it only has to be covered by itself.
             # Skip Balancing is also not covered due to how it's only supported when paired with Progression.
             # As a result, these cover every possible combination can be removed.
-            fillers = [item for item in item_pool if item.classification == ItemClassification.filler]
-            traps = [item for item in item_pool if item.classification == ItemClassification.trap]
-            useful = [item for item in item_pool if item.classification == ItemClassification.useful]
+            item_pool = self.as_item_pool(item_pool)
+            fillers = item_pool.get_items_with_classification(ItemClassification.filler)
+            traps = item_pool.get_items_with_classification(ItemClassification.trap)
+            useful = item_pool.get_items_with_classification(ItemClassification.useful)
             # Useful + Trap is classified separately so that it can have a unique priority ranking.
             useful_traps = [item for item in item_pool if
                             ItemClassification.progression not in item.classification
@@ -491,6 +515,7 @@ class ManualWorld(World):
             self.random.shuffle(traps)
             self.random.shuffle(useful)
             self.random.shuffle(useful_traps)
+            removed = []
             for _ in range(0, abs(extras)):
                 popped = None
                 if fillers:
@@ -504,7 +529,8 @@ class ManualWorld(World):
                 else:
                     logging.warning("Could not remove enough non-progression items from the pool.")
                     break
-                remove_specific_item(item_pool, popped)
+                removed.append(popped)
+            item_pool.remove_items(removed)
 
         return item_pool
 
@@ -1,6 +1,6 @@
 import json
 import zipfile
-from typing import Any
+from typing import Any, Optional
 
 from worlds import Files
 
@@ -19,14 +19,17 @@ class APManualFile(APPlayerContainer):
     game = game_name
     patch_file_ending = ".apmanual"
 
-    def __init__(self, *args: Any, **kwargs: Any):
+    def __init__(self, *args: Any, location_definitions: Optional[dict[str, dict]] = None, **kwargs: Any):
         super().__init__(*args, **kwargs)
+        # the locations of the player's world, with its counted goal which isn't in location_name_to_location
+        self.location_definitions = location_definitions
 
 
     def write_contents(self, opened_zipfile: zipfile.ZipFile):
         super().write_contents(opened_zipfile)
+        locations = self.location_definitions if self.location_definitions is not None else location_name_to_location
         opened_zipfile.writestr("items.json", json.dumps(item_name_to_item, indent=2))
-        opened_zipfile.writestr("locations.json", json.dumps(location_name_to_location, indent=2))
+        opened_zipfile.writestr("locations.json", json.dumps(locations, indent=2))
         opened_zipfile.writestr("regions.json", json.dumps(region_table, indent=2))
 
     def read_contents(self, opened_zipfile: zipfile.ZipFile) -> dict[str, Any]:
@@ -1,9 +1,102 @@
+from itertools import combinations
+
+from ..GameInfo import survivor_classes, class_challenges, all_persona_names
+from ..Helpers import load_data_file
+
+# The tables, once loaded and processed, are kept in a snapshot in the user's cache folder so later imports don't redo it (see Snapshot.py)
+# Set this to False if the hooks below do more than changing the table they're given, they aren't called when the snapshot is used
+use_data_snapshot = True
+
+########################################################################################
+## The survivor items and locations all follow the same pattern, so they're made from
+## the roster in GameInfo.py instead of being written out in items.json/locations.json.
+## They get explicit ids from their survivor's position in the roster, the same ids they had
+## when they were in the json files, so adding a survivor at the end doesn't move any of them.
+########################################################################################
+
+# The first survivors had their HELPER items after all of their unlocks in items.json,
+# survivors added after them get their unlocks and HELPER items next to each other
+survivors_with_separate_helpers = 50
+survivor_unlock_count = 3 + len(all_persona_names)
+survivor_item_count = survivor_unlock_count + len(all_persona_names)
+survivor_location_count = 3 + len(all_persona_names) + len(all_persona_names) * (len(all_persona_names) - 1) // 2 + 2
+
+def get_starting_index() -> int:
+    """The id of the first item and location, like Game.py (which can't be imported while the data is loaded)"""
+    return int(load_data_file("game.json").get("starting_index", 1))
+
+def persona_categories(persona_name: str) -> list[str]:
+    return ["CATEGORY_BT"] if persona_name == "Borrowed Time" else []
+
+def get_survivor_item_id(first_id: int, row: int, column: int) -> int:
+    """The id of the column-th item of the row-th survivor, the ids after first_id (which is the Deduction Point)"""
+    if row > survivors_with_separate_helpers:
+        return first_id + 1 + survivors_with_separate_helpers * survivor_item_count + (row - survivors_with_separate_helpers - 1) * survivor_item_count + column - 1
+    if column > survivor_unlock_count: # a HELPER item
+        return first_id + 1 + survivors_with_separate_helpers * survivor_unlock_count + (row - 1) * len(all_persona_names) + column - survivor_unlock_count - 1
+    return first_id + 1 + (row - 1) * survivor_unlock_count + column - 1
+
+def make_survivor_items(first_id: int) -> list[dict]:
+    items = []
+    for row, survivor in enumerate(survivor_classes, 1):
+        entries = [
+            {"name": f"{survivor} - Character Unlock", "category": [f"{survivor} Items", "!Survivor Unlock"], "classification_count": {"progression": 2}},
+            *({"name": f"{survivor} - {persona} Persona Unlock", "category": [f"{survivor} Items", "Persona Unlock", f"{survivor} Persona", *persona_categories(persona)],
+               "classification_count": {"progression": 1}} for persona in all_persona_names),
+            {"name": f"{survivor} - Class Challenge Unlock", "category": [f"{survivor} Items", "Class Challenge Unlock", "CATEGORY_CLASSCHALLENGE"],
+             "classification_count": {"progression": 1}, "challenge": "class"},
+            {"name": f"{survivor} - Unique Challenge Unlock", "category": [f"{survivor} Items", "Unique Challenge Unlock", "CATEGORY_UNIQUECHALLENGE"],
+             "classification_count": {"progression": 1}, "challenge": "unique"},
+        ]
+        for column, item in enumerate(entries, 1):
+            challenge = item.pop("challenge", None)
+            item["progression"] = True
+            item["sort-key"] = f"row-{row:02}-{column:02}"
+            if challenge:
+                item["challenge"] = challenge
+            item["id"] = get_survivor_item_id(first_id, row, column)
+            items.append(item)
+
+        for column, persona in enumerate(sorted(all_persona_names), survivor_unlock_count + 1):
+            items.append({"name": f"{survivor} - HELPER for {persona}", "category": [f"{survivor} Items", "Filler", *persona_categories(persona)],
+                          "classification_count": {"filler": 1}, "filler": True, "sort-key": f"row-{row:02}-{column:02}",
+                          "id": get_survivor_item_id(first_id, row, column)})
+
+    # the ids have to go up in the item table
+    items.sort(key=lambda item: item["id"])
+    return items
+
+def make_survivor_locations(first_id: int) -> list[dict]:
+    """The locations after first_id (which is the Goal placeholder)"""
+    locations = []
+    for row, survivor in enumerate(survivor_classes, 1):
+        unlock = f"|{survivor} - Character Unlock|"
+        entries = [
+            (f"Escape as {survivor}", [], unlock),
+            (f"Draw as {survivor}", [], f"{unlock} and |@{survivor} Persona:1|"),
+            (f"Win as {survivor}", [], f"{unlock} and |@{survivor} Persona:2|"),
+            *((f"Draw as {survivor} using only {persona}", persona_categories(persona),
+               f"{unlock} and |{survivor} - {persona} Persona Unlock|") for persona in all_persona_names),
+            *((f"Win as {survivor} using {first} and {second}", persona_categories(first) or persona_categories(second),
+               f"{unlock} and |{survivor} - {first} Persona Unlock| and |{survivor} - {second} Persona Unlock|")
+              for first, second in combinations(all_persona_names, 2)),
+            (f"Class Challenge - {class_challenges[survivor_classes[survivor]]} as {survivor}", ["CATEGORY_CLASSCHALLENGE"],
+             f"{unlock} and |{survivor} - Class Challenge Unlock:{{itemEnabledClassChallenge()}}|"),
+            (f"{survivor} UNIQUECHALLENGE", ["CATEGORY_UNIQUECHALLENGE"],
+             f"{unlock} and |{survivor} - Unique Challenge Unlock:{{itemEnabledUniqueChallenge()}}|"),
+        ]
+        for column, (name, categories, requires) in enumerate(entries, 1):
+            locations.append({"name": name, "category": [f"{survivor} Locations", *categories], "requires": requires, "sort-key": f"row-{row:02}-{column:02}",
+                              "id": first_id + 1 + (row - 1) * survivor_location_count + column - 1})
+    return locations
+
 # called after the game.json file has been loaded
 def after_load_game_file(game_table: dict) -> dict:
     return game_table
 # called after the items.json file has been loaded, before any item loading or processing has occurred
 # if you need access to the items after processing to add ids, etc., you should use the hooks in World.py
 def after_load_item_file(item_table: list) -> list:
+    item_table.extend(make_survivor_items(get_starting_index()))
     return item_table
 
 # NOTE: Progressive items are not currently supported in Manual. Once they are,
@@ -14,19 +107,16 @@ def after_load_progressive_item_file(progressive_item_table: list) -> list:
 # called after the locations.json file has been loaded, before any location loading or processing has occurred
 # if you need access to the locations after processing to add ids, etc., you should use the hooks in World.py
 def after_load_location_file(location_table: list) -> list:
+    location_table.extend(make_survivor_locations(get_starting_index()))
+
+    # A single counted goal stands for all the "Gather N Deduction Points" victory locations,
+    # only the one picked in before_generate_early is made
     location = {}
-    location["name"] = "Gather 1 Deduction Point"
+    location["name"] = "Gather {count} Deduction Points"
     location["category"] = ["!Goal"]
-    location["requires"] = "|Deduction Point:1|"
     location["victory"] = True
+    location["counted_goal"] = {"item": "Deduction Point", "min": 1, "max": 500, "singular_name": "Gather 1 Deduction Point"}
     location_table.append(location)
-    for i in range(2, 501):
-        location = {}
-        location["name"] = f"Gather {i} Deduction Points"
-        location["category"] = ["!Goal"]
-        location["requires"] = f"|Deduction Point:{i}|"
-        location["victory"] = True
-        location_table.append(location)
 
     return location_table
 
@@ -1,21 +1,31 @@
+from collections.abc import Hashable
 from typing import Optional, Any
 from BaseClasses import MultiWorld, Item, Location
+from worlds.AutoWorld import World
 
 # Use this if you want to override the default behavior of is_option_enabled
 # Return True to enable the category, False to disable it, or None to use the default behavior
 def before_is_category_enabled(multiworld: MultiWorld, player: int, category_name: str) -> Optional[bool]:
-    if category_name in multiworld.worlds[player].disabled_survivors:
+    if category_name in multiworld.worlds[player].roster_plan.disabled_survivors:
         return False
     return None
 
 # Use this if you want to override the default behavior of is_option_enabled
 # Return True to enable the item, False to disable it, or None to use the default behavior
 def before_is_item_enabled(multiworld: MultiWorld, player: int, item:  dict[str, Any]) -> Optional[bool]:
-    if item.get("challenge") in multiworld.worlds[player].disabled_challenge_items:
+    if item.get("challenge") in multiworld.worlds[player].roster_plan.disabled_challenge_items:
         return False
     return None
 
 # Use this if you want to override the default behavior of is_option_enabled
 # Return True to enable the location, False to disable it, or None to use the default behavior
 def before_is_location_enabled(multiworld: MultiWorld, player: int, location:  dict[str, Any]) -> Optional[bool]:
-    return None
\ No newline at end of file
+    return None
+
+# Players with the same options and the same value returned here share what's enabled for them (see Helpers.EnablementTable)
+# Return what the hooks above look at other than options, or None to never share this player's tables
+def hook_get_enablement_cache_key(world: World) -> Optional[Hashable]:
+    plan = getattr(world, "roster_plan", None)
+    if plan is None:
+        return None
+    return (plan.disabled_survivors, plan.disabled_challenge_items)
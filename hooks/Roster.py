@@ -0,0 +1,172 @@
+import math
+from random import Random
+from typing import Any
+
+from BaseClasses import MultiWorld
+
+from ..GameInfo import all_survivors_names
+from ..Helpers import get_option_value
+
+########################################################################################
+## The Identity V roster planner: which survivors and personas are shuffled or given at
+## the start, and how many Deduction Points there are.
+##
+## plan_roster only uses the option values and the RNG it's given, so the same options
+## and seed always give the same plan, no matter what else is generating at the time.
+########################################################################################
+
+roster_option_names = [
+    "shuffled_survivor_list", "shuffled_survivor_amount", "starting_survivor_amount",
+    "starting_persona_method", "starting_persona_percentage", "shuffle_borrowed_time",
+    "enable_class_challenges", "enable_unique_challenges",
+    "filler_item_percentage", "deduction_point_percentage",
+]
+
+def get_roster_options(multiworld: MultiWorld, player: int) -> dict[str, Any]:
+    """Returns the values of the options the roster planner needs"""
+    return {name: get_option_value(multiworld, player, name) for name in roster_option_names}
+
+class RosterPlan:
+    """The roster of a player, made by plan_roster and kept on the world as world.roster_plan"""
+    __slots__ = ("included_survivors", "starting_survivors", "starting_personas", "disabled_survivors", "disabled_challenge_items",
+                 "shuffled_survivor_amount", "starting_survivor_amount", "persona_item_count",
+                 "checks_per_survivor", "items_per_survivor", "total_checks", "total_items",
+                 "max_mcguffins", "available_mcguffins", "goal_mcguffins")
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            setattr(self, name, values[name])
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RosterPlan) and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"RosterPlan({', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)})"
+
+def IDV_define_max_mcguffins(options: dict[str, Any], shuffledSurvivorAmount: int, startingSurvivorAmount: int, personaAmount: int) -> dict[str, int]:
+    checks_per_surv = 15
+    # 2 char unlock + 4 personas + 2 challenges
+    items_per_surv = 8
+
+    option_shuffleBT = options["shuffle_borrowed_time"]
+    option_classChallenges = options["enable_class_challenges"]
+    option_uniqueChallenges = options["enable_unique_challenges"]
+
+    if option_shuffleBT == 0:
+        checks_per_surv -= 4
+        items_per_surv -= 1
+
+    if option_classChallenges == 0:
+        checks_per_surv -= 1
+    if option_classChallenges <= 1:
+        items_per_surv -= 1
+
+    if option_uniqueChallenges == 0:
+        checks_per_surv -= 1
+    if option_uniqueChallenges <= 1:
+        items_per_surv -= 1
+
+    total_checks = checks_per_surv * shuffledSurvivorAmount
+    total_items = items_per_surv * shuffledSurvivorAmount
+
+    total_items -= startingSurvivorAmount
+    total_items -= personaAmount
+
+    return {
+        "checks_per_survivor": checks_per_surv,
+        "items_per_survivor": items_per_surv,
+        "total_checks": total_checks,
+        "total_items": total_items,
+        "max_mcguffins": max(min(total_checks - total_items, 500), 1),
+    }
+
+def plan_roster(options: dict[str, Any], rng: Random) -> RosterPlan:
+    """Plan the roster of a player from its option values (see get_roster_options), drawing from rng only"""
+    # sorted so the shuffle only depends on the rng, sets don't have a stable order between runs
+    shuffledSurvivorList = sorted(options["shuffled_survivor_list"])
+    shuffledSurvivorListLength = len(shuffledSurvivorList)
+    shuffledSurvivorAmount = options["shuffled_survivor_amount"]
+    startingSurvivorAmount = options["starting_survivor_amount"]
+
+    if (shuffledSurvivorListLength == 0):
+        shuffledSurvivorList = list(all_survivors_names)
+        shuffledSurvivorListLength = len(all_survivors_names)
+    elif (shuffledSurvivorAmount > shuffledSurvivorListLength):
+        shuffledSurvivorAmount = shuffledSurvivorListLength
+
+    if (startingSurvivorAmount > shuffledSurvivorAmount):
+        startingSurvivorAmount = shuffledSurvivorAmount
+
+    disabled_challenge_items = set()
+    if options["enable_class_challenges"] != 2: disabled_challenge_items.add("class")
+    if options["enable_unique_challenges"] != 2: disabled_challenge_items.add("unique")
+
+    rng.shuffle(shuffledSurvivorList)
+    includedSurvivors = tuple(shuffledSurvivorList[:shuffledSurvivorAmount])
+    startingSurvivors = includedSurvivors[:startingSurvivorAmount]
+
+    disabled_survivors = set()
+    for surv_name in all_survivors_names:
+        if not surv_name in includedSurvivors:
+            disabled_survivors.add(f"{surv_name} Locations")
+            disabled_survivors.add(f"{surv_name} Items")
+
+    startingPersonaMethod = options["starting_persona_method"]
+    startingPersonaPercentage = options["starting_persona_percentage"]
+
+    available_personas = ["Flywheel Effect", "Tide Turner", "Knee Jerk Reflex"]
+    if options["shuffle_borrowed_time"] > 0: available_personas.append("Borrowed Time")
+
+    personas_qty = len(available_personas)
+
+    startingPersonas = []
+
+    persona_amount = startingSurvivorAmount
+    if (startingPersonaMethod == 1): persona_amount *= personas_qty
+
+    persona_amount = math.ceil(persona_amount * startingPersonaPercentage/100)
+
+    if (startingPersonaMethod == 0): # Percentage of characters
+        for i in range(persona_amount):
+            surv_name = startingSurvivors[i]
+            for persona_name in available_personas:
+                startingPersonas.append(f"{surv_name} - {persona_name} Persona Unlock")
+
+    elif (startingPersonaMethod == 1): # Percentage of total personas
+        possible_personas = []
+
+        for i in range(startingSurvivorAmount):
+            surv_name = startingSurvivors[i]
+            for persona_name in available_personas:
+                possible_personas.append(f"{surv_name} - {persona_name} Persona Unlock")
+
+        rng.shuffle(possible_personas)
+
+        for i in range(persona_amount):
+            startingPersonas.append(possible_personas[i])
+
+    persona_item_count = persona_amount
+    if startingPersonaMethod == 0: persona_item_count = persona_amount * personas_qty
+
+    mcguffin_stats = IDV_define_max_mcguffins(options, shuffledSurvivorAmount, startingSurvivorAmount, persona_item_count)
+
+    max_mcguffins = mcguffin_stats["max_mcguffins"]
+    fillerItemPercentage = options["filler_item_percentage"]
+
+    available_mcguffins = math.ceil(max_mcguffins * (100 - fillerItemPercentage)/100)
+    multiplier = options["deduction_point_percentage"]
+    mcguffins = round(available_mcguffins * multiplier / 100)
+
+    return RosterPlan(
+        included_survivors=includedSurvivors,
+        starting_survivors=startingSurvivors,
+        starting_personas=tuple(startingPersonas),
+        disabled_survivors=frozenset(disabled_survivors),
+        disabled_challenge_items=frozenset(disabled_challenge_items),
+        shuffled_survivor_amount=shuffledSurvivorAmount,
+        starting_survivor_amount=startingSurvivorAmount,
+        persona_item_count=persona_item_count,
+        available_mcguffins=available_mcguffins,
+        goal_mcguffins=max(mcguffins, 1),
+        **mcguffin_stats,
+    )
@@ -1,6 +1,6 @@
 from typing import Optional
 from worlds.AutoWorld import World
-from ..Helpers import clamp, get_items_with_value, get_option_value
+from ..Helpers import clamp, get_items_with_value, get_option_value, state_independent
 from BaseClasses import MultiWorld, CollectionState
 
 import re
@@ -30,11 +30,16 @@ def requiresMelee():
 
 
 
+# If your function only looks at the options and never at the state, decorate it with @state_independent.
+# It will then be called once per player when the rules are set instead of on every access check.
+
 # If the corresponding item is enabled as a requirement (option value == 2), it needs 1 of that, or else it isn't needed
+@state_independent
 def itemEnabledClassChallenge(multiworld: MultiWorld, player: int):
     if get_option_value(multiworld, player, "enable_class_challenges") == 2: return "1"
     return "0"
 
+@state_independent
 def itemEnabledUniqueChallenge(multiworld: MultiWorld, player: int):
     if get_option_value(multiworld, player, "enable_unique_challenges") == 2: return "1"
     return "0"
\ No newline at end of file
@@ -12,20 +12,14 @@ from ..Locations import ManualLocation
 from ..Data import game_table, item_table, location_table, region_table
 
 from ..GameInfo import all_survivors_names
+from .Roster import plan_roster, get_roster_options
 
 # These helper methods allow you to determine if an option has been set, or what its value is, for any player in the multiworld
-from ..Helpers import is_option_enabled, get_option_value, format_state_prog_items_key, ProgItemsCat, remove_specific_item
+from ..Helpers import is_option_enabled, get_option_value, format_state_prog_items_key, ProgItemsCat, remove_specific_item, ItemPool
 
 # calling logging.info("message") anywhere below in this file will output the message to both console and log file
 import logging
 
-# Import random lib to shuffle lists and select included characters randomly
-import random
-
-import math
-
-IDV_gen_data = {}
-
 ########################################################################################
 ## Order of method calls when the world generates:
 ##    1. create_regions - Creates regions and locations
@@ -39,46 +33,6 @@ IDV_gen_data = {}
 ########################################################################################
 
 
-def IDV_define_max_mcguffins(multiworld: MultiWorld, player: int,
-                             shuffledSurvivorAmount: int, startingSurvivorAmount: int, personaAmount: int):
-    
-    checks_per_surv = 15
-    # 2 char unlock + 4 personas + 2 challenges
-    items_per_surv = 8
-
-    option_shuffleBT = get_option_value(multiworld, player, "shuffle_borrowed_time")
-    option_classChallenges = get_option_value(multiworld, player, "enable_class_challenges")
-    option_uniqueChallenges = get_option_value(multiworld, player, "enable_unique_challenges")
-
-    if option_shuffleBT == 0:
-        checks_per_surv -= 4
-        items_per_surv -= 1
-    
-    if option_classChallenges == 0:
-        checks_per_surv -= 1
-    if option_classChallenges <= 1:
-        items_per_surv -= 1
-
-    if option_uniqueChallenges == 0:
-        checks_per_surv -= 1
-    if option_uniqueChallenges <= 1:
-        items_per_surv -= 1
-    
-    total_checks = checks_per_surv * shuffledSurvivorAmount
-    total_items = items_per_surv * shuffledSurvivorAmount
-
-    total_items -= startingSurvivorAmount
-    total_items -= personaAmount
-    
-    print(f"[{player}]\tchecks per surv: {checks_per_surv}, items per surv: {items_per_surv}")
-    print(f"[{player}]\tsurvs: {shuffledSurvivorAmount}, starting: {startingSurvivorAmount}, persona: {personaAmount}")
-    print(f"[{player}]\ttotal checks: {total_checks}, total items: {total_items}")
-
-    max_mcguffins = max(min(total_checks - total_items, 500), 1)
-    return max_mcguffins
-
-    
-
 # Use this function to change the valid filler items to be created to replace item links or starting items.
 # Default value is the `filler_item_name` from game.json
 def hook_get_filler_item_name(world: World, multiworld: MultiWorld, player: int) -> str | bool:
@@ -90,108 +44,16 @@ def before_generate_early(world: World, multiworld: MultiWorld, player: int) ->
     Use it to check or modify incompatible options, or to set up variables for later use.
     """
 
-    IDV_gen_data[player] = {}
-
-    shuffledSurvivorList = list(get_option_value(multiworld, player, "shuffled_survivor_list"))
-    shuffledSurvivorListLength = len(shuffledSurvivorList)
-    shuffledSurvivorAmount = get_option_value(multiworld, player, "shuffled_survivor_amount")
-    startingSurvivorAmount = get_option_value(multiworld, player, "starting_survivor_amount")
-
-    if (shuffledSurvivorListLength == 0):
-        shuffledSurvivorList = list(all_survivors_names.copy())
-        shuffledSurvivorListLength = len(all_survivors_names)
-    elif (shuffledSurvivorAmount > shuffledSurvivorListLength):
-        shuffledSurvivorAmount = shuffledSurvivorListLength
-    
-    if (startingSurvivorAmount > shuffledSurvivorAmount):
-        startingSurvivorAmount = shuffledSurvivorAmount
-    
-
-    world.disabled_challenge_items: set[str] = set()
-    if get_option_value(multiworld, player, "enable_class_challenges") != 2: world.disabled_challenge_items.add("class")
-    if get_option_value(multiworld, player, "enable_unique_challenges") != 2: world.disabled_challenge_items.add("unique")
-
-    # Set a random seed for the lib
-    random.seed()
-    
-    includedSurvivors = []
-    IDV_gen_data[player]["startingSurvivors"] = []
-    
-    world.disabled_survivors: set[str] = set()
-
-    IDV_gen_data[player]["survivors"] = {}
-
-    random.shuffle(shuffledSurvivorList)
-    for i in range(shuffledSurvivorAmount):
-        surv_name = shuffledSurvivorList[i]
-
-        includedSurvivors.append(surv_name)
-        if (i < startingSurvivorAmount):
-            IDV_gen_data[player]["startingSurvivors"].append(surv_name)
-
-        IDV_gen_data[player]["survivors"][surv_name] = True
-    
-    IDV_gen_data[player]["includedSurvivors"] = includedSurvivors
-
-    for surv_name in all_survivors_names:
-        if not surv_name in includedSurvivors:
-            world.disabled_survivors.add(f"{surv_name} Locations")
-            world.disabled_survivors.add(f"{surv_name} Items")
-    
-
-
-    startingPersonaMethod = get_option_value(multiworld, player, "starting_persona_method")
-    startingPersonaPercentage = get_option_value(multiworld, player, "starting_persona_percentage")
-
-    startingPersonaList = []
+    # The roster is planned from the options with the world's own RNG, so a seed always gives the same roster
+    # It's kept on the world so it goes away with it
+    plan = world.roster_plan = plan_roster(get_roster_options(multiworld, player), world.random)
 
-    available_personas = ["Flywheel Effect", "Tide Turner", "Knee Jerk Reflex"]
-    if is_option_enabled(multiworld, player, "shuffle_borrowed_time"): available_personas.append("Borrowed Time")
+    print(f"[{player}]\tchecks per surv: {plan.checks_per_survivor}, items per surv: {plan.items_per_survivor}")
+    print(f"[{player}]\tsurvs: {plan.shuffled_survivor_amount}, starting: {plan.starting_survivor_amount}, persona: {plan.persona_item_count}")
+    print(f"[{player}]\ttotal checks: {plan.total_checks}, total items: {plan.total_items}")
+    print(f"[{player}]\tmax mcguffin: {plan.max_mcguffins}, filler pctg: {get_option_value(multiworld, player, 'filler_item_percentage')}, available mcguffins: {plan.available_mcguffins}, goal: {plan.goal_mcguffins}")
 
-    personas_qty = len(available_personas)
-
-    IDV_gen_data[player]["startingPersonas"] = []
-
-    persona_amount = startingSurvivorAmount
-    if (startingPersonaMethod == 1): persona_amount *= personas_qty
-
-    persona_amount = math.ceil(persona_amount * startingPersonaPercentage/100)
-
-    if (startingPersonaMethod == 0): # Percentage of characters
-        for i in range(persona_amount):
-            surv_name = IDV_gen_data[player]["startingSurvivors"][i]
-            for persona_name in available_personas:
-                IDV_gen_data[player]["startingPersonas"].append(f"{surv_name} - {persona_name} Persona Unlock")
-
-    elif (startingPersonaMethod == 1): # Percentage of total personas
-        possible_personas = []
-        
-        for i in range(startingSurvivorAmount):
-            surv_name = IDV_gen_data[player]["startingSurvivors"][i]
-            for persona_name in available_personas:
-                possible_personas.append(f"{surv_name} - {persona_name} Persona Unlock")
-        
-        random.shuffle(possible_personas)
-
-        for i in range(persona_amount):
-            IDV_gen_data[player]["startingPersonas"].append(possible_personas[i])
-    
-    persona_item_count = persona_amount
-    if startingPersonaMethod == 0: persona_item_count = persona_amount * personas_qty
-
-    max_mcguffins = IDV_define_max_mcguffins(multiworld, player, shuffledSurvivorAmount, startingSurvivorAmount, persona_item_count)
-    fillerItemPercentage = get_option_value(multiworld, player, "filler_item_percentage")
-
-    available_mcguffins = math.ceil(max_mcguffins * (100 - fillerItemPercentage)/100)
-    multiplier = get_option_value(multiworld, player, "deduction_point_percentage")
-    mcguffins = round(available_mcguffins * multiplier / 100)
-
-    print(f"[{player}]\tmax mcguffin: {max_mcguffins}, filler pctg: {fillerItemPercentage}, available mcguffins: {available_mcguffins}, goal: {mcguffins}")
-
-    IDV_gen_data[player]["availableMcguffins"] = available_mcguffins
-
-    if mcguffins == 0:
-        mcguffins = 1
+    mcguffins = plan.goal_mcguffins
     if mcguffins == 1:
         goal_index = world.victory_names.index(f"Gather 1 Deduction Point")
     else:
@@ -229,24 +91,24 @@ def after_create_regions(world: World, multiworld: MultiWorld, player: int):
 #       will create 5 items that are the "useful trap" class
 # {"Item Name": {ItemClassification.useful: 5}} <- You can also use the classification directly
 def before_create_items_all(item_config: dict[str, int|dict], world: World, multiworld: MultiWorld, player: int) -> dict[str, int|dict]:
+    # Only create the Deduction Points that are available, instead of creating all of them and removing the rest later
+    if isinstance(item_config.get("Deduction Point"), int):
+        item_config["Deduction Point"] = min(item_config["Deduction Point"], world.roster_plan.available_mcguffins)
+
     return item_config
 
 # The item pool before starting items are processed, in case you want to see the raw item pool at that stage
-def before_create_items_starting(item_pool: list, world: World, multiworld: MultiWorld, player: int) -> list:
-    for surv_name in IDV_gen_data[player]["startingSurvivors"]:
-        item = next(i for i in item_pool if i.name == f"{surv_name} - Character Unlock")
-        item_pool.remove(item)
-        multiworld.push_precollected(item)
-    
-    for persona_item in IDV_gen_data[player]["startingPersonas"]:
-        item = next(i for i in item_pool if i.name == persona_item)
-        item_pool.remove(item)
+def before_create_items_starting(item_pool: ItemPool, world: World, multiworld: MultiWorld, player: int) -> list:
+    starting_names = [f"{surv_name} - Character Unlock" for surv_name in world.roster_plan.starting_survivors]
+    starting_names.extend(world.roster_plan.starting_personas)
+
+    for item in item_pool.remove_items([item_pool.get_first_by_name(name) for name in starting_names]):
         multiworld.push_precollected(item)
 
     return item_pool
 
 # The item pool after starting items are processed but before filler is added, in case you want to see the raw item pool at that stage
-def before_create_items_filler(item_pool: list, world: World, multiworld: MultiWorld, player: int) -> list:
+def before_create_items_filler(item_pool: ItemPool, world: World, multiworld: MultiWorld, player: int) -> list:
     # Use this hook to remove items from the item pool
     itemNamesToRemove: list[str] = [] # List of item names
 
@@ -255,14 +117,11 @@ def before_create_items_filler(item_pool: list, world: World, multiworld: MultiW
     # Because multiple copies of an item can exist, you need to add an item name
     # to the list multiple times if you want to remove multiple copies of it.
 
-    badMcguffins = 500 - IDV_gen_data[player]["availableMcguffins"]
-    for _ in range(badMcguffins):
-        itemNamesToRemove.append("Deduction Point")
-    
+    # The extra Deduction Points are not created at all, see before_create_items_all
 
     for itemName in itemNamesToRemove:
-        item = next(i for i in item_pool if i.name == itemName)
-        remove_specific_item(item_pool, item)
+        item = item_pool.get_first_by_name(itemName)
+        item_pool.remove_specific(item)
 
     return item_pool
 
@@ -270,7 +129,7 @@ def before_create_items_filler(item_pool: list, world: World, multiworld: MultiW
 
     ## Place an item at a specific location
     # location = next(l for l in multiworld.get_unfilled_locations(player=player) if l.name == "Location Name")
-    # item_to_place = next(i for i in item_pool if i.name == "Item Name")
+    # item_to_place = item_pool.get_first_by_name("Item Name")
     # location.place_locked_item(item_to_place)
     # remove_specific_item(item_pool, item_to_place)
 
@@ -302,6 +161,10 @@ def after_set_rules(world: World, multiworld: MultiWorld, player: int):
     # OR
     # location.access_rule = lambda state: old_rule(state) or Example_Rule(state)
 
+# create_items makes the copies of each item in bulk, calling before_create_item once per item name and after_create_item on every copy.
+# Set this to True if before_create_item needs to be called for every single copy too.
+create_item_hooks_for_each_copy = False
+
 # The item name to create is provided before the item is created, in case you want to make changes to it
 def before_create_item(item_name: str, world: World, multiworld: MultiWorld, player: int) -> str:
     return item_name
@@ -0,0 +1,108 @@
+"""Time a full offline generation of many Identity V players, stage by stage, and measure its peak memory.
+Run it from the Archipelago folder: python -m worlds.<this apworld>.test.benchmark.generation_benchmark
+\nThe results are also written as JSON (see --output) so runs can be compared to find regressions."""
+import argparse
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from argparse import Namespace
+
+from BaseClasses import MultiWorld, CollectionState
+from Fill import distribute_items_restrictive
+from worlds.AutoWorld import AutoWorldRegister, call_all, call_stage
+
+from ...Game import game_name
+from ...GameInfo import all_survivors_names
+
+stages = ("generate_early", "create_regions", "create_items", "set_rules", "generate_basic", "pre_fill", "fill")
+
+presets: dict[str, dict] = {
+    "default": {},
+    "all_survivors": {"shuffled_survivor_amount": len(all_survivors_names), "starting_survivor_amount": 5},
+    "all_survivors_no_borrowed_time": {"shuffled_survivor_amount": len(all_survivors_names), "shuffle_borrowed_time": False},
+    "class_challenges_with_item": {"enable_class_challenges": "enabled_with_item", "starting_persona_method": "percentage_total"},
+}
+
+def get_player_options(preset: str, player: int) -> dict:
+    """The 'mixed' preset gives each player the next preset in turn"""
+    if preset == "mixed":
+        names = list(presets)
+        return presets[names[(player - 1) % len(names)]]
+    return presets[preset]
+
+def setup_multiworld(player_count: int, preset: str, seed: int) -> MultiWorld:
+    world_type = AutoWorldRegister.world_types[game_name]
+    multiworld = MultiWorld(player_count)
+    multiworld.game = {player: game_name for player in multiworld.player_ids}
+    multiworld.player_name = {player: f"Player{player}" for player in multiworld.player_ids}
+    multiworld.set_seed(seed)
+
+    args = Namespace()
+    for name, option in world_type.options_dataclass.type_hints.items():
+        setattr(args, name, {player: option.from_any(get_player_options(preset, player).get(name, option.default))
+                             for player in multiworld.player_ids})
+    multiworld.set_options(args)
+    multiworld.state = CollectionState(multiworld)
+    return multiworld
+
+def run_stage(multiworld: MultiWorld, stage: str):
+    if stage == "fill":
+        distribute_items_restrictive(multiworld)
+    else:
+        call_all(multiworld, stage)
+
+def generate(player_count: int, preset: str, seed: int, trace_memory: bool) -> dict:
+    """Run every stage once, returns the time of each stage in seconds and the peak memory in bytes if traced"""
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    multiworld = setup_multiworld(player_count, preset, seed)
+    call_stage(multiworld, "assert_generate")
+    timings = {"setup": time.perf_counter() - start}
+    for stage in stages:
+        start = time.perf_counter()
+        run_stage(multiworld, stage)
+        timings[stage] = time.perf_counter() - start
+
+    result = {"timings": timings, "total": sum(timings.values())}
+    if trace_memory:
+        result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+def run(player_counts=(1, 10, 50, 200), preset_names=(*presets, "mixed"),
+        seed: int = 1, trace_memory: bool = True, output: str = "generation_benchmark.json") -> list[dict]:
+    results = []
+    print(f"{'preset':<32} {'players':>7} " + " ".join(f"{stage[:12]:>12}" for stage in ("setup", *stages)) + f" {'total (s)':>10} {'peak (MB)':>10}")
+    for preset in preset_names:
+        for player_count in player_counts:
+            # timings are taken without tracemalloc since it slows everything down, memory is measured in a second run
+            result = generate(player_count, preset, seed, False)
+            if trace_memory:
+                result["peak_memory"] = generate(player_count, preset, seed, True)["peak_memory"]
+            result.update(preset=preset, players=player_count, seed=seed)
+            results.append(result)
+
+            peak = f"{result['peak_memory'] / 2**20:>10.1f}" if trace_memory else f"{'-':>10}"
+            print(f"{preset:<32} {player_count:>7} " + " ".join(f"{result['timings'][stage]:>12.3f}" for stage in ("setup", *stages))
+                  + f" {result['total']:>10.3f} {peak}")
+
+    with open(output, "w") as file:
+        json.dump({"game": game_name, "python": platform.python_version(), "stages": ["setup", *stages], "results": results}, file, indent=2)
+    print(f"Results written to {output}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the generation of many Identity V players")
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--presets", nargs="+", default=[*presets, "mixed"], choices=[*presets, "mixed"])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="skip the second run that measures the peak memory")
+    parser.add_argument("--output", default="generation_benchmark.json")
+    args = parser.parse_args()
+    run(args.players, args.presets, args.seed, not args.no_memory, args.output)
@@ -0,0 +1,30 @@
+"""Compare grouping the locations by region in one pass with scanning every location for each region.
+Run it from the Archipelago folder: python -m worlds.<this apworld>.test.benchmark.regions_benchmark"""
+import timeit
+
+from ...Locations import location_table, group_locations_by_region
+
+
+def scan_each_region(regions: list[str], locations: list[dict]) -> dict[str, list[dict]]:
+    """How Regions.create_regions found the locations of each region before"""
+    return {region: [location for location in locations if location.get("region") == region] for region in regions}
+
+def bucket_by_region(regions: list[str], locations: list[dict]) -> dict[str, list[dict]]:
+    buckets = group_locations_by_region(locations)
+    return {region: buckets.get(region, []) for region in regions}
+
+def run(region_counts=(1, 10, 100), number: int = 20):
+    print(f"{len(location_table)} locations")
+    print(f"{'regions':>8} {'scan (ms)':>10} {'buckets (ms)':>13}")
+    for region_count in region_counts:
+        regions = [f"Region {i}" for i in range(region_count)]
+        locations = [{**location, "region": regions[i % region_count]} for i, location in enumerate(location_table)]
+        assert scan_each_region(regions, locations) == bucket_by_region(regions, locations)
+
+        scan = timeit.timeit(lambda: scan_each_region(regions, locations), number=number) / number * 1000
+        buckets = timeit.timeit(lambda: bucket_by_region(regions, locations), number=number) / number * 1000
+        print(f"{region_count:>8} {scan:>10.3f} {buckets:>13.3f}")
+
+
+if __name__ == "__main__":
+    run()
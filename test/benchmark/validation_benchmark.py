@@ -0,0 +1,59 @@
+"""Time the data validation that stage_assert_generate runs on every generation, check by check, on the current data.
+Run it from the Archipelago folder: python -m worlds.<this apworld>.test.benchmark.validation_benchmark
+\nThe results are also written as JSON (see --output) so runs can be compared to find regressions."""
+import argparse
+import json
+import platform
+import time
+
+from ...DataValidation import DataValidation, ValidationIndex, runGenerationDataValidation
+from ...Data import item_table, location_table, region_table
+from ...Game import game_name
+
+checks = (
+    "checkItemNamesInLocationRequires", "checkItemNamesInRegionRequires", "checkForInvalidRegionNames",
+    "checkRegionNamesInLocations", "checkItemsHasValidClassificationCount", "checkItemsThatShouldBeRequired",
+    "checkRegionsConnectingToOtherRegions", "checkForDuplicateItemNames", "checkForDuplicateLocationNames",
+    "checkStartingItemsForBadSyntax", "checkStartingItemsForValidItemsAndCategories", "checkPlacedItemsAndCategoriesForBadSyntax",
+    "checkPlacedItemsForValidItems", "checkPlacedItemCategoriesForValidItemCategories", "checkForNonStartingRegionsThatAreUnreachable",
+)
+
+class BenchmarkWorld:
+    game = game_name
+
+def time_call(function, repeat: int) -> float:
+    """The best time of repeat calls, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(repeat: int = 20, output: str = "validation_benchmark.json") -> dict:
+    # each check on its own builds its own index, so it's timed with one already built like during a generation
+    DataValidation.index = ValidationIndex(item_table, location_table, region_table)
+    try:
+        timings = {check: time_call(getattr(DataValidation, check), repeat) for check in checks}
+    finally:
+        DataValidation.index = None
+    timings["index"] = time_call(lambda: ValidationIndex(item_table, location_table, region_table), repeat)
+    timings["runGenerationDataValidation"] = time_call(lambda: runGenerationDataValidation(BenchmarkWorld), repeat)
+
+    for name, seconds in timings.items():
+        print(f"{name:<48} {seconds * 1000:>10.3f} ms")
+
+    result = {"game": game_name, "python": platform.python_version(), "items": len(item_table), "locations": len(location_table),
+              "regions": len(region_table), "repeat": repeat, "timings": timings}
+    with open(output, "w") as file:
+        json.dump(result, file, indent=2)
+    print(f"Results written to {output}")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the generation data validation of Identity V")
+    parser.add_argument("--repeat", type=int, default=20, help="the best of this many runs is kept")
+    parser.add_argument("--output", default="validation_benchmark.json")
+    args = parser.parse_args()
+    run(args.repeat, args.output)
@@ -0,0 +1,62 @@
+import json
+import os
+import tempfile
+import zipfile
+
+from test.TestBase import WorldTestBase
+from ..Game import game_name
+from ..Locations import victory_names, location_name_to_id, location_name_to_location, get_location_data, lazy_location_lookups
+
+
+class GoalTest(WorldTestBase):
+    game = game_name
+
+    def test_only_the_chosen_counted_goal_is_created(self):
+        goal_name = victory_names[self.world.options.goal.value]
+        goal_location = self.multiworld.get_location(goal_name, self.player)
+        self.assertIsNone(goal_location.address)
+        created = {location.name for location in self.multiworld.get_locations(self.player)}
+        self.assertEqual([name for name in victory_names if name in created], [goal_name])
+
+    def test_counted_goal_names(self):
+        self.assertEqual(victory_names.index("Gather 1 Deduction Point"), 1)
+        self.assertEqual(victory_names[victory_names.index("Gather 37 Deduction Points")], "Gather 37 Deduction Points")
+        self.assertNotIn("Gather 37 Deduction Points", location_name_to_id)
+
+    def test_only_available_deduction_points_are_created(self):
+        created = [item for item in self.multiworld.itempool if item.player == self.player and item.name == "Deduction Point"]
+        self.assertEqual(len(created), min(500, self.world.roster_plan.available_mcguffins))
+
+    def test_counted_goal_from_its_value(self):
+        goal_option = type(self.world.options.goal)
+        value = victory_names.index("Gather 37 Deduction Points")
+        self.assertEqual(goal_option.from_any(value).value, value)
+        self.assertEqual(goal_option.from_any(str(value)).value, value)
+        self.assertEqual(goal_option.from_any(value).current_key, "gather 37 deduction points")
+        with self.assertRaises(KeyError):
+            goal_option.from_any(len(victory_names))
+
+    def test_counted_goal_location_is_not_added_to_the_shared_table(self):
+        goal_name = victory_names[self.world.options.goal.value]
+        if goal_name in location_name_to_id:
+            return
+        self.assertNotIn(goal_name, location_name_to_location)
+        self.assertEqual(get_location_data(goal_name), get_location_data(goal_name))
+        self.assertIn(goal_name, [location["name"] for location in self.world.location_table])
+
+    def test_counted_goal_is_not_added_to_the_shared_region_index(self):
+        goal_name = victory_names[self.world.options.goal.value]
+        if goal_name in location_name_to_id:
+            return
+        locations_by_region = lazy_location_lookups.get("region_name_to_locations")
+        self.assertNotIn(goal_name, [location["name"] for locations in locations_by_region.values() for location in locations])
+        self.assertEqual(self.multiworld.get_location(goal_name, self.player).parent_region.name, get_location_data(goal_name)["region"])
+
+    def test_counted_goal_is_written_to_the_apmanual(self):
+        goal_name = victory_names[self.world.options.goal.value]
+        with tempfile.TemporaryDirectory() as output_directory:
+            self.world.generate_output(output_directory)
+            [filename] = os.listdir(output_directory)
+            with zipfile.ZipFile(os.path.join(output_directory, filename)) as apmanual:
+                locations = json.loads(apmanual.read("locations.json"))
+        self.assertEqual(locations[goal_name]["category"], list(get_location_data(goal_name).get("category", [])))
@@ -0,0 +1,114 @@
+import sys
+
+from BaseClasses import ItemClassification
+from test.TestBase import WorldTestBase
+from ..Game import game_name
+from ..Helpers import is_item_enabled, is_location_enabled, refresh_enablement_table, invalidate_enablement_table, ItemPool, \
+    remove_specific_item, shared_enablement_tables, LazyLookups, intern_definition
+
+
+class HelpersTest(WorldTestBase):
+    game = game_name
+
+    def test_enablement_table_matches_uncached_checks(self):
+        refresh_enablement_table(self.world)
+        cached = ([is_item_enabled(self.multiworld, self.player, i) for i in self.world.item_table],
+                  [is_location_enabled(self.multiworld, self.player, l) for l in self.world.location_table])
+        invalidate_enablement_table(self.world)
+        uncached = ([is_item_enabled(self.multiworld, self.player, i) for i in self.world.item_table],
+                    [is_location_enabled(self.multiworld, self.player, l) for l in self.world.location_table])
+        self.assertEqual(cached, uncached)
+
+    def test_enablement_table_is_rebuilt_when_an_option_changes(self):
+        refresh_enablement_table(self.world)
+        borrowed_time_items = set(self.world.item_name_groups["CATEGORY_BT"])
+        was_enabled = not self.world.enablement_table.items.isdisjoint(borrowed_time_items)
+        self.world.options.shuffle_borrowed_time.value = int(not was_enabled)
+        refresh_enablement_table(self.world)
+        table = self.world.enablement_table
+        self.assertEqual("CATEGORY_BT" in table.categories, not was_enabled)
+        self.assertEqual(table.items.isdisjoint(borrowed_time_items), was_enabled)
+        invalidate_enablement_table(self.world)
+        self.assertEqual(table.items, frozenset(item["name"] for item in self.world.item_table if is_item_enabled(self.multiworld, self.player, item)))
+
+    def test_local_items_do_not_rebuild_the_enablement_table(self):
+        refresh_enablement_table(self.world)
+        table = self.world.enablement_table
+        self.world.options.local_items.value.add("Deduction Point")
+        refresh_enablement_table(self.world)
+        self.assertIs(self.world.enablement_table, table)
+
+    def test_enablement_table_is_shared_by_cache_key(self):
+        refresh_enablement_table(self.world)
+        table = self.world.enablement_table
+        self.assertIsNotNone(table.cache_key)
+        self.assertIs(shared_enablement_tables[table.cache_key], table)
+        invalidate_enablement_table(self.world)
+        self.assertNotIn(table.cache_key, shared_enablement_tables)
+
+    def test_shared_item_config_is_not_the_item_definitions(self):
+        table = self.world.enablement_table
+        self.assertIsNotNone(table.item_config)
+        for name, configs in table.item_config.items():
+            if isinstance(configs, dict):
+                self.assertIsNot(configs, self.world.item_name_to_item[name]["classification_count"])
+
+    def test_item_pool_removes_the_specific_item(self):
+        items = [self.world.create_item("Deduction Point") for _ in range(3)]
+        pool = ItemPool(items)
+        remove_specific_item(pool, items[1])
+        self.assertEqual(list(pool), [items[0], items[2]])
+        self.assertIs(pool.get_first_by_name("Deduction Point"), items[0])
+        self.assertEqual(pool.count_name("Deduction Point"), 2)
+        with self.assertRaises(ValueError):
+            remove_specific_item(pool, items[1])
+
+    def test_item_pool_finds_items_by_names_in_pool_order(self):
+        names = ["Deduction Point", self.world.get_filler_item_name(), "Deduction Point"]
+        items = [self.world.create_item(name) for name in names]
+        pool = ItemPool(items)
+        self.assertEqual([id(i) for i in pool.get_items_with_names(set(names))], [id(i) for i in items])
+        pool.remove_items([items[0], items[1]])
+        self.assertEqual([id(i) for i in pool], [id(items[2])])
+        with self.assertRaisesRegex(ValueError, "more than once"):
+            pool.remove_items([items[2], items[2]])
+
+    def test_item_pool_keeps_its_index_when_removing_specific_items(self):
+        names = ["Deduction Point", self.world.get_filler_item_name()] * 3
+        items = [self.world.create_item(name) for name in names]
+        pool = ItemPool(items)
+        index = pool._get_name_index()
+        for item in [items[2], items[5], items[0]]:
+            pool.remove_specific(item)
+            self.assertEqual([id(i) for i in pool.get_items_with_names(set(names))], [id(i) for i in pool])
+        self.assertIs(pool._get_name_index(), index)
+        self.assertEqual([id(i) for i in pool], [id(items[1]), id(items[3]), id(items[4])])
+
+    def test_item_pool_works_like_a_list(self):
+        items = [self.world.create_item(name) for name in ["Deduction Point", self.world.get_filler_item_name(), "Deduction Point"]]
+        pool = ItemPool(items)
+        self.assertIsInstance(pool.copy(), ItemPool)
+        self.assertEqual(len(items[:1] + pool), 4)
+        self.world.random.shuffle(pool)
+        pool[0] = items[1]
+        self.assertEqual(pool.count_name("Deduction Point"), [item.name for item in pool].count("Deduction Point"))
+        # the classifications are read from the items, so hooks can change them
+        items[0].classification = ItemClassification.trap
+        self.assertEqual(pool.get_items_with_classification(ItemClassification.trap), [item for item in pool if item is items[0]])
+
+    def test_lazy_lookups_are_built_once_when_used(self):
+        calls = []
+        lookups = LazyLookups("module", {"names": lambda: calls.append(1) or {"a"}})
+        self.assertEqual(calls, [])
+        self.assertIs(lookups.getattr("names"), lookups.get("names"))
+        self.assertEqual(calls, [1])
+        with self.assertRaises(AttributeError):
+            lookups.getattr("missing")
+
+    def test_definitions_have_interned_names_and_categories(self):
+        definition = intern_definition({"name": "".join(["It", "em"]), "category": ["".join(["A", "B"])], "sort-key": "row-01-01"})
+        self.assertEqual(definition, {"name": "Item", "category": ["AB"], "sort-key": "row-01-01"})
+        self.assertIs(definition["name"], sys.intern("Item"))
+        self.assertIs(definition["category"][0], sys.intern("AB"))
+        self.assertEqual(intern_definition({"name": "Other", "category": "A"})["category"], ["A"])
+        self.assertTrue(all(type(item) is dict and type(item.get("category", [])) is list for item in self.world.item_name_to_item.values()))
@@ -1,6 +1,18 @@
+from BaseClasses import ItemClassification
 from test.TestBase import WorldTestBase
 from ..Game import game_name
 
 
 class ManualTest(WorldTestBase):
     game = game_name
+
+    def test_create_items_bulk_matches_create_item(self):
+        single = self.world.create_item("Deduction Point")
+        bulk = self.world.create_items_bulk("Deduction Point", 3)
+        self.assertEqual(len(bulk), 3)
+        for item in bulk:
+            self.assertEqual((item.name, item.classification, item.code), (single.name, single.classification, single.code))
+        self.assertEqual(len({id(item) for item in bulk}), 3)
+
+        useful = self.world.create_items_bulk("Deduction Point", 2, ItemClassification.useful)
+        self.assertTrue(all(item.classification == ItemClassification.useful for item in useful))
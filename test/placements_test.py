@@ -0,0 +1,57 @@
+import unittest
+
+from ..Items import item_name_to_item, item_name_groups, get_item_names_in_categories
+from ..Locations import build_item_placements, location_table
+
+
+def get_placements_like_generate_basic(location: dict) -> tuple[set[str], list[str]]:
+    """The forbidden and eligible item names of a location, the way generate_basic found them for each location before they were resolved once"""
+    forbidden_for_player = []
+    if "dont_place_item" in location or "dont_place_item_category" in location:
+        if location.get("dont_place_item"):
+            forbidden_for_player.extend([i["name"] for i in item_name_to_item.values() if i["name"] in location["dont_place_item"]])
+        if location.get("dont_place_item_category"):
+            forbidden_for_player.extend(get_item_names_in_categories(location["dont_place_item_category"]))
+
+    eligible_item_names = []
+    if "place_item" in location or "place_item_category" in location:
+        forbidden_item_names = []
+        if location.get("place_item"):
+            eligible_item_names += location["place_item"]
+        if location.get("place_item_category"):
+            eligible_item_names += get_item_names_in_categories(location["place_item_category"])
+        if location.get("dont_place_item"):
+            forbidden_item_names += location["dont_place_item"]
+        if location.get("dont_place_item_category"):
+            forbidden_item_names += get_item_names_in_categories(location["dont_place_item_category"])
+        if forbidden_item_names:
+            eligible_item_names = [name for name in eligible_item_names if name not in forbidden_item_names]
+
+    return set(forbidden_for_player), eligible_item_names
+
+
+class PlacementsTest(unittest.TestCase):
+    def test_placements_match_the_per_location_handling(self):
+        persona = "Acrobat - Borrowed Time Persona Unlock"
+        helper = "Acrobat - HELPER for Borrowed Time"
+        locations = [*location_table,
+            {"name": "place item", "place_item": [persona, "Deduction Point"]},
+            {"name": "place category", "place_item_category": ["Acrobat Items"]},
+            {"name": "place and forbid", "place_item_category": ["Acrobat Items"], "dont_place_item": [persona, "Not An Item"]},
+            {"name": "place and forbid category", "place_item": ["Deduction Point", helper], "dont_place_item_category": ["Filler"]},
+            {"name": "forbid only", "dont_place_item": ["Not An Item", "Deduction Point"], "dont_place_item_category": ["Acrobat Items"]},
+            {"name": "forbid non item", "dont_place_item": ["Not An Item"]},
+            {"name": "all four", "place_item": ["Deduction Point", "Not An Item"], "place_item_category": ["Persona Unlock"],
+             "dont_place_item": ["Deduction Point", "Not An Item"], "dont_place_item_category": ["CATEGORY_BT"]},
+            {"name": "empty", "place_item": [], "dont_place_item_category": []},
+        ]
+        self.assertIn(helper, item_name_groups["Filler"])
+        forbidden, eligible = build_item_placements(locations)
+
+        for location in locations:
+            expected_forbidden, expected_eligible = get_placements_like_generate_basic(location)
+            self.assertEqual(forbidden.get(location["name"], set()), expected_forbidden, location["name"])
+            if "place_item" in location or "place_item_category" in location:
+                self.assertEqual(eligible[location["name"]], set(expected_eligible), location["name"])
+            else:
+                self.assertNotIn(location["name"], eligible)
@@ -0,0 +1,24 @@
+import unittest
+from random import Random
+
+from ..hooks.Roster import plan_roster
+
+options = {
+    "shuffled_survivor_list": set(), "shuffled_survivor_amount": 12, "starting_survivor_amount": 3,
+    "starting_persona_method": 1, "starting_persona_percentage": 50, "shuffle_borrowed_time": 1,
+    "enable_class_challenges": 2, "enable_unique_challenges": 1,
+    "filler_item_percentage": 10, "deduction_point_percentage": 60,
+}
+
+
+class RosterTest(unittest.TestCase):
+    def test_same_seed_same_roster(self):
+        self.assertEqual(plan_roster(options, Random(1234)), plan_roster(options, Random(1234)))
+
+    def test_roster_amounts(self):
+        plan = plan_roster(options, Random(1))
+        self.assertEqual(len(plan.included_survivors), 12)
+        self.assertEqual(plan.starting_survivors, plan.included_survivors[:3])
+        self.assertEqual(len(plan.starting_personas), 6) # half of 3 survivors * 4 personas
+        self.assertEqual(plan.disabled_challenge_items, {"unique"})
+        self.assertGreaterEqual(plan.goal_mcguffins, 1)
@@ -0,0 +1,109 @@
+from BaseClasses import CollectionState
+from test.TestBase import WorldTestBase
+from worlds.generic.Rules import add_rule
+from ..Game import game_name
+from ..Rules import compile_requires, Requirement, SharedRequirement, ItemRequirement, ConstantRequirement, AndRequirement
+from ..Regions import regionMap
+from ..Helpers import format_state_prog_items_key, ProgItemsCat
+from ..Reachability import RequirementDependencyIndex
+
+
+class RulesTest(WorldTestBase):
+    game = game_name
+
+    def collect_by_name_in_state(self, state: CollectionState, name: str, count: int = 1):
+        for _ in range(count):
+            state.collect(self.world.create_item(name), True)
+
+    def test_compiled_requires_keep_left_to_right_order(self):
+        # AND and OR have the same precedence, so this is (A or B) and C
+        rule = compile_requires(self.world, {"name": "test", "requires": "|Acrobat - Character Unlock| or |Archer - Character Unlock| and |Deduction Point:2|"})
+        state = CollectionState(self.multiworld)
+        self.collect_by_name_in_state(state, "Acrobat - Character Unlock")
+        self.assertFalse(rule(state))
+        self.collect_by_name_in_state(state, "Deduction Point", 2)
+        self.assertTrue(rule(state))
+
+    def test_compiled_requires_categories(self):
+        rule = compile_requires(self.world, {"name": "test", "requires": "|@Acrobat Persona:2| and !|Archer - Character Unlock|"})
+        state = CollectionState(self.multiworld)
+        self.collect_by_name_in_state(state, "Acrobat - Tide Turner Persona Unlock")
+        self.assertFalse(rule(state))
+        self.collect_by_name_in_state(state, "Acrobat - Flywheel Effect Persona Unlock")
+        self.assertTrue(rule(state))
+        self.collect_by_name_in_state(state, "Archer - Character Unlock")
+        self.assertFalse(rule(state))
+
+    def test_category_counts_in_state(self):
+        key = format_state_prog_items_key(ProgItemsCat.CATEGORY, "Acrobat Persona")
+        item = self.world.create_item("Acrobat - Tide Turner Persona Unlock")
+        state = CollectionState(self.multiworld)
+        state.collect(item, True)
+        self.assertEqual(state.prog_items[self.player][key], 1)
+        state.remove(item)
+        self.assertEqual(state.prog_items[self.player][key], 0)
+
+    def test_compiled_requires_dict(self):
+        rule = compile_requires(self.world, {"name": "test", "requires": ["Deduction Point:2", {"or": ["Acrobat - Character Unlock"]}]})
+        state = CollectionState(self.multiworld)
+        self.assertFalse(rule(state))
+        self.collect_by_name_in_state(state, "Deduction Point", 2)
+        self.assertTrue(rule(state))
+
+        state = CollectionState(self.multiworld)
+        self.collect_by_name_in_state(state, "Acrobat - Character Unlock")
+        self.assertTrue(rule(state))
+
+    def test_location_rules_evaluator_matches_access_rules(self):
+        evaluator = self.world.get_location_rules_evaluator()
+        state = CollectionState(self.multiworld)
+        for name in ["Acrobat - Character Unlock", "Acrobat - Tide Turner Persona Unlock", "Deduction Point"]:
+            self.collect_by_name_in_state(state, name)
+            self.assertEqual(evaluator.access_rules(state), [bool(location.access_rule(state)) for location in evaluator.locations])
+            self.assertEqual(evaluator.reachable(state), [location.can_reach(state) for location in evaluator.locations])
+
+    def test_reachability_tracker_follows_collect_and_remove(self):
+        state = CollectionState(self.multiworld)
+        tracker = self.world.track_reachability(state)
+        locations = self.multiworld.get_locations(self.player)
+        items = [item for item in self.multiworld.itempool if item.player == self.player and item.advancement][:20]
+        for item in items:
+            state.collect(item, True)
+            self.assertEqual(tracker.get_reachable_locations(), {l.name for l in locations if l.can_reach(state)})
+        for item in items:
+            state.remove(item)
+            self.assertEqual(tracker.get_reachable_locations(), {l.name for l in locations if l.can_reach(state)})
+        tracker.close()
+        self.assertNotIn(tracker, self.world.reachability_trackers)
+
+    def test_entrance_rule_changed_by_a_hook_is_always_checked(self):
+        entrance = self.multiworld.get_entrance("MenuToManual", self.player)
+        self.assertNotIn(entrance.name, RequirementDependencyIndex(self.world).always_entrances)
+        add_rule(entrance, lambda state: True)
+        self.assertIn(entrance.name, RequirementDependencyIndex(self.world).always_entrances)
+
+    def test_requirement_without_call_cannot_be_made(self):
+        class IncompleteRequirement(Requirement):
+            __slots__ = ()
+        with self.assertRaises(TypeError):
+            IncompleteRequirement()
+
+    def test_set_rules_does_not_modify_region_map(self):
+        for region in regionMap.values():
+            self.assertNotIn("is_region", region)
+
+    def test_shared_requirement_is_refreshed_after_collect(self):
+        rule = SharedRequirement(self.world, ItemRequirement(self.world, "Acrobat - Character Unlock", 1))
+        state = CollectionState(self.multiworld)
+        self.assertFalse(rule(state))
+        self.collect_by_name_in_state(state, "Acrobat - Character Unlock")
+        self.assertTrue(rule(state))
+
+    def test_empty_requires_are_constant(self):
+        rule = compile_requires(self.world, {"name": "test", "requires": []})
+        self.assertIsInstance(rule, ConstantRequirement)
+        self.assertTrue(rule(CollectionState(self.multiworld)))
+        # the Manual region is always accessible, so the location rules are only their own requires
+        rule = self.world.location_requirements["Draw as Acrobat"]
+        self.assertIsInstance(rule, AndRequirement)
+        self.assertFalse(any(isinstance(child, (SharedRequirement, ConstantRequirement)) for child in rule.requirements))
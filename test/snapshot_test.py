@@ -0,0 +1,26 @@
+import pickle
+import unittest
+
+from ..Data import item_table, location_table
+from ..Items import _item_lookups
+from ..Locations import _location_lookups, get_victory_names, victory_names
+from ..Snapshot import get_snapshot_key, get_snapshot_sources
+
+
+class SnapshotTest(unittest.TestCase):
+    def test_snapshot_key_is_stable(self):
+        self.assertEqual(get_snapshot_key(), get_snapshot_key())
+
+    def test_every_hook_is_a_snapshot_source(self):
+        sources = get_snapshot_sources()
+        for source in ("Helpers.py", "hooks/Data.py", "hooks/Helpers.py", "hooks/Roster.py", "hooks/World.py"):
+            self.assertIn(source, sources)
+
+    def test_lookups_survive_the_snapshot(self):
+        tables, items, locations = pickle.loads(pickle.dumps((item_table, _item_lookups, _location_lookups), protocol=pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(items, _item_lookups)
+        # the lookups still point at the same definitions as the tables
+        self.assertIs(items["item_name_to_item"][tables[0]["name"]], tables[0])
+        self.assertEqual(list(get_victory_names(locations["victory_entries"])), list(victory_names))
+        self.assertEqual(locations["location_id_to_name"], _location_lookups["location_id_to_name"])
+        self.assertEqual(len(location_table), len(locations["location_name_to_location"]))
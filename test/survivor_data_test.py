@@ -0,0 +1,27 @@
+import unittest
+
+from ..GameInfo import all_survivors_names, survivor_classes, class_challenges
+from ..Items import item_name_to_id, item_name_groups
+from ..Locations import location_name_to_id, location_name_groups
+from ..hooks.Data import get_survivor_item_id, survivor_item_count
+
+
+class SurvivorDataTest(unittest.TestCase):
+    def test_every_survivor_has_its_items_and_locations(self):
+        for survivor in all_survivors_names:
+            self.assertEqual(len(item_name_groups[f"{survivor} Items"]), 11)
+            self.assertEqual(len(location_name_groups[f"{survivor} Locations"]), 15)
+            self.assertIn(f"Class Challenge - {class_challenges[survivor_classes[survivor]]} as {survivor}", location_name_to_id)
+
+    def test_ids_follow_the_roster_order(self):
+        # the ids used to come from the order of items.json and locations.json, they must not change
+        self.assertEqual(item_name_to_id["Acrobat - Character Unlock"] + 7, item_name_to_id["Aeroplanist - Character Unlock"])
+        self.assertEqual(location_name_to_id["Escape as Acrobat"] + 15, location_name_to_id["Escape as Aeroplanist"])
+        self.assertLess(item_name_to_id[f"{all_survivors_names[-1]} - Unique Challenge Unlock"], item_name_to_id["Acrobat - HELPER for Borrowed Time"])
+
+    def test_new_survivors_come_after_every_id(self):
+        first_id = item_name_to_id["Deduction Point"]
+        last_row = len(all_survivors_names)
+        last_id = max(item_name_to_id[name] for survivor in all_survivors_names for name in item_name_groups[f"{survivor} Items"])
+        new_ids = [get_survivor_item_id(first_id, last_row + 1, column) for column in range(1, survivor_item_count + 1)]
+        self.assertEqual(new_ids, list(range(last_id + 1, last_id + 1 + survivor_item_count)))
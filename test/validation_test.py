@@ -0,0 +1,27 @@
+import unittest
+
+from ..DataValidation import DataValidation, ValidationError, tokenize_requires
+
+
+class ValidationTest(unittest.TestCase):
+    def setUp(self):
+        self.tables = DataValidation.item_table, DataValidation.location_table, DataValidation.region_table
+        DataValidation.item_table = [{"name": "Key", "progression": True}, {"name": "Map"}]
+        DataValidation.region_table = {}
+
+    def tearDown(self):
+        DataValidation.item_table, DataValidation.location_table, DataValidation.region_table = self.tables
+
+    def test_tokenize_requires(self):
+        self.assertEqual(tokenize_requires("|Key:2| and (|@Maps| or |Map|)"), [(False, "Key"), (True, "Maps"), (False, "Map")])
+        self.assertEqual(tokenize_requires(["Key:2", {"or": ["Map", "Key"]}]), [(False, "Key"), (False, "Map"), (False, "Key")])
+
+    def test_misspelled_required_item(self):
+        DataValidation.location_table = [{"name": "Chest", "requires": "|Key| and |Kye:2|"}]
+        with self.assertRaisesRegex(ValidationError, "Item Kye is required by location Chest but is misspelled or does not exist."):
+            DataValidation.checkItemNamesInLocationRequires()
+
+    def test_required_item_not_marked_as_progression(self):
+        DataValidation.location_table = [{"name": "Chest", "requires": "|Key|"}, {"name": "Door", "requires": "|Key| and |Map|"}]
+        with self.assertRaisesRegex(ValidationError, "Item Map is required by location Door, but the item is not marked as progression."):
+            DataValidation.checkItemsThatShouldBeRequired()